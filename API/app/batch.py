@@ -0,0 +1,61 @@
+from typing import Iterable, List
+
+from fastapi import HTTPException
+
+from .cache import catalogue_cache
+from .config import settings
+from .models.arcane import Arcane
+from .models.mod import Mod
+from .models.warframe import Warframe
+from .models.weapon import Weapon
+
+# entity -> (table, response model, key column)
+CATALOGUE_TABLES = {
+    "warframes": ("[wf_base].[Warframes]", Warframe, "WarframeId"),
+    "weapons": ("[wf_base].[Weapons]", Weapon, "WeaponId"),
+    "mods": ("[wf_base].[Mods]", Mod, "ModId"),
+    "arcanes": ("[wf_base].[Arcanes]", Arcane, "ArcaneId"),
+}
+
+
+def parse_ids(ids: str) -> List[int]:
+    """?ids=1,2,3 as a list of ints; 400 if malformed or longer than BATCH_MAX_IDS."""
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    check_batch_size(parsed)
+    return parsed
+
+
+def check_batch_size(ids: List[int]):
+    if len(ids) > settings.BATCH_MAX_IDS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.BATCH_MAX_IDS} ids per request")
+
+
+def in_condition(column: str, ids: Iterable[int], params: dict, prefix: str = "id") -> str:
+    """
+    "<column> IN (:id_0, :id_1, ...)" with one bound parameter per id, in
+    sorted order so the same set of ids always produces the same query
+    (and catalogue cache entry).
+    """
+    names = []
+    for index, value in enumerate(sorted(set(ids))):
+        params[f"{prefix}_{index}"] = value
+        names.append(f":{prefix}_{index}")
+    return f"{column} IN ({', '.join(names) or 'NULL'})"
+
+
+def fetch_by_ids(db, entity: str, ids: Iterable[int]):
+    """
+    Catalogue rows by primary key, one query per entity, through the
+    catalogue cache. Like the detail routes, soft-deleted rows are
+    included, so builds that reference them still resolve.
+    """
+    table, model, key = CATALOGUE_TABLES[entity]
+    ids = set(ids)
+    if not ids:
+        return []
+    params: dict = {}
+    query = f"SELECT {model.columns()} FROM {table} WHERE " + in_condition(key, ids, params) + f" ORDER BY {key}"
+    return catalogue_cache.fetchall(db, query, params)
@@ -0,0 +1,134 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import text
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+VERSION_QUERY = text("SELECT Version FROM [wf_base].[DataVersion] WHERE Id = 1")
+
+
+def read_data_version(db):
+    """The catalogue version load.py bumps, or None if migration 004 isn't applied."""
+    try:
+        return db.execute(VERSION_QUERY).scalar()
+    except Exception:
+        db.rollback()
+        return None
+
+
+class CatalogueCache:
+    """
+    Read-through cache for the wf_base catalogue queries.
+
+    Entries are keyed on the generated SQL plus its bound parameters, so
+    requests that normalise to the same query (sort=Armor vs sort=armor,
+    unknown sort fields, parameter order) share an entry. Entries expire
+    after ttl seconds and the least recently used ones are evicted past
+    max_entries. Every version_poll seconds the next lookup reads
+    [wf_base].[DataVersion]; when the ETL has bumped it, the cache is cleared.
+    """
+
+    def __init__(self, max_entries=1024, ttl=300.0, version_poll=5.0, enabled=True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version_poll = version_poll
+        self.enabled = enabled
+        self.data_version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version_checked = float("-inf")
+        self._version_missing = False
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def version_poll_due(self):
+        return time.monotonic() - self._version_checked >= self.version_poll
+
+    def check_version(self, db):
+        """Clears the cache if the ETL has published a new data version."""
+        now = time.monotonic()
+        if now - self._version_checked < self.version_poll:
+            return
+        self._version_checked = now
+        version = read_data_version(db)
+        if version is None:
+            if not self._version_missing:
+                logger.warning("No [wf_base].[DataVersion] table; catalogue cache relies on its TTL.")
+                self._version_missing = True
+            return
+        with self._lock:
+            if version != self.data_version:
+                if self.data_version is not None:
+                    self.invalidations += 1
+                    logger.info(f"Data version {self.data_version} -> {version}; catalogue cache cleared.")
+                self._entries.clear()
+                self.data_version = version
+
+    def get_or_load(self, db, key, load):
+        if not self.enabled:
+            return load()
+
+        self.check_version(db)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            version = self.data_version
+
+        value = load()
+
+        with self._lock:
+            # Don't store a result read under a version that was replaced meanwhile.
+            if version == self.data_version:
+                self._entries[key] = (now + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def fetchall(self, db, query, params):
+        key = (query, tuple(sorted(params.items())))
+        return self.get_or_load(db, key, lambda: db.execute(text(query), params).fetchall())
+
+    def fetchone(self, db, query, params):
+        key = ("one", query, tuple(sorted(params.items())))
+        return self.get_or_load(db, key, lambda: db.execute(text(query), params).fetchone())
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "data_version": self.data_version,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+catalogue_cache = CatalogueCache(
+    max_entries=settings.CACHE_MAX_ENTRIES,
+    ttl=settings.CACHE_TTL_SECONDS,
+    version_poll=settings.CACHE_VERSION_POLL_SECONDS,
+    enabled=settings.CACHE_ENABLED,
+)
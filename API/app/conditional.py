@@ -0,0 +1,62 @@
+import hashlib
+from urllib.parse import urlencode
+
+from fastapi import Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+
+from .cache import catalogue_cache
+from .config import settings
+from .db import get_db, run_db
+
+
+def catalogue_etag(request: Request, version) -> str:
+    """
+    Weak ETag from the catalogue data version plus the path and query
+    string, with the parameters sorted so their order doesn't matter.
+    """
+    query = urlencode(sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{request.url.path}?{query}".encode()).hexdigest()[:16]
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, so W/ prefixes are ignored)."""
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in (tag.removeprefix("W/") for tag in tags)
+
+
+def cache_control() -> str:
+    return f"public, max-age={settings.HTTP_CACHE_MAX_AGE}"
+
+
+async def conditional_get(request: Request, db: Session = Depends(get_db)):
+    """
+    Router dependency for the wf_base catalogue routes. The ETag comes
+    from the data version the catalogue cache already tracks, so a
+    matching If-None-Match gets its 304 before the handler runs and without
+    a query. The only DB read is the shared version poll, at most every
+    CACHE_VERSION_POLL_SECONDS. Without a DataVersion table there is no
+    ETag and every request is served in full.
+    """
+    if not settings.HTTP_CACHE_ENABLED or request.method != "GET":
+        return
+    if catalogue_cache.version_poll_due():
+        await run_db(catalogue_cache.check_version, db)
+    version = catalogue_cache.data_version
+    if version is None:
+        return
+    etag = catalogue_etag(request, version)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        raise HTTPException(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control()})
+    request.state.etag = etag
+
+
+async def add_cache_headers(request: Request, call_next):
+    """HTTP middleware: puts the ETag conditional_get computed on successful responses."""
+    response = await call_next(request)
+    etag = getattr(request.state, "etag", None)
+    if etag is not None and response.status_code == 200:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = cache_control()
+    return response
@@ -6,6 +6,52 @@ class Settings(BaseSettings):
     DB_USER: str = ""
     DB_PASSWORD: str = ""
     DB_DRIVER: str = "ODBC Driver 17 for SQL Server"
+    # Full SQLAlchemy URL; overrides the DB_* settings (e.g. sqlite:// for benchmarks)
+    DATABASE_URL: str = ""
+
+    # Connection pool (ignored for SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    # Threads running blocking DB calls; 0 = DB_POOL_SIZE + DB_MAX_OVERFLOW
+    DB_EXECUTOR_WORKERS: int = 0
+
+    # Catalogue cache (app/cache.py)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_TTL_SECONDS: float = 300
+    CACHE_VERSION_POLL_SECONDS: float = 5
+
+    # Serve /warframes and /weapons from in-memory NumPy snapshots (app/snapshot.py)
+    SNAPSHOT_ENABLED: bool = False
+
+    # ETag / 304 and Cache-Control on the catalogue routes (app/conditional.py)
+    HTTP_CACHE_ENABLED: bool = True
+    HTTP_CACHE_MAX_AGE: int = 60
+
+    # Most ids one ?ids= filter or POST /batch entity list may carry
+    BATCH_MAX_IDS: int = 500
+
+    # Rows fetched and serialised per chunk by the /export endpoints
+    EXPORT_BATCH_SIZE: int = 1000
+    # Exports streamed at once, each holding a connection on its own thread; the rest wait their
+    # turn. Kept below DB_POOL_SIZE + DB_MAX_OVERFLOW so other requests can still check out.
+    EXPORT_MAX_CONCURRENCY: int = 4
+
+    # /search (app/search.py): lowest score returned; trigram similarity is 0..1, prefix matches add to it
+    SEARCH_MIN_SCORE: float = 0.3
+
+    # /builds/optimize beam search (app/optimizer.py): builds kept per round, time limit per request
+    OPTIMIZER_BEAM_WIDTH: int = 64
+    OPTIMIZER_TIME_BUDGET_MS: float = 250
+
+    # Prometheus metrics on /metrics (app/metrics.py). With SQL_DEBUG_HEADER_ENABLED, clients may
+    # send X-Debug-SQL: 1 for a Server-Timing header with the request's SQL time, and a log line per
+    # statement with its parameters; off by default, as any client could turn it on.
+    METRICS_ENABLED: bool = True
+    SQL_DEBUG_HEADER_ENABLED: bool = False
 
     class Config:
         env_file = ".env"
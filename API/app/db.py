@@ -1,29 +1,85 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import urllib.parse
 from .config import settings
 
-# Construct connection string
-params = urllib.parse.quote_plus(
-    "DRIVER={ODBC Driver 17 for SQL Server};"
-    "SERVER=THEBLACKPRIME;" 
-    "DATABASE=Warframe;"
-    "Trusted_Connection=yes;"
-    "TrustServerCertificate=yes;"
-)
+def odbc_connection_string() -> str:
+    """SQL Server ODBC string from the DB_* settings; SQL login if DB_USER is set, else Windows auth."""
+    parts = [
+        f"DRIVER={{{settings.DB_DRIVER}}}",
+        f"SERVER={settings.DB_SERVER}",
+        f"DATABASE={settings.DB_NAME}",
+    ]
+    if settings.DB_USER:
+        parts += [f"UID={settings.DB_USER}", f"PWD={settings.DB_PASSWORD}"]
+    else:
+        parts.append("Trusted_Connection=yes")
+    parts.append("TrustServerCertificate=yes")
+    return ";".join(parts) + ";"
 
-SQLALCHEMY_DATABASE_URL = f"mssql+pyodbc:///?odbc_connect={params}"
+SQLALCHEMY_DATABASE_URL = (
+    settings.DATABASE_URL
+    or f"mssql+pyodbc:///?odbc_connect={urllib.parse.quote_plus(odbc_connection_string())}"
+)
 
+def engine_options(url: str) -> dict:
+    """Pool settings from config; SQLite's own pools don't take them."""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# Blocking driver calls (pyodbc) run here rather than on the event loop.
+# Sized to the connection pool. /export streams, which hold a connection
+# between chunks, run on export_executor instead so they never take these threads.
+db_executor = ThreadPoolExecutor(
+    max_workers=settings.DB_EXECUTOR_WORKERS or settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+    thread_name_prefix="db",
+)
+
+# One thread per concurrent export (see app/routers/export.py), so a stream
+# holding a connection always has a thread for its next fetch.
+EXPORT_SLOTS = max(1, min(settings.EXPORT_MAX_CONCURRENCY, settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW - 1))
+export_executor = ThreadPoolExecutor(max_workers=EXPORT_SLOTS, thread_name_prefix="db-export")
+
+async def run_in(executor, fn, *args, **kwargs):
+    """
+    Awaits fn(*args, **kwargs) on executor, in a copy of the caller's
+    context so request-scoped context variables (app/metrics.py) carry over.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(executor, functools.partial(context.run, fn, *args, **kwargs))
+
+async def run_db(fn, *args, **kwargs):
+    """Awaits fn(*args, **kwargs) on the DB executor."""
+    return await run_in(db_executor, fn, *args, **kwargs)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+def page_clause(db) -> str:
+    """OFFSET/FETCH on SQL Server; LIMIT/OFFSET on the SQLite stand-in."""
+    if db.get_bind().dialect.name == "mssql":
+        return " OFFSET :skip ROWS FETCH NEXT :limit ROWS ONLY"
+    return " LIMIT :limit OFFSET :skip"
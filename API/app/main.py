@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 import logging
 
@@ -7,16 +8,45 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s',
 )
 
-app = FastAPI(title="Warframe API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app):
+    # Build the search index before serving; uses the app's get_db (or its override)
+    await run_db(search_index.warm, app.dependency_overrides.get(get_db, get_db))
+    yield
 
-from .routers import warframes, weapons, mods, arcanes, builds
+app = FastAPI(title="Warframe API", version="1.0.0", lifespan=lifespan)
+
+from .cache import catalogue_cache
+from .conditional import add_cache_headers
+from .db import engine, get_db, run_db
+from .metrics import metrics, metrics_response, record_request
+from .search import search_index
+from .routers import warframes, weapons, mods, arcanes, builds, export, batch, search
+
+app.middleware("http")(add_cache_headers)
+# Added last so it wraps everything else, cache headers included
+app.middleware("http")(record_request)
+metrics.instrument_engine(engine)
 
 app.include_router(warframes.router)
 app.include_router(weapons.router)
 app.include_router(mods.router)
 app.include_router(arcanes.router)
 app.include_router(builds.router)
+app.include_router(export.router)
+app.include_router(batch.router)
+app.include_router(search.router)
 
 @app.get("/")
 def read_root():
     return {"message": "Welcome to the Warframe API"}
+
+@app.get("/cache/stats")
+def read_cache_stats():
+    """Hit/miss counters for the catalogue cache."""
+    return catalogue_cache.stats()
+
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """Request, SQL, pool and cache metrics in the Prometheus text format."""
+    return metrics_response()
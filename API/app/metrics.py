@@ -0,0 +1,262 @@
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+from .cache import catalogue_cache
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+# Request header asking for this request's SQL timing (Server-Timing header, plus a log line per statement)
+DEBUG_SQL_HEADER = "X-Debug-SQL"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SQL_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Statements run for the current request, when it asked for DEBUG_SQL_HEADER.
+# run_db copies the context into the DB executor, so the worker threads see it.
+request_statements = contextvars.ContextVar("request_statements", default=None)
+
+
+def _labels(names, values) -> str:
+    if not names:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+class Counter:
+    def __init__(self, name, help, labels=()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} counter"
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_labels(self.labels, labels)} {value}"
+
+
+class Histogram:
+    """
+    Prometheus histogram: a count per bucket (value <= bound), plus the sum
+    and count of every observation, per label set.
+    """
+
+    def __init__(self, name, help, buckets, labels=()):
+        self.name, self.help, self.labels = name, help, labels
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                # one count per bucket, then +Inf, sum, count
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+            series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self):
+        yield f"# HELP {self.name} {self.help}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = sorted((labels, list(values)) for labels, values in self._series.items())
+        names = self.labels + ("le",)
+        for labels, values in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), values):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels(names, labels + (bound,))} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labels, labels)} {values[-2]:.6f}"
+            yield f"{self.name}_count{_labels(self.labels, labels)} {values[-1]}"
+
+
+class Metrics:
+    """
+    Request, SQL and pool metrics for /metrics, kept in memory per process.
+    Requests are labelled by route template (/mods/{mod_id}, not
+    /mods/17), so the series stay bounded; statements by their first
+    keyword. Pool gauges and the catalogue cache counters are read when
+    /metrics is scraped.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.requests = Counter("wf_http_requests_total", "HTTP requests by route and status.",
+                                ("method", "route", "status"))
+        self.request_seconds = Histogram("wf_http_request_duration_seconds",
+                                         "Time from request to last response byte.",
+                                         LATENCY_BUCKETS, ("method", "route"))
+        self.response_bytes = Histogram("wf_http_response_size_bytes", "Response body size.",
+                                        SIZE_BUCKETS, ("method", "route"))
+        self.statement_seconds = Histogram("wf_db_statement_duration_seconds",
+                                           "Time the driver spent executing each statement.",
+                                           SQL_BUCKETS, ("operation",))
+        self.statement_errors = Counter("wf_db_statement_errors_total", "Statements that raised.", ("operation",))
+        self.pool_wait_seconds = Histogram("wf_db_pool_wait_seconds", "Time waiting for a pooled connection.",
+                                           SQL_BUCKETS, ("engine",))
+        self.pool_timeouts = Counter("wf_db_pool_timeouts_total", "Checkouts that gave up after DB_POOL_TIMEOUT.",
+                                     ("engine",))
+        self._histograms = [self.request_seconds, self.response_bytes, self.statement_seconds, self.pool_wait_seconds]
+        self._counters = [self.requests, self.statement_errors, self.pool_timeouts]
+        self._engines = {}
+
+    def instrument_engine(self, engine, name="main"):
+        """Times every statement engine runs and reports its pool on /metrics."""
+        self._engines[name] = engine
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("wf_statement_start", []).append(time.perf_counter())
+
+        @event.listens_for(engine, "after_cursor_execute")
+        def after(conn, cursor, statement, parameters, context, executemany):
+            elapsed = time.perf_counter() - conn.info["wf_statement_start"].pop()
+            self._statement_done(statement, parameters, elapsed)
+
+        @event.listens_for(engine, "handle_error")
+        def error(context):
+            starts = context.connection.info.get("wf_statement_start") if context.connection else None
+            if starts:
+                starts.pop()
+            if self.enabled:
+                self.statement_errors.inc(operation(context.statement))
+
+        self._time_checkouts(engine.pool, name)
+
+    def _time_checkouts(self, pool, name):
+        # Queue-based pools block in _do_get when every connection is out
+        do_get = getattr(pool, "_do_get", None)
+        if do_get is None:
+            return
+
+        def timed_do_get():
+            start = time.perf_counter()
+            try:
+                return do_get()
+            except exc.TimeoutError:
+                if self.enabled:
+                    self.pool_timeouts.inc(name)
+                raise
+            finally:
+                if self.enabled:
+                    self.pool_wait_seconds.observe(time.perf_counter() - start, name)
+
+        pool._do_get = timed_do_get
+
+    def _statement_done(self, statement, parameters, elapsed):
+        if not self.enabled:
+            return
+        self.statement_seconds.observe(elapsed, operation(statement))
+        statements = request_statements.get()
+        if statements is not None:
+            statements.append(elapsed)
+            logger.info(f"SQL {elapsed * 1000:.2f} ms: {' '.join(statement.split())} {parameters!r}")
+
+    def pool_lines(self):
+        gauges = [
+            ("wf_db_pool_size", "Connections the pool keeps open.", lambda pool: pool.size()),
+            ("wf_db_pool_checked_out", "Connections in use.", lambda pool: pool.checkedout()),
+            ("wf_db_pool_checked_in", "Idle connections in the pool.", lambda pool: pool.checkedin()),
+            # QueuePool.overflow() counts up from -pool_size and passes 0 once the pool is full
+            ("wf_db_pool_overflow", "Connections open beyond the pool size.", lambda pool: max(pool.overflow(), 0)),
+        ]
+        for metric, help, read in gauges:
+            yield f"# HELP {metric} {help}"
+            yield f"# TYPE {metric} gauge"
+            for name, engine in sorted(self._engines.items()):
+                # Only queue pools have a size and overflow (not SQLite's in-memory pools)
+                if isinstance(engine.pool, QueuePool):
+                    yield f"{metric}{_labels(('engine',), (name,))} {read(engine.pool)}"
+
+    def cache_lines(self):
+        stats = catalogue_cache.stats()
+        for key in ("hits", "misses", "evictions", "invalidations"):
+            yield f"# HELP wf_catalogue_cache_{key}_total Catalogue cache {key} (app/cache.py)."
+            yield f"# TYPE wf_catalogue_cache_{key}_total counter"
+            yield f"wf_catalogue_cache_{key}_total {stats[key]}"
+        yield "# HELP wf_catalogue_cache_entries Entries in the catalogue cache."
+        yield "# TYPE wf_catalogue_cache_entries gauge"
+        yield f"wf_catalogue_cache_entries {stats['entries']}"
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._counters + self._histograms:
+            lines.extend(metric.render())
+        lines.extend(self.pool_lines())
+        lines.extend(self.cache_lines())
+        return "\n".join(lines) + "\n"
+
+
+def operation(statement) -> str:
+    """SELECT / INSERT / UPDATE / ... : the statement's first keyword."""
+    words = (statement or "").lstrip().split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+metrics = Metrics(enabled=settings.METRICS_ENABLED)
+
+
+async def record_request(request: Request, call_next):
+    """
+    HTTP middleware: counts the request and times it to the last body byte,
+    so streamed exports are measured in full. With the X-Debug-SQL header
+    (and SQL_DEBUG_HEADER_ENABLED) the response carries
+    Server-Timing: sql;dur=<ms>;desc="<n> statements" and each statement is
+    logged with its time.
+    """
+    if not metrics.enabled:
+        return await call_next(request)
+    start = time.perf_counter()
+    statements = None
+    if settings.SQL_DEBUG_HEADER_ENABLED and request.headers.get(DEBUG_SQL_HEADER):
+        statements = []
+        request_statements.set(statements)
+
+    response = await call_next(request)
+    if statements is not None:
+        response.headers["Server-Timing"] = (
+            f'sql;dur={sum(statements) * 1000:.2f};desc="{len(statements)} statements"'
+        )
+    route = request.scope.get("route")
+    labels = (request.method, route.path if route is not None else "<unmatched>")
+    metrics.requests.inc(*labels, response.status_code)
+
+    body = response.body_iterator
+
+    async def counted():
+        size = 0
+        try:
+            async for chunk in body:
+                size += len(chunk)
+                yield chunk
+        finally:
+            metrics.request_seconds.observe(time.perf_counter() - start, *labels)
+            metrics.response_bytes.observe(size, *labels)
+
+    response.body_iterator = counted()
+    return response
+
+
+def metrics_response() -> PlainTextResponse:
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -2,3 +2,8 @@ from pydantic import BaseModel, ConfigDict
 
 class BaseSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def columns(cls) -> str:
+        """Column list for SELECTs, so queries fetch only what the model returns."""
+        return ", ".join(f"[{name}]" for name in cls.model_fields)
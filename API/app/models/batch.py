@@ -0,0 +1,18 @@
+from typing import List
+from .arcane import Arcane
+from .base import BaseSchema
+from .mod import Mod
+from .warframe import Warframe
+from .weapon import Weapon
+
+class BatchRequest(BaseSchema):
+    warframes: List[int] = []
+    weapons: List[int] = []
+    mods: List[int] = []
+    arcanes: List[int] = []
+
+class BatchResponse(BaseSchema):
+    warframes: List[Warframe] = []
+    weapons: List[Weapon] = []
+    mods: List[Mod] = []
+    arcanes: List[Arcane] = []
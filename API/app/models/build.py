@@ -1,6 +1,9 @@
 from typing import Optional, List
 from datetime import datetime
+from .arcane import Arcane as ArcaneRow
 from .base import BaseSchema
+from .warframe import Warframe as WarframeRow
+from .weapon import Weapon as WeaponRow
 
 class MyFrame(BaseSchema):
     FrameBuildId: int
@@ -22,3 +25,75 @@ class Loadout(BaseSchema):
     FocusSchool: Optional[str] = None
     Notes: Optional[str] = None
     CreatedAt: Optional[datetime] = None
+
+class WeaponBuild(BaseSchema):
+    WeaponBuildId: int
+    WeaponId: int
+    BuildName: Optional[str] = None
+    FormaCount: Optional[int] = 0
+    FinalTotalDamage: Optional[float] = None
+    FinalCritChance: Optional[float] = None
+    FinalCritMultiplier: Optional[float] = None
+    FinalStatusChance: Optional[float] = None
+    FinalFireRate: Optional[float] = None
+    FinalBurstDPS: Optional[float] = None
+    FinalSustainedDPS: Optional[float] = None
+    Notes: Optional[str] = None
+    CreatedAt: Optional[datetime] = None
+
+class CompanionBuild(BaseSchema):
+    CompanionBuildId: int
+    CompanionBaseId: int
+    BuildName: Optional[str] = None
+    Notes: Optional[str] = None
+    CreatedAt: Optional[datetime] = None
+
+class ParazonBuild(BaseSchema):
+    ParazonBuildId: int
+    BuildName: Optional[str] = None
+    Notes: Optional[str] = None
+    CreatedAt: Optional[datetime] = None
+
+# /builds/loadouts/.../expanded: every foreign key resolved to its row
+
+class ExpandedArcane(BaseSchema):
+    SlotIndex: int
+    Rank: int
+    Arcane: Optional[ArcaneRow] = None
+
+class ExpandedFrameBuild(MyFrame):
+    Warframe: Optional[WarframeRow] = None
+
+class ExpandedWeaponBuild(WeaponBuild):
+    Weapon: Optional[WeaponRow] = None
+    Arcanes: List[ExpandedArcane] = []
+
+class ExpandedLoadout(Loadout):
+    Frame: Optional[ExpandedFrameBuild] = None
+    Primary: Optional[ExpandedWeaponBuild] = None
+    Secondary: Optional[ExpandedWeaponBuild] = None
+    Melee: Optional[ExpandedWeaponBuild] = None
+    Companion: Optional[CompanionBuild] = None
+    Parazon: Optional[ParazonBuild] = None
+
+# /builds/optimize
+
+class OptimizedMod(BaseSchema):
+    ModId: int
+    Name: Optional[str] = None
+    Polarity: Optional[str] = None
+    SlotPolarity: Optional[str] = None
+    Drain: int
+
+class OptimizedBuild(BaseSchema):
+    Mods: List[OptimizedMod]
+    CapacityUsed: int
+    FinalTotalDamage: Optional[float] = None
+    FinalCritChance: Optional[float] = None
+    FinalCritMultiplier: Optional[float] = None
+    FinalFireRate: Optional[float] = None
+    FinalMultishot: Optional[float] = None
+    FinalMagazineSize: Optional[float] = None
+    FinalReloadTime: Optional[float] = None
+    FinalBurstDPS: Optional[float] = None
+    FinalSustainedDPS: Optional[float] = None
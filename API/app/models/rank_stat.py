@@ -0,0 +1,10 @@
+from typing import Optional
+from .base import BaseSchema
+
+class RankStat(BaseSchema):
+    Rank: int
+    Position: int
+    Stat: Optional[str] = None
+    Value: Optional[float] = None
+    Unit: Optional[str] = None
+    Text: Optional[str] = None
@@ -0,0 +1,7 @@
+from .base import BaseSchema
+
+class SearchResult(BaseSchema):
+    Entity: str
+    Id: int
+    Name: str
+    Score: float
@@ -17,3 +17,8 @@ class Weapon(BaseSchema):
     MagazineSize: Optional[int] = None
     ReloadTime: Optional[float] = None
     Multishot: Optional[float] = None
+    # Derived at ETL time (ETL/Scripts/stats.py)
+    TotalDamage: Optional[float] = None
+    AvgCritMultiplier: Optional[float] = None
+    BurstDPS: Optional[float] = None
+    SustainedDPS: Optional[float] = None
@@ -0,0 +1,269 @@
+import json
+import re
+import time
+from typing import List, Optional
+
+import numpy as np
+from sqlalchemy import text
+
+from .config import settings
+from .snapshot import VersionedStore
+
+# Mod effects the DPS model uses; one column each in the effect matrix
+EFFECTS = ["damage", "multishot", "crit_chance", "crit_damage", "fire_rate", "magazine", "reload",
+           "impact", "puncture", "slash", "elemental"]
+COLUMN = {effect: index for index, effect in enumerate(EFFECTS)}
+
+# levelStats stat name (tags and "(...)" notes stripped, casefolded) -> effect
+STAT_EFFECTS = {
+    "damage": "damage",
+    "melee damage": "damage",
+    "multishot": "multishot",
+    "critical chance": "crit_chance",
+    "critical damage": "crit_damage",
+    "fire rate": "fire_rate",
+    "attack speed": "fire_rate",
+    "magazine capacity": "magazine",
+    "reload speed": "reload",
+    "impact": "impact",
+    "puncture": "puncture",
+    "slash": "slash",
+    "heat": "elemental",
+    "cold": "elemental",
+    "electricity": "elemental",
+    "toxin": "elemental",
+}
+STAT = re.compile(r"^([+-]?\d+(?:\.\d+)?)%\s*(.+)$")
+MARKUP = re.compile(r"<[^>]*>|\([^)]*\)")
+
+# Weapon Type -> mod types that fit it. Rifle and shotgun mods are narrowed
+# further by the weapon's own class (RawJson "type") when it is known.
+MOD_TYPES = {
+    "Primary": {"Primary Mod", "Rifle Mod", "Shotgun Mod", "Bow Mod", "Sniper Mod"},
+    "Secondary": {"Secondary Mod", "Pistol Mod"},
+    "Melee": {"Melee Mod"},
+}
+
+# Name prefixes of variants that can't be equipped alongside the base mod
+VARIANT_PREFIXES = ("Primed ", "Amalgam ", "Galvanized ")
+
+
+def parse_effects(raw_json) -> Optional[dict]:
+    """
+    {effect: fraction} for a mod at its max rank, from the last levelStats
+    entry of its warframestat record, e.g. "+165% Damage" -> {"damage": 1.65}.
+    Stats the DPS model doesn't use (or conditional ones such as "... for
+    each Combo Multiplier") are ignored. None if the record has no stats
+    or no drain, since the mod can then be neither scored nor fitted.
+    """
+    try:
+        item = json.loads(raw_json or "null")
+    except ValueError:
+        return None
+    if not isinstance(item, dict) or not item.get("levelStats") or item.get("baseDrain") is None:
+        return None
+    effects = {}
+    for line in (line for stat in item["levelStats"][-1].get("stats", []) for line in str(stat).splitlines()):
+        match = STAT.match(MARKUP.sub("", line).strip())
+        if match is None:
+            continue
+        effect = STAT_EFFECTS.get(match.group(2).strip().casefold())
+        if effect is not None:
+            effects[effect] = effects.get(effect, 0.0) + float(match.group(1)) / 100
+    return {"effects": effects, "base_drain": int(item["baseDrain"])}
+
+
+def variant_group(name: str) -> str:
+    for prefix in VARIANT_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix):]
+    return name
+
+
+class ModMatrix:
+    """
+    Every mod with a DPS effect, parsed once: one row per mod in `effects`
+    (len(EFFECTS) columns of fractions at max rank) plus parallel arrays of
+    drain at max rank, polarity, mod type and exclusivity group.
+    """
+
+    def __init__(self, rows):
+        parsed = [(row, parse_effects(row.RawJson)) for row in rows]
+        parsed = [(row, mod) for row, mod in parsed if mod is not None and mod["effects"]]
+        self.ids = np.array([row.ModId for row, _ in parsed], dtype=np.int64)
+        self.names = [row.Name or "" for row, _ in parsed]
+        self.polarities = np.array([(row.Polarity or "").casefold() for row, _ in parsed], dtype=object)
+        self.mod_types = np.array([row.ModType or "" for row, _ in parsed], dtype=object)
+        self.drain = np.array([mod["base_drain"] + (row.MaxRank or 0) for row, mod in parsed], dtype=np.int64)
+        self.effects = np.zeros((len(parsed), len(EFFECTS)))
+        for index, (_, mod) in enumerate(parsed):
+            for effect, value in mod["effects"].items():
+                self.effects[index, COLUMN[effect]] = value
+        _, self.groups = np.unique([variant_group(name) for name in self.names], return_inverse=True)
+        self.groups = self.groups.reshape(-1)
+
+    def candidates(self, weapon_type, weapon_class=None):
+        """Row indices of the mods that fit the weapon, most expensive first."""
+        types = set(MOD_TYPES.get(weapon_type, ()))
+        if weapon_type == "Primary" and weapon_class:
+            types.discard("Rifle Mod" if weapon_class == "Shotgun" else "Shotgun Mod")
+        fits = np.flatnonzero(np.isin(self.mod_types, list(types)))
+        return fits[np.lexsort((self.ids[fits], -self.drain[fits]))]
+
+
+class ModMatrixStore(VersionedStore):
+    def load(self, db):
+        query = text("SELECT ModId, Name, ModType, Polarity, MaxRank, RawJson FROM [wf_base].[Mods] "
+                     "WHERE IsDeleted = 0 ORDER BY ModId")
+        return ModMatrix(db.execute(query).fetchall())
+
+    def describe(self, matrix) -> str:
+        return f"mod matrix of {len(matrix.ids)} mods"
+
+
+mod_matrix = ModMatrixStore(version_poll=settings.CACHE_VERSION_POLL_SECONDS, ttl=settings.CACHE_TTL_SECONDS)
+
+
+def final_stats(weapon, column):
+    """
+    Modded weapon stats as arrays, for effect sums given by column(effect),
+    using the same model as ETL/Scripts/stats.py: percentage mods add up
+    within a stat and multiply the base value.
+    """
+    def base(name, default=0.0):
+        value = weapon.get(name)
+        return default if value is None else float(value)
+
+    impact, puncture, slash = base("Impact"), base("Puncture"), base("Slash")
+    damage = (1 + column("damage")) * (
+        impact * (1 + column("impact")) + puncture * (1 + column("puncture")) + slash * (1 + column("slash"))
+        + (impact + puncture + slash) * column("elemental")
+    )
+    crit_chance = base("CritChance") * (1 + column("crit_chance"))
+    crit_multiplier = base("CritMultiplier", 1.0) * (1 + column("crit_damage"))
+    fire_rate = base("FireRate") * (1 + column("fire_rate"))
+    multishot = base("Multishot", 1.0) * (1 + column("multishot"))
+    burst = damage * multishot * (1 + crit_chance * (crit_multiplier - 1)) * fire_rate
+    stats = {
+        "FinalTotalDamage": damage, "FinalCritChance": crit_chance, "FinalCritMultiplier": crit_multiplier,
+        "FinalFireRate": fire_rate, "FinalMultishot": multishot, "FinalBurstDPS": burst,
+        "FinalSustainedDPS": burst,
+    }
+    magazine, reload = weapon.get("MagazineSize"), weapon.get("ReloadTime")
+    if weapon.get("Type") != "Melee" and magazine and reload is not None:
+        stats["FinalMagazineSize"] = magazine * (1 + column("magazine"))
+        stats["FinalReloadTime"] = reload / (1 + column("reload"))
+        firing = stats["FinalMagazineSize"] / fire_rate
+        stats["FinalSustainedDPS"] = burst * firing / (firing + stats["FinalReloadTime"])
+    return stats
+
+
+class SlotState:
+    """A partial build: chosen candidates, the slot polarity and drain of each, drain used and free slots."""
+
+    __slots__ = ("mods", "slots", "drains", "used", "free")
+
+    def __init__(self, mods, slots, drains, used, free):
+        self.mods, self.slots, self.drains, self.used, self.free = mods, slots, drains, used, free
+
+
+def optimize(matrix: ModMatrix, weapon: dict, weapon_class=None, k=5, objective="burst", capacity=60,
+             polarities: Optional[List[str]] = None, slot_count=8, beam_width=None, budget_ms=None):
+    """
+    Top-k mod sets for one weapon by beam search. Each round adds one mod
+    to every build in the beam: the (beam x candidate) effect sums and the
+    resulting DPS are computed as whole arrays, invalid pairs (over
+    capacity, mod or variant already equipped) are masked out, and the best
+    beam_width new builds are kept. A mod goes into a free slot of its own
+    polarity (half drain, rounded up), else a free neutral slot, else
+    another polarity's slot (drain +25%, rounded up), as it is added. Stops
+    when the slots are full, nothing fits, or budget_ms has passed, and
+    returns the best builds of any size, best first, as OptimizedBuild dicts.
+    Raises ValueError for a weapon without a fire rate.
+    """
+    if not weapon.get("FireRate") or weapon["FireRate"] <= 0:
+        raise ValueError("Weapon has no fire rate to compute DPS from")
+    beam_width = beam_width or settings.OPTIMIZER_BEAM_WIDTH
+    budget = (budget_ms if budget_ms is not None else settings.OPTIMIZER_TIME_BUDGET_MS) / 1000
+    deadline = time.perf_counter() + budget
+    score_key = "FinalSustainedDPS" if objective == "sustained" else "FinalBurstDPS"
+
+    rows = matrix.candidates(weapon.get("Type"), weapon_class)
+    effects, drain = matrix.effects[rows], matrix.drain[rows]
+    groups = np.unique(matrix.groups[rows], return_inverse=True)[1].reshape(-1)
+
+    # Slot columns: 0 = no polarity, then one per distinct polarity among the slots
+    slots = [(p or "").strip().casefold() for p in (polarities or [])][:slot_count]
+    slots += [""] * (slot_count - len(slots))
+    columns = [""] + sorted({p for p in slots if p})
+    free = np.array([slots.count(p) for p in columns], dtype=np.int64)
+    slot_column = np.array([columns.index(p) if p in columns[1:] else -1 for p in matrix.polarities[rows]],
+                           dtype=np.int64)
+    matched_drain = -(-drain // 2)
+    mismatched_drain = -(-drain * 5 // 4)
+
+    beam = [SlotState((), (), (), 0, free)]
+    sums = np.zeros((1, len(EFFECTS)))
+    taken = np.zeros((1, groups.max() + 1 if len(groups) else 0), dtype=bool)
+    found = []
+    for _ in range(slot_count):
+        if not len(rows) or time.perf_counter() > deadline:
+            break
+        used = np.array([state.used for state in beam])
+        free_slots = np.stack([state.free for state in beam])
+        has_match = (slot_column >= 0) & (free_slots[:, slot_column.clip(0)] > 0)
+        cost = np.where(has_match, matched_drain, np.where(free_slots[:, :1] > 0, drain, mismatched_drain))
+        valid = ~taken[:, groups] & (used[:, None] + cost <= capacity)
+        score = final_stats(weapon, lambda effect: sums[:, None, COLUMN[effect]] + effects[None, :, COLUMN[effect]])
+        score = np.where(valid, np.nan_to_num(score[score_key], nan=-np.inf), -np.inf)
+
+        flat = np.flatnonzero(np.isfinite(score))
+        if not len(flat):
+            break
+        # The same set reached in a different order is skipped below, so keep some spare
+        spare = beam_width * slot_count
+        if len(flat) > spare:
+            flat = flat[np.argpartition(-score.ravel()[flat], spare)[:spare]]
+        flat = flat[np.lexsort((flat, -score.ravel()[flat]))]
+        next_beam, next_sums, next_taken, seen = [], [], [], set()
+        for index in flat:
+            state_index, candidate = divmod(int(index), len(rows))
+            state = beam[state_index]
+            members = frozenset(state.mods + (candidate,))
+            if members in seen:
+                continue
+            seen.add(members)
+            state_free = state.free.copy()
+            if has_match[state_index, candidate]:
+                column = slot_column[candidate]
+            elif state_free[0] > 0:
+                column = 0
+            else:
+                column = int(np.argmax(state_free))  # the polarity with the most slots left
+            state_free[column] -= 1
+            mod_drain = int(cost[state_index, candidate])
+            new_state = SlotState(state.mods + (candidate,), state.slots + (columns[column],),
+                                  state.drains + (mod_drain,), state.used + mod_drain, state_free)
+            next_beam.append(new_state)
+            next_sums.append(sums[state_index] + effects[candidate])
+            next_taken.append(taken[state_index].copy())
+            next_taken[-1][groups[candidate]] = True
+            found.append((float(score.ravel()[index]), new_state))
+            if len(next_beam) == beam_width:
+                break
+        beam, sums, taken = next_beam, np.array(next_sums), np.array(next_taken)
+
+    found.sort(key=lambda item: -item[0])
+    builds = []
+    for _, state in found[:k]:
+        totals = effects[list(state.mods)].sum(axis=0)
+        stats = final_stats(weapon, lambda effect: totals[COLUMN[effect]])
+        mods = [
+            {"ModId": int(matrix.ids[rows[candidate]]), "Name": matrix.names[rows[candidate]],
+             "Polarity": matrix.polarities[rows[candidate]] or None, "SlotPolarity": polarity or None,
+             "Drain": drain_used}
+            for candidate, polarity, drain_used in zip(state.mods, state.slots, state.drains)
+        ]
+        builds.append({"Mods": mods, "CapacityUsed": state.used,
+                       **{name: round(float(value), 4) for name, value in stats.items()}})
+    return builds
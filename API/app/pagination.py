@@ -0,0 +1,86 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+
+# Response header carrying the cursor for the page after this one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def parse_sort(sort, allowed_sort_fields: dict, default: str):
+    """
+    (column, descending) for ?sort=field or ?sort=-field. Unknown fields
+    fall back to the default column, ascending.
+    """
+    if not sort:
+        return default, False
+    descending = sort.startswith("-")
+    column = allowed_sort_fields.get(sort.lstrip("-").lower())
+    if column is None:
+        return default, False
+    return column, descending
+
+
+def order_clause(column: str, key: str, descending: bool) -> str:
+    """ORDER BY the sort column with the primary key as tiebreaker, so every row has a unique position."""
+    direction = "DESC" if descending else "ASC"
+    return f" ORDER BY {column} {direction}, {key} {direction}"
+
+
+def encode_cursor(column: str, descending: bool, value, key_value) -> str:
+    payload = {"sort": f"{column} {'DESC' if descending else 'ASC'}", "after": [value, key_value]}
+    raw = json.dumps(payload, default=str, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: str, descending: bool):
+    """(sort value, key value) from a cursor; 400 if it's malformed or was issued for a different sort."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        value, key_value = payload["after"]
+        sort = payload["sort"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if sort != f"{column} {'DESC' if descending else 'ASC'}":
+        raise HTTPException(status_code=400, detail="Cursor was issued for a different sort")
+    return value, key_value
+
+
+def apply_cursor(cursor, conditions, params, column, key, descending):
+    """
+    Adds the keyset condition for the rows after the cursor's row to
+    conditions/params. NULLs sort first ascending and last descending, as
+    on SQL Server and SQLite. The non-NULL cases are written as a range on
+    the sort column so the index on it can seek straight to the page.
+    """
+    if not cursor:
+        return
+    value, key_value = decode_cursor(cursor, column, descending)
+    params["after_key"] = key_value
+    if value is None:
+        if descending:
+            conditions.append(f"({column} IS NULL AND {key} < :after_key)")
+        else:
+            conditions.append(f"(({column} IS NULL AND {key} > :after_key) OR {column} IS NOT NULL)")
+        return
+    params["after_value"] = value
+    if descending:
+        conditions.append(
+            f"(({column} <= :after_value AND ({column} < :after_value OR {key} < :after_key)) OR {column} IS NULL)"
+        )
+    else:
+        conditions.append(f"({column} >= :after_value AND ({column} > :after_value OR {key} > :after_key))")
+
+
+def set_next_cursor(response, rows, column, key, descending, limit):
+    """Sets the X-Next-Cursor header from the last row of a full page."""
+    if not rows or len(rows) < limit:
+        return
+    last = rows[-1]
+    if isinstance(last, dict):
+        value, key_value = last[column], last[key]
+    else:
+        value, key_value = getattr(last, column), getattr(last, key)
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(column, descending, value, key_value)
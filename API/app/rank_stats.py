@@ -0,0 +1,43 @@
+from typing import Optional
+
+from fastapi import HTTPException
+
+from .cache import catalogue_cache
+from .models.rank_stat import RankStat
+
+# entity -> (rank-stat side table, key column), filled by the ETL from
+# levelStats (DB/migrations/007_rank_stats.sql)
+RANK_TABLES = {
+    "mods": ("[wf_base].[ModRankStats]", "ModId"),
+    "arcanes": ("[wf_base].[ArcaneRankStats]", "ArcaneId"),
+}
+
+
+def stat_condition(entity: str, stat: Optional[str], min_value: Optional[float], max_value: Optional[float],
+                   params: dict) -> Optional[str]:
+    """
+    "<key> IN (...)" keeping rows with `stat` at some rank, optionally
+    within [min_value, max_value], or None without a stat. The subquery
+    seeks the (Stat, Value) index; Stat matches case-insensitively.
+    """
+    if stat is None:
+        if min_value is not None or max_value is not None:
+            raise HTTPException(status_code=400, detail="min_value and max_value need a stat")
+        return None
+    table, key = RANK_TABLES[entity]
+    conditions = ["Stat = :stat"]
+    params["stat"] = stat
+    if min_value is not None:
+        conditions.append("Value >= :stat_min")
+        params["stat_min"] = min_value
+    if max_value is not None:
+        conditions.append("Value <= :stat_max")
+        params["stat_max"] = max_value
+    return f"{key} IN (SELECT {key} FROM {table} WHERE {' AND '.join(conditions)})"
+
+
+def fetch_ranks(db, entity: str, row_id: int):
+    """RankStat rows of one mod or arcane, by rank then line."""
+    table, key = RANK_TABLES[entity]
+    query = f"SELECT {RankStat.columns()} FROM {table} WHERE {key} = :id ORDER BY [Rank], [Position]"
+    return catalogue_cache.fetchall(db, query, {"id": row_id})
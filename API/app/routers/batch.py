@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from ..batch import CATALOGUE_TABLES, check_batch_size, fetch_by_ids
+from ..db import get_db, run_db
+from ..models.batch import BatchRequest, BatchResponse
+
+router = APIRouter(
+    tags=["batch"],
+)
+
+@router.post("/batch", response_model=BatchResponse)
+async def read_batch(request: BatchRequest, db: Session = Depends(get_db)):
+    """
+    Catalogue rows for many ids in one round trip, e.g.
+    {"warframes": [1, 2], "arcanes": [3, 4, 5]}. One query per entity
+    listed; unknown ids are left out of the response.
+    """
+    for entity in CATALOGUE_TABLES:
+        check_batch_size(getattr(request, entity))
+
+    def load():
+        return {entity: fetch_by_ids(db, entity, getattr(request, entity)) for entity in CATALOGUE_TABLES}
+
+    return await run_db(load)
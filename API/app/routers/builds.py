@@ -1,9 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from collections import defaultdict
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List
-from ..db import get_db
-from ..models.build import MyFrame, Loadout
+from typing import List, Optional
+from ..batch import fetch_by_ids, in_condition
+from ..cache import catalogue_cache
+from ..conditional import conditional_get
+from ..db import get_db, page_clause, run_db
+from ..optimizer import mod_matrix, optimize
+from ..pagination import apply_cursor, order_clause, set_next_cursor
+from ..models.build import (
+    CompanionBuild, ExpandedLoadout, Loadout, MyFrame, OptimizedBuild, ParazonBuild, WeaponBuild,
+)
+from ..models.weapon import Weapon
 
 router = APIRouter(
     prefix="/builds",
@@ -11,14 +21,193 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+def newest_first(db, model, table, key, skip, limit, cursor):
+    """Newest-first page of a wf_user table; returns (query, params)."""
+    conditions, params = [], {"skip": skip, "limit": limit}
+    apply_cursor(cursor, conditions, params, "CreatedAt", key, True)
+    query = f"SELECT {model.columns()} FROM [wf_user].[{table}]"
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += order_clause("CreatedAt", key, True) + page_clause(db)
+    return text(query), params
+
 @router.get("/frames", response_model=List[MyFrame])
-def read_frame_builds(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    query = text("SELECT * FROM [wf_user].[MyFrames] ORDER BY CreatedAt DESC OFFSET :skip ROWS FETCH NEXT :limit ROWS ONLY")
-    result = db.execute(query, {"skip": skip, "limit": limit}).fetchall()
+async def read_frame_builds(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    query, params = newest_first(db, MyFrame, "MyFrames", "FrameBuildId", skip, limit, cursor)
+    result = await run_db(lambda: db.execute(query, params).fetchall())
+    set_next_cursor(response, result, "CreatedAt", "FrameBuildId", True, limit)
     return result
 
 @router.get("/loadouts", response_model=List[Loadout])
-def read_loadouts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    query = text("SELECT * FROM [wf_user].[Loadouts] ORDER BY CreatedAt DESC OFFSET :skip ROWS FETCH NEXT :limit ROWS ONLY")
-    result = db.execute(query, {"skip": skip, "limit": limit}).fetchall()
+async def read_loadouts(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    query, params = newest_first(db, Loadout, "Loadouts", "LoadoutId", skip, limit, cursor)
+    result = await run_db(lambda: db.execute(query, params).fetchall())
+    set_next_cursor(response, result, "CreatedAt", "LoadoutId", True, limit)
+    return result
+
+# Loadout slot -> (Loadout column, build table, arcane link table)
+WEAPON_SLOTS = {
+    "Primary": ("PrimaryBuildId", "MyPrimaryWeapons", "PrimaryWeaponArcanes"),
+    "Secondary": ("SecondaryBuildId", "MySecondaryWeapons", "SecondaryWeaponArcanes"),
+    "Melee": ("MeleeBuildId", "MyMeleeWeapons", "MeleeWeaponArcanes"),
+}
+
+def referenced(rows, column):
+    return {getattr(row, column) for row in rows} - {None}
+
+def rows_by_id(db, model, table, key, ids):
+    """{id: row} for one wf_user table, in one query."""
+    if not ids:
+        return {}
+    params: dict = {}
+    query = text(f"SELECT {model.columns()} FROM [wf_user].[{table}] WHERE " + in_condition(key, ids, params))
+    return {getattr(row, key): row for row in db.execute(query, params)}
+
+def expand_loadouts(db, loadouts) -> List[dict]:
+    """
+    Resolves the foreign keys of a page of loadouts with a fixed number of
+    set-based queries, whatever the page size: frame builds, the three
+    weapon build tables (one UNION ALL), their arcane links (one UNION ALL),
+    companions and parazons, then the referenced warframes, weapons and
+    arcanes through the catalogue cache.
+    """
+    frames = rows_by_id(db, MyFrame, "MyFrames", "FrameBuildId", referenced(loadouts, "FrameBuildId"))
+    companions = rows_by_id(db, CompanionBuild, "MyCompanions", "CompanionBuildId",
+                            referenced(loadouts, "CompanionBuildId"))
+    parazons = rows_by_id(db, ParazonBuild, "MyParazons", "ParazonBuildId", referenced(loadouts, "ParazonBuildId"))
+
+    builds, links = {}, defaultdict(list)
+    build_parts, link_parts, params = [], [], {}
+    for slot, (column, build_table, link_table) in WEAPON_SLOTS.items():
+        ids = referenced(loadouts, column)
+        if not ids:
+            continue
+        build_parts.append(
+            f"SELECT '{slot}' AS Slot, {WeaponBuild.columns()} FROM [wf_user].[{build_table}] WHERE "
+            + in_condition("WeaponBuildId", ids, params, prefix=slot.lower())
+        )
+        link_parts.append(
+            f"SELECT '{slot}' AS Slot, WeaponBuildId, SlotIndex, Rank, ArcaneId FROM [wf_user].[{link_table}] WHERE "
+            + in_condition("WeaponBuildId", ids, params, prefix=slot.lower())
+        )
+    if build_parts:
+        for row in db.execute(text(" UNION ALL ".join(build_parts)), params):
+            builds[(row.Slot, row.WeaponBuildId)] = row
+        link_query = " UNION ALL ".join(link_parts) + " ORDER BY Slot, WeaponBuildId, SlotIndex"
+        for row in db.execute(text(link_query), params):
+            links[(row.Slot, row.WeaponBuildId)].append(row)
+
+    warframes = {row.WarframeId: row for row in fetch_by_ids(db, "warframes", referenced(frames.values(), "WarframeId"))}
+    weapons = {row.WeaponId: row for row in fetch_by_ids(db, "weapons", referenced(builds.values(), "WeaponId"))}
+    arcane_ids = {link.ArcaneId for slot_links in links.values() for link in slot_links}
+    arcanes = {row.ArcaneId: row for row in fetch_by_ids(db, "arcanes", arcane_ids)}
+
+    expanded = []
+    for loadout in loadouts:
+        item = dict(loadout._mapping)
+        frame = frames.get(loadout.FrameBuildId)
+        if frame is not None:
+            item["Frame"] = {**frame._mapping, "Warframe": warframes.get(frame.WarframeId)}
+        for slot, (column, _, _) in WEAPON_SLOTS.items():
+            build = builds.get((slot, item[column]))
+            if build is not None:
+                item[slot] = {
+                    **build._mapping,
+                    "Weapon": weapons.get(build.WeaponId),
+                    "Arcanes": [
+                        {"SlotIndex": link.SlotIndex, "Rank": link.Rank, "Arcane": arcanes.get(link.ArcaneId)}
+                        for link in links[(slot, build.WeaponBuildId)]
+                    ],
+                }
+        item["Companion"] = companions.get(loadout.CompanionBuildId)
+        item["Parazon"] = parazons.get(loadout.ParazonBuildId)
+        expanded.append(item)
+    return expanded
+
+@router.get("/loadouts/expanded", response_model=List[ExpandedLoadout])
+async def read_loadouts_expanded(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """Newest-first loadouts like /builds/loadouts, with every build, item and arcane filled in."""
+    query, params = newest_first(db, Loadout, "Loadouts", "LoadoutId", skip, limit, cursor)
+
+    def load():
+        loadouts = db.execute(query, params).fetchall()
+        return loadouts, expand_loadouts(db, loadouts)
+
+    loadouts, result = await run_db(load)
+    set_next_cursor(response, loadouts, "CreatedAt", "LoadoutId", True, limit)
+    return result
+
+@router.get("/loadouts/{loadout_id}/expanded", response_model=ExpandedLoadout)
+async def read_loadout_expanded(loadout_id: int, db: Session = Depends(get_db)):
+    query = text(f"SELECT {Loadout.columns()} FROM [wf_user].[Loadouts] WHERE LoadoutId = :id")
+
+    def load():
+        loadouts = db.execute(query, {"id": loadout_id}).fetchall()
+        return expand_loadouts(db, loadouts)
+
+    result = await run_db(load)
+    if not result:
+        raise HTTPException(status_code=404, detail="Loadout not found")
+    return result[0]
+
+# Catalogue-only, so it gets the catalogue ETag like /weapons
+@router.get("/optimize", response_model=List[OptimizedBuild], dependencies=[Depends(conditional_get)])
+async def optimize_build(
+    weapon_id: int,
+    k: int = Query(5, ge=1, le=50, description="Builds to return"),
+    objective: str = Query("burst", pattern="^(burst|sustained)$", description="DPS to maximise"),
+    capacity: int = Query(60, ge=0, description="Mod capacity (60 with an Orokin Catalyst)"),
+    slots: int = Query(8, ge=1, le=10, description="Mod slots"),
+    polarities: Optional[str] = Query(None, description="Slot polarities in order, blank for none, e.g. madurai,,naramon"),
+    budget_ms: Optional[float] = Query(None, gt=0, description="Search time limit (default OPTIMIZER_TIME_BUDGET_MS)"),
+    db: Session = Depends(get_db),
+):
+    """
+    The k highest-DPS mod sets for a weapon at max mod rank, within the
+    capacity and slot polarities given.
+
+    Query examples:
+    - /builds/optimize?weapon_id=42
+    - /builds/optimize?weapon_id=42&objective=sustained&capacity=30&polarities=madurai,madurai,naramon
+    """
+    query = f"SELECT {Weapon.columns()}, RawJson FROM [wf_base].[Weapons] WHERE WeaponId = :id"
+
+    def run():
+        weapon = catalogue_cache.fetchone(db, query, {"id": weapon_id})
+        if weapon is None:
+            return None
+        weapon = dict(weapon._mapping)
+        try:
+            weapon_class = json.loads(weapon.pop("RawJson") or "{}").get("type")
+        except (ValueError, AttributeError):
+            weapon_class = None
+        return optimize(
+            mod_matrix.get(db), weapon, weapon_class, k=k, objective=objective, capacity=capacity,
+            polarities=polarities.split(",") if polarities else None, slot_count=slots, budget_ms=budget_ms,
+        )
+
+    try:
+        result = await run_db(run)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if result is None:
+        raise HTTPException(status_code=404, detail="Weapon not found")
     return result
@@ -0,0 +1,119 @@
+import asyncio
+import csv
+import io
+import json
+from typing import List, Tuple
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+from ..conditional import conditional_get
+from ..config import settings
+from ..db import EXPORT_SLOTS, export_executor, get_db, run_in
+from ..pagination import order_clause
+from ..models.arcane import Arcane
+from ..models.mod import Mod
+from ..models.warframe import Warframe
+from ..models.weapon import Weapon
+from .warframes import warframe_filters, warframe_sort
+from .weapons import weapon_filters, weapon_sort
+
+router = APIRouter(
+    prefix="/export",
+    tags=["export"],
+    dependencies=[Depends(conditional_get)],
+)
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+# Exports in flight. Each holds a pooled connection for the whole stream, so
+# unbounded they could take every connection while the request threads wait
+# on checkouts; the rest queue here without holding a thread or connection.
+export_slots = asyncio.Semaphore(EXPORT_SLOTS)
+
+FORMAT = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson (one JSON object per line) or csv")
+
+
+def encode_rows(rows, columns, format):
+    """One chunk of the export body."""
+    if format == "csv":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue().encode()
+    return "".join(json.dumps(dict(zip(columns, row)), default=str) + "\n" for row in rows).encode()
+
+
+async def stream_rows(db, query, params, columns, format):
+    """
+    Yields the export EXPORT_BATCH_SIZE rows at a time. The query runs on
+    its own connection with yield_per, so rows are fetched as the client
+    reads and neither the result set nor the body is ever held in full.
+    Checkout, fetches and close run on export_executor, and at most
+    EXPORT_SLOTS streams run at once, so a stream always has a thread.
+    """
+    async with export_slots:
+        connection = await run_in(export_executor, db.get_bind().connect)
+        try:
+            result = await run_in(
+                export_executor,
+                lambda: connection.execution_options(yield_per=settings.EXPORT_BATCH_SIZE).execute(text(query), params),
+            )
+            if format == "csv":
+                yield encode_rows([columns], columns, format)
+            while True:
+                rows = await run_in(export_executor, result.fetchmany, settings.EXPORT_BATCH_SIZE)
+                if not rows:
+                    break
+                yield encode_rows(rows, columns, format)
+        finally:
+            await run_in(export_executor, connection.close)
+
+
+def export_response(db, entity, model, key, conditions, params, order, format):
+    order_column, descending = order
+    query = (
+        f"SELECT {model.columns()} FROM [wf_base].[{entity.capitalize()}] WHERE " + " AND ".join(conditions)
+        + order_clause(order_column, key, descending)
+    )
+    return StreamingResponse(
+        stream_rows(db, query, params, list(model.model_fields), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
+
+
+@router.get("/warframes")
+async def export_warframes(
+    format: str = FORMAT,
+    filters: Tuple[List[str], dict] = Depends(warframe_filters),
+    order: Tuple[str, bool] = Depends(warframe_sort),
+    db: Session = Depends(get_db),
+):
+    """Every Warframe matching the /warframes filters, streamed as NDJSON or CSV."""
+    conditions, params = filters
+    return export_response(db, "warframes", Warframe, "WarframeId", conditions, params, order, format)
+
+
+@router.get("/weapons")
+async def export_weapons(
+    format: str = FORMAT,
+    filters: Tuple[List[str], dict] = Depends(weapon_filters),
+    order: Tuple[str, bool] = Depends(weapon_sort),
+    db: Session = Depends(get_db),
+):
+    """Every Weapon matching the /weapons filters, streamed as NDJSON or CSV."""
+    conditions, params = filters
+    return export_response(db, "weapons", Weapon, "WeaponId", conditions, params, order, format)
+
+
+@router.get("/mods")
+async def export_mods(format: str = FORMAT, db: Session = Depends(get_db)):
+    """Every Mod, streamed as NDJSON or CSV."""
+    return export_response(db, "mods", Mod, "ModId", ["IsDeleted = 0"], {}, ("Name", False), format)
+
+
+@router.get("/arcanes")
+async def export_arcanes(format: str = FORMAT, db: Session = Depends(get_db)):
+    """Every Arcane, streamed as NDJSON or CSV."""
+    return export_response(db, "arcanes", Arcane, "ArcaneId", ["IsDeleted = 0"], {}, ("Name", False), format)
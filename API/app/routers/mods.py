@@ -1,26 +1,74 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List
-from ..db import get_db
+from typing import List, Optional
+from ..batch import in_condition, parse_ids
+from ..cache import catalogue_cache
+from ..conditional import conditional_get
+from ..db import get_db, page_clause, run_db
+from ..pagination import apply_cursor, order_clause, set_next_cursor
 from ..models.mod import Mod
+from ..models.rank_stat import RankStat
+from ..rank_stats import fetch_ranks, stat_condition
 
 router = APIRouter(
     prefix="/mods",
     tags=["mods"],
+    dependencies=[Depends(conditional_get)],
     responses={404: {"description": "Not found"}},
 )
 
 @router.get("/", response_model=List[Mod])
-def read_mods(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    query = text("SELECT * FROM [wf_base].[Mods] ORDER BY Name OFFSET :skip ROWS FETCH NEXT :limit ROWS ONLY")
-    result = db.execute(query, {"skip": skip, "limit": limit}).fetchall()
+async def read_mods(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    ids: Optional[str] = Query(None, description="Comma-separated ModIds, e.g. 1,2,3"),
+    stat: Optional[str] = Query(None, max_length=100,
+                                description="Only mods with this stat at some rank, e.g. Critical Chance"),
+    min_value: Optional[float] = Query(None, description="With stat: the stat's value at that rank is at least this"),
+    max_value: Optional[float] = Query(None, description="With stat: the stat's value at that rank is at most this"),
+    db: Session = Depends(get_db),
+):
+    conditions, params = ["IsDeleted = 0"], {"skip": skip, "limit": limit}
+    if ids:
+        conditions.append(in_condition("ModId", parse_ids(ids), params))
+    stat_filter = stat_condition("mods", stat, min_value, max_value, params)
+    if stat_filter:
+        conditions.append(stat_filter)
+    apply_cursor(cursor, conditions, params, "Name", "ModId", False)
+    query = (
+        f"SELECT {Mod.columns()} FROM [wf_base].[Mods] WHERE " + " AND ".join(conditions)
+        + order_clause("Name", "ModId", False) + page_clause(db)
+    )
+    result = await run_db(catalogue_cache.fetchall, db, query, params)
+    set_next_cursor(response, result, "Name", "ModId", False, limit)
     return result
 
 @router.get("/{mod_id}", response_model=Mod)
-def read_mod(mod_id: int, db: Session = Depends(get_db)):
-    query = text("SELECT * FROM [wf_base].[Mods] WHERE ModId = :id")
-    result = db.execute(query, {"id": mod_id}).fetchone()
+async def read_mod(mod_id: int, db: Session = Depends(get_db)):
+    query = f"SELECT {Mod.columns()} FROM [wf_base].[Mods] WHERE ModId = :id"
+    result = await run_db(catalogue_cache.fetchone, db, query, {"id": mod_id})
     if result is None:
         raise HTTPException(status_code=404, detail="Mod not found")
     return result
+
+@router.get("/{mod_id}/ranks", response_model=List[RankStat])
+async def read_mod_ranks(mod_id: int, db: Session = Depends(get_db)):
+    """Every stat at every rank, from levelStats as the ETL parsed it."""
+    result = await run_db(fetch_ranks, db, "mods", mod_id)
+    if not result:
+        query = "SELECT ModId FROM [wf_base].[Mods] WHERE ModId = :id"
+        if await run_db(catalogue_cache.fetchone, db, query, {"id": mod_id}) is None:
+            raise HTTPException(status_code=404, detail="Mod not found")
+    return result
+
+@router.get("/{mod_id}/raw")
+async def read_mod_raw(mod_id: int, db: Session = Depends(get_db)):
+    """The unprocessed warframestat record the row was loaded from."""
+    query = text("SELECT RawJson FROM [wf_base].[Mods] WHERE ModId = :id")
+    result = await run_db(lambda: db.execute(query, {"id": mod_id}).fetchone())
+    if result is None:
+        raise HTTPException(status_code=404, detail="Mod not found")
+    return Response(content=result.RawJson or "null", media_type="application/json")
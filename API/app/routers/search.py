@@ -0,0 +1,36 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from ..conditional import conditional_get
+from ..db import get_db, run_db
+from ..search import search_index
+from ..models.search import SearchResult
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"],
+    dependencies=[Depends(conditional_get)],
+)
+
+
+@router.get("/", response_model=List[SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, max_length=100, description="Name or part of one; typos are tolerated"),
+    entity: Optional[str] = Query(None, pattern="^(warframes|weapons|mods|arcanes)$"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """
+    Warframes, weapons, mods and arcanes whose names match q, best first.
+
+    Query examples:
+    - /search?q=braton prme
+    - /search?q=serra&entity=mods
+    """
+    # The index lives in memory; only the (at most every CACHE_VERSION_POLL_SECONDS) version check touches the DB
+    if search_index.refresh_due():
+        await run_db(search_index.refresh, db)
+    results = search_index.value.search(q, limit=limit, entity=entity)
+    return [SearchResult(Entity=kind, Id=row_id, Name=name, Score=score) for kind, row_id, name, score in results]
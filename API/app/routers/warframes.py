@@ -1,24 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List, Optional
-
-from ..db import get_db
+from typing import List, Optional, Tuple
+
+from ..batch import in_condition, parse_ids
+from ..cache import catalogue_cache
+from ..conditional import conditional_get
+from ..db import get_db, page_clause, run_db
+from ..pagination import apply_cursor, order_clause, parse_sort, set_next_cursor
+from ..search import name_condition
+from ..snapshot import snapshots
 from ..models.warframe import Warframe
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/warframes",
     tags=["warframes"],
+    dependencies=[Depends(conditional_get)],
     responses={404: {"description": "Not found"}},
 )
 
 # ---------------------------
-# List Warframes (with filters)
+# Filters and sorting (shared with /export/warframes)
 # ---------------------------
-@router.get("/", response_model=List[Warframe])
-def read_warframes(
-    skip: int = 0,
-    limit: int = 100,
+async def warframe_filters(
+    ids: Optional[str] = Query(None, description="Comma-separated WarframeIds, e.g. 1,2,3"),
     name: Optional[str] = None,
     min_armor: Optional[int] = None,
     max_armor: Optional[int] = None,
@@ -26,21 +35,18 @@ def read_warframes(
     max_health: Optional[int] = None,
     min_shields: Optional[int] = None,
     max_shields: Optional[int] = None,
-    sort: Optional[str] = None,
     db: Session = Depends(get_db),
-):
-    """
-    Returns a list of Warframes with optional filtering and sorting.
-    """
-
-    base_query = "SELECT * FROM [wf_base].[Warframes]"
-    conditions = []
+) -> Tuple[List[str], dict]:
+    """WHERE conditions and their params for the Warframe filters."""
+    # Rows removed upstream are soft-deleted by the ETL upsert
+    conditions = ["IsDeleted = 0"]
     params: dict = {}
 
-    # ----- Filters -----
+    if ids:
+        conditions.append(in_condition("WarframeId", parse_ids(ids), params))
+
     if name:
-        conditions.append("Name LIKE :name")
-        params["name"] = f"%{name}%"
+        conditions.append(await name_condition(db, "warframes", "WarframeId", name, params))
 
     if min_armor is not None:
         conditions.append("Armor >= :min_armor")
@@ -66,51 +72,95 @@ def read_warframes(
         conditions.append("Shields <= :max_shields")
         params["max_shields"] = max_shields
 
-    # Build WHERE clause
-    query = base_query
-    if conditions:
-        query += " WHERE " + " AND ".join(conditions)
+    return conditions, params
 
-    # ----- Sorting -----
-    allowed_sort_fields = {
-        "name": "Name",
-        "armor": "Armor",
-        "health": "Health",
-        "shields": "Shields",
-        "energy": "Energy",
-        "sprintspeed": "SprintSpeed",
-    }
 
-    order_clause = " ORDER BY Name"  # default
+allowed_sort_fields = {
+    "name": "Name",
+    "armor": "Armor",
+    "health": "Health",
+    "shields": "Shields",
+    "energy": "Energy",
+    "sprintspeed": "SprintSpeed",
+}
 
-    if sort:
-        direction = "ASC"
-        field_key = sort
 
-        if sort.startswith("-"):
-            direction = "DESC"
-            field_key = sort[1:]
+def warframe_sort(sort: Optional[str] = None) -> Tuple[str, bool]:
+    """(order column, descending) for ?sort=field / ?sort=-field; Name by default."""
+    return parse_sort(sort, allowed_sort_fields, "Name")
 
-        column = allowed_sort_fields.get(field_key.lower())
-        if column:
-            order_clause = f" ORDER BY {column} {direction}"
 
-    query += order_clause
+# ---------------------------
+# List Warframes (with filters)
+# ---------------------------
+@router.get("/", response_model=List[Warframe])
+async def read_warframes(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    filters: Tuple[List[str], dict] = Depends(warframe_filters),
+    order: Tuple[str, bool] = Depends(warframe_sort),
+    db: Session = Depends(get_db),
+):
+    """
+    Returns a list of Warframes with optional filtering and sorting.
+
+    A full page sets the X-Next-Cursor header; pass it back as `cursor`
+    (with the same filters and sort) for the next page.
+    """
+
+    base_query = f"SELECT {Warframe.columns()} FROM [wf_base].[Warframes]"
+    conditions, params = filters
+    order_column, descending = order
 
     # ----- Pagination -----
-    query += " OFFSET :skip ROWS FETCH NEXT :limit ROWS ONLY"
+    # Keyset: the cursor's (sort value, WarframeId) bounds the page, so deep pages seek like the first
+    apply_cursor(cursor, conditions, params, order_column, "WarframeId", descending)
+
+    # Build WHERE clause
+    query = base_query
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    query += order_clause(order_column, "WarframeId", descending)
+    query += page_clause(db)
     params["skip"] = skip
     params["limit"] = limit
 
     try:
-        # TEMP debug prints – will show up in your Uvicorn terminal
-        print("FINAL SQL:", query)
-        print("PARAMS:", params)
-
-        result = db.execute(text(query), params).fetchall()
+        if snapshots.enabled:
+            result = await run_db(
+                snapshots.query, db, "warframes", conditions, params, order_column, descending, skip, limit
+            )
+            if result is not None:
+                set_next_cursor(response, result, order_column, "WarframeId", descending, limit)
+                return result
+
+        result = await run_db(catalogue_cache.fetchall, db, query, params)
+        set_next_cursor(response, result, order_column, "WarframeId", descending, limit)
         return result
 
     except Exception as e:
         # Let’s see SQL Server’s real complaint instead of a blank 500
-        print("ERROR executing warframes query:", e)
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        logger.exception(f"Warframes query failed: {query} {params!r}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{warframe_id}", response_model=Warframe)
+async def read_warframe(warframe_id: int, db: Session = Depends(get_db)):
+    query = f"SELECT {Warframe.columns()} FROM [wf_base].[Warframes] WHERE WarframeId = :id"
+    result = await run_db(catalogue_cache.fetchone, db, query, {"id": warframe_id})
+    if result is None:
+        raise HTTPException(status_code=404, detail="Warframe not found")
+    return result
+
+
+@router.get("/{warframe_id}/raw")
+async def read_warframe_raw(warframe_id: int, db: Session = Depends(get_db)):
+    """The unprocessed warframestat record the row was loaded from."""
+    query = text("SELECT RawJson FROM [wf_base].[Warframes] WHERE WarframeId = :id")
+    result = await run_db(lambda: db.execute(query, {"id": warframe_id}).fetchone())
+    if result is None:
+        raise HTTPException(status_code=404, detail="Warframe not found")
+    return Response(content=result.RawJson or "null", media_type="application/json")
@@ -1,21 +1,31 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, Response, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from typing import List, Optional
-from ..db import get_db
+from typing import List, Optional, Tuple
+from ..batch import in_condition, parse_ids
+from ..cache import catalogue_cache
+from ..conditional import conditional_get
+from ..db import get_db, page_clause, run_db
+from ..pagination import apply_cursor, order_clause, parse_sort, set_next_cursor
+from ..search import name_condition
+from ..snapshot import snapshots
 from ..models.weapon import Weapon
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="/weapons",
     tags=["weapons"],
+    dependencies=[Depends(conditional_get)],
     responses={404: {"description": "Not found"}},
 )
 
 
-@router.get("/", response_model=List[Weapon])
-def read_weapons(
-    skip: int = 0,
-    limit: int = 100,
+# ---- Filters and sorting (shared with /export/weapons) ----
+async def weapon_filters(
+    ids: Optional[str] = Query(None, description="Comma-separated WeaponIds, e.g. 1,2,3"),
     name: Optional[str] = None,
     type: Optional[str] = Query(
         None,
@@ -29,42 +39,29 @@ def read_weapons(
     max_crit: Optional[float] = None,
     min_status: Optional[float] = None,
     max_status: Optional[float] = None,
-    sort: Optional[str] = None,
     db: Session = Depends(get_db),
-):
-    """
-    Returns a list of Weapons with optional filtering and sorting.
+) -> Tuple[List[str], dict]:
+    """WHERE conditions and their params for the Weapon filters."""
+    # Rows removed upstream are soft-deleted by the ETL upsert
+    conditions = ["IsDeleted = 0"]
+    params: dict = {}
 
-    Query examples:
-    - /weapons?skip=0&limit=20
-    - /weapons?type=Primary
-    - /weapons?name=Braton
-    - /weapons?min_mastery=10&sort=-mastery
-    - /weapons?min_damage=200&sort=-damage
-    """
+    if ids:
+        conditions.append(in_condition("WeaponId", parse_ids(ids), params))
 
-    # ---- Base query ----
-    query = "SELECT * FROM [wf_base].[Weapons]"
-    conditions = []
-    params: dict = {"skip": skip, "limit": limit}
-
-    # ---- Filters ----
     if name:
-        conditions.append("Name LIKE :name")
-        params["name"] = f"%{name}%"
+        conditions.append(await name_condition(db, "weapons", "WeaponId", name, params))
 
     if type:
         conditions.append("Type = :type")
         params["type"] = type
 
-    # TODO: update column names below to match your table
-    # e.g. MasteryRank / MasteryReq, TotalDamage, CritChance, StatusChance
     if min_mastery is not None:
-        conditions.append("MasteryReq >= :min_mastery")
+        conditions.append("MasteryRank >= :min_mastery")
         params["min_mastery"] = min_mastery
 
     if max_mastery is not None:
-        conditions.append("MasteryReq <= :max_mastery")
+        conditions.append("MasteryRank <= :max_mastery")
         params["max_mastery"] = max_mastery
 
     if min_damage is not None:
@@ -91,47 +88,97 @@ def read_weapons(
         conditions.append("StatusChance <= :max_status")
         params["max_status"] = max_status
 
-    if conditions:
-        query += " WHERE " + " AND ".join(conditions)
+    return conditions, params
 
-    # ---- Sorting ----
-    allowed_sort_fields = {
-        "name": "Name",
-        "type": "Type",
-        "mastery": "MasteryReq",      # check this column name in SSMS
-        "damage": "TotalDamage",      # check this too
-        "crit": "CritChance",
-        "status": "StatusChance",
-    }
 
-    order_clause = " ORDER BY Name"  # default sort
+allowed_sort_fields = {
+    "name": "Name",
+    "type": "Type",
+    "mastery": "MasteryRank",
+    "damage": "TotalDamage",
+    "dps": "BurstDPS",
+    "sustained": "SustainedDPS",
+    "crit": "CritChance",
+    "status": "StatusChance",
+}
 
-    if sort:
-        direction = "ASC"
-        field_key = sort
 
-        # e.g. sort=-damage → DESC
-        if sort.startswith("-"):
-            direction = "DESC"
-            field_key = sort[1:]
+def weapon_sort(sort: Optional[str] = None) -> Tuple[str, bool]:
+    """(order column, descending) for e.g. sort=-damage; Name by default."""
+    return parse_sort(sort, allowed_sort_fields, "Name")
 
-        column = allowed_sort_fields.get(field_key.lower())
-        if column:
-            order_clause = f" ORDER BY {column} {direction}"
 
-    query += order_clause
+@router.get("/", response_model=List[Weapon])
+async def read_weapons(
+    response: Response,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    filters: Tuple[List[str], dict] = Depends(weapon_filters),
+    order: Tuple[str, bool] = Depends(weapon_sort),
+    db: Session = Depends(get_db),
+):
+    """
+    Returns a list of Weapons with optional filtering and sorting.
+
+    Query examples:
+    - /weapons?skip=0&limit=20
+    - /weapons?type=Primary
+    - /weapons?name=Braton
+    - /weapons?min_mastery=10&sort=-mastery
+    - /weapons?min_damage=200&sort=-damage
+    - /weapons?type=Primary&sort=-dps
+    - /weapons?sort=-crit&cursor=<X-Next-Cursor from the previous page>
+    """
+
+    # ---- Base query ----
+    query = f"SELECT {Weapon.columns()} FROM [wf_base].[Weapons]"
+    conditions, params = filters
+    params.update(skip=skip, limit=limit)
+    order_column, descending = order
 
     # ---- Pagination ----
-    query += " OFFSET :skip ROWS FETCH NEXT :limit ROWS ONLY"
+    # Keyset: rows after the cursor's (sort value, WeaponId), so deep pages cost the same as the first
+    apply_cursor(cursor, conditions, params, order_column, "WeaponId", descending)
 
-    try:
-        # Debug prints (show up in your Uvicorn logs)
-        print("FINAL SQL (weapons):", query)
-        print("PARAMS (weapons):", params)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+
+    query += order_clause(order_column, "WeaponId", descending)
+    query += page_clause(db)
 
-        result = db.execute(text(query), params).fetchall()
+    try:
+        if snapshots.enabled:
+            result = await run_db(
+                snapshots.query, db, "weapons", conditions, params, order_column, descending, skip, limit
+            )
+            if result is not None:
+                set_next_cursor(response, result, order_column, "WeaponId", descending, limit)
+                return result
+
+        result = await run_db(catalogue_cache.fetchall, db, query, params)
+        set_next_cursor(response, result, order_column, "WeaponId", descending, limit)
         return result
 
     except Exception as e:
-        print("ERROR executing weapons query:", e)
+        logger.exception(f"Weapons query failed: {query} {params!r}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{weapon_id}", response_model=Weapon)
+async def read_weapon(weapon_id: int, db: Session = Depends(get_db)):
+    query = f"SELECT {Weapon.columns()} FROM [wf_base].[Weapons] WHERE WeaponId = :id"
+    result = await run_db(catalogue_cache.fetchone, db, query, {"id": weapon_id})
+    if result is None:
+        raise HTTPException(status_code=404, detail="Weapon not found")
+    return result
+
+
+@router.get("/{weapon_id}/raw")
+async def read_weapon_raw(weapon_id: int, db: Session = Depends(get_db)):
+    """The unprocessed warframestat record the row was loaded from."""
+    query = text("SELECT RawJson FROM [wf_base].[Weapons] WHERE WeaponId = :id")
+    result = await run_db(lambda: db.execute(query, {"id": weapon_id}).fetchone())
+    if result is None:
+        raise HTTPException(status_code=404, detail="Weapon not found")
+    return Response(content=result.RawJson or "null", media_type="application/json")
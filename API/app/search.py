@@ -0,0 +1,168 @@
+import logging
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+import numpy as np
+from sqlalchemy import text
+
+from .batch import CATALOGUE_TABLES, in_condition
+from .config import settings
+from .db import run_db
+from .snapshot import VersionedStore
+
+logger = logging.getLogger(__name__)
+
+NON_WORD = re.compile(r"[^\w]+")
+
+# Added to the trigram similarity (0..1) so prefix and exact matches rank first
+WORD_PREFIX_BONUS = 0.5
+NAME_PREFIX_BONUS = 0.5
+EXACT_BONUS = 1.0
+
+
+def normalize(name) -> str:
+    """Casefolded words separated by single spaces; punctuation and markup dropped."""
+    return " ".join(NON_WORD.sub(" ", str(name or "").casefold()).split())
+
+
+def trigrams(normalized: str) -> set:
+    """Trigrams of each word padded with two leading and one trailing space, as pg_trgm does."""
+    grams = set()
+    for word in normalized.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class SearchIndex:
+    """
+    Names of every live catalogue row, indexed three ways:
+    - a posting array of row positions per trigram, for typo-tolerant
+      matching by trigram similarity (shared / total distinct trigrams)
+    - every word, sorted, for word-prefix matches ("bra" -> "Braton")
+    - every full name, sorted, for name-prefix and exact matches
+    A query reads only the postings of its own trigrams and does two
+    binary searches per word; the rest is a few vector operations over one
+    score per name.
+    """
+
+    def __init__(self, entries):
+        # entries: (entity, id, name)
+        self.entities = np.array([entity for entity, _, _ in entries], dtype=object)
+        self.ids = np.array([row_id for _, row_id, _ in entries], dtype=np.int64)
+        self.names = [name for _, _, name in entries]
+        self.normalized = normalized = [normalize(name) for name in self.names]
+
+        postings = defaultdict(list)
+        self.gram_counts = np.zeros(len(entries))
+        for position, name in enumerate(normalized):
+            grams = trigrams(name)
+            self.gram_counts[position] = len(grams)
+            for gram in grams:
+                postings[gram].append(position)
+        self.postings = {gram: np.array(positions, dtype=np.int64) for gram, positions in postings.items()}
+
+        words = sorted((word, position) for position, name in enumerate(normalized) for word in name.split())
+        self.words = [word for word, _ in words]
+        self.word_positions = np.array([position for _, position in words], dtype=np.int64)
+        full_names = sorted((name, position) for position, name in enumerate(normalized))
+        self.full_names = [name for name, _ in full_names]
+        self.full_name_positions = np.array([position for _, position in full_names], dtype=np.int64)
+
+    def __len__(self):
+        return len(self.names)
+
+    def _prefixed(self, keys, positions, prefix):
+        """Positions whose sorted key starts with prefix."""
+        return positions[bisect_left(keys, prefix):bisect_left(keys, prefix + "\U0010ffff")]
+
+    def search(self, query, limit=20, entity=None, min_score=None):
+        """Best-first [(entity, id, name, score)] for a free-text query."""
+        min_score = settings.SEARCH_MIN_SCORE if min_score is None else min_score
+        normalized = normalize(query)
+        if not normalized or not len(self):
+            return []
+
+        grams = trigrams(normalized)
+        matched = [self.postings[gram] for gram in grams if gram in self.postings]
+        scores = np.zeros(len(self))
+        if matched:
+            shared = np.bincount(np.concatenate(matched), minlength=len(self))
+            scores += shared / (len(grams) + self.gram_counts - shared)
+
+        words = normalized.split()
+        for word in words:
+            scores[self._prefixed(self.words, self.word_positions, word)] += WORD_PREFIX_BONUS / len(words)
+        prefixed = self._prefixed(self.full_names, self.full_name_positions, normalized)
+        scores[prefixed] += NAME_PREFIX_BONUS
+        exact = bisect_left(self.full_names, normalized)
+        while exact < len(self.full_names) and self.full_names[exact] == normalized:
+            scores[self.full_name_positions[exact]] += EXACT_BONUS
+            exact += 1
+
+        if entity is not None:
+            scores[self.entities != entity] = -np.inf
+        hits = np.flatnonzero(scores >= min_score)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit)[:limit]]
+        # Ties go to the shorter name, then catalogue order
+        hits = hits[np.lexsort((hits, self.gram_counts[hits], -scores[hits]))]
+        return [(self.entities[i], int(self.ids[i]), self.names[i], round(float(scores[i]), 4)) for i in hits]
+
+    def containing(self, query, entity):
+        """
+        Ids of entity's names containing query, compared normalized (so case
+        and punctuation don't matter), or None if query has no words. Only
+        names holding every trigram inside the query's words are checked.
+        """
+        normalized = normalize(query)
+        if not normalized:
+            return None
+        candidates = np.flatnonzero(self.entities == entity)
+        for word in normalized.split():
+            for i in range(len(word) - 2):
+                candidates = np.intersect1d(candidates, self.postings.get(word[i:i + 3], candidates[:0]),
+                                            assume_unique=True)
+        return [int(self.ids[i]) for i in candidates if normalized in self.normalized[i]]
+
+
+class SearchIndexStore(VersionedStore):
+    def load(self, db):
+        entries = []
+        for entity, (table, _, key) in CATALOGUE_TABLES.items():
+            query = text(f"SELECT {key}, Name FROM {table} WHERE IsDeleted = 0 AND Name IS NOT NULL ORDER BY {key}")
+            entries += [(entity, row_id, name) for row_id, name in db.execute(query)]
+        return SearchIndex(entries)
+
+    def describe(self, index) -> str:
+        return f"search index of {len(index)} names"
+
+    def warm(self, get_session):
+        """Builds the index ahead of the first /search; a DB that isn't up yet just defers it."""
+        sessions = get_session()
+        try:
+            self.refresh(next(sessions))
+        except Exception as e:
+            logger.warning(f"Search index not built at startup ({e}); the first /search will build it.")
+        finally:
+            sessions.close()
+
+
+search_index = SearchIndexStore(version_poll=settings.CACHE_VERSION_POLL_SECONDS, ttl=settings.CACHE_TTL_SECONDS)
+
+
+async def name_condition(db, entity: str, key: str, name: str, params: dict) -> str:
+    """
+    The ?name= filter: "<key> IN (...)" with the ids of the rows whose name
+    contains name, looked up in the search index rather than scanning Name
+    with LIKE '%name%'. Falls back to LIKE when name has no words or
+    matches more than BATCH_MAX_IDS rows.
+    """
+    if search_index.refresh_due():
+        await run_db(search_index.refresh, db)
+    ids = search_index.value.containing(name, entity)
+    if ids is None or len(ids) > settings.BATCH_MAX_IDS:
+        params["name"] = f"%{name}%"
+        return "Name LIKE :name"
+    return in_condition(key, ids, params, prefix="name")
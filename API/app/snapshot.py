@@ -0,0 +1,191 @@
+import logging
+import numbers
+import re
+import threading
+import time
+
+import numpy as np
+from sqlalchemy import text
+
+from .cache import read_data_version
+from .config import settings
+from .models.warframe import Warframe
+from .models.weapon import Weapon
+
+logger = logging.getLogger(__name__)
+
+# entity -> (table, response model, key column)
+SNAPSHOT_TABLES = {
+    "warframes": ("[wf_base].[Warframes]", Warframe, "WarframeId"),
+    "weapons": ("[wf_base].[Weapons]", Weapon, "WeaponId"),
+}
+
+# The routers' conditions: "<Column> <op> :<param>"
+CONDITION = re.compile(r"^(\w+) (>=|<=|=|LIKE) :(\w+)$")
+# app.batch.in_condition's "<Column> IN (:id_0, :id_1, ...)", or "IN (NULL)" for no ids
+IN_CONDITION = re.compile(r"^(\w+) IN \(([^)]*)\)$")
+
+
+class TableSnapshot:
+    """
+    One table held as columns: float arrays (NaN for NULL) for numeric
+    columns, casefolded string arrays for text columns, plus a sort rank per
+    column. Text compares case-insensitively and NULLs sort first, like the
+    SQL Server collation.
+    """
+
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.numeric = {}
+        self.text = {}
+        self.ranks = {}
+        for column in columns:
+            values = [row[column] for row in rows]
+            if all(v is None or (isinstance(v, numbers.Number) and not isinstance(v, bool)) for v in values):
+                array = np.array([np.nan if v is None else float(v) for v in values], dtype=float)
+                self.numeric[column] = array
+                self.ranks[column] = np.where(np.isnan(array), -np.inf, array)
+            else:
+                folded = np.array(["" if v is None else str(v).casefold() for v in values], dtype=str)
+                nulls = np.array([v is None for v in values], dtype=bool)
+                _, order = np.unique(folded, return_inverse=True)
+                self.text[column] = folded
+                self.ranks[column] = np.where(nulls, -1, order).astype(float)
+
+    def query(self, conditions, params, order_column, descending, skip, limit):
+        """
+        Evaluates the router's WHERE conditions, ORDER BY and skip/limit.
+        Returns None for anything the snapshot can't answer, so the caller
+        falls back to SQL.
+        """
+        mask = np.ones(len(self.rows), dtype=bool)
+        for condition in conditions:
+            if condition == "IsDeleted = 0":
+                continue  # only live rows are loaded
+            match = IN_CONDITION.match(condition)
+            if match is not None and match.group(1) in self.numeric:
+                names = [name.strip().lstrip(":") for name in match.group(2).split(",") if name.strip() != "NULL"]
+                mask &= np.isin(self.numeric[match.group(1)], [params[name] for name in names])
+                continue
+            match = CONDITION.match(condition)
+            if match is None:
+                return None
+            column, op, param = match.groups()
+            value = params[param]
+            if op == "LIKE" and column in self.text:
+                mask &= np.char.find(self.text[column], value.strip("%").casefold()) >= 0
+            elif column in self.numeric and op != "LIKE":
+                array = self.numeric[column]
+                mask &= array >= value if op == ">=" else array <= value if op == "<=" else array == value
+            elif column in self.text and op == "=":
+                mask &= self.text[column] == str(value).casefold()
+            else:
+                return None
+
+        if order_column not in self.ranks:
+            return None
+        # Rows are held in key order, so the row position breaks ties like the routers' key tiebreaker
+        matches = np.flatnonzero(mask)
+        keys = self.ranks[order_column][matches]
+        matches = matches[np.lexsort((-matches, -keys) if descending else (matches, keys))]
+        return [self.rows[i] for i in matches[skip:skip + limit]]
+
+
+class VersionedStore:
+    """
+    A value built from the catalogue, loaded on first use and rebuilt when
+    [wf_base].[DataVersion] changes (checked at most every version_poll
+    seconds). Without a DataVersion table (migration 004 not applied) it is
+    rebuilt once it is ttl seconds old instead, like CatalogueCache entries
+    expire. A rebuild builds a complete new value and swaps it in with one
+    assignment, so requests never see a mix of versions; other requests
+    keep using the old value while it loads. Subclasses implement load().
+    """
+
+    def __init__(self, version_poll=5.0, ttl=300.0):
+        self.version_poll = version_poll
+        self.ttl = ttl
+        self.data_version = None
+        self._value = None
+        self._loaded_at = float("-inf")
+        self._version_missing = False
+        self._lock = threading.Lock()
+        self._version_checked = float("-inf")
+
+    @property
+    def value(self):
+        """The current value without checking the version (None before the first load)."""
+        return self._value
+
+    def refresh_due(self) -> bool:
+        return self._value is None or time.monotonic() - self._version_checked >= self.version_poll
+
+    def load(self, db):
+        raise NotImplementedError
+
+    def describe(self, value) -> str:
+        return type(self).__name__
+
+    def refresh(self, db):
+        loaded = self._value is not None
+        if loaded and time.monotonic() - self._version_checked < self.version_poll:
+            return
+        # Only the first load makes requests wait; later reloads run in one request at a time.
+        if not self._lock.acquire(blocking=not loaded):
+            return
+        try:
+            loaded = self._value is not None
+            if loaded and time.monotonic() - self._version_checked < self.version_poll:
+                return
+            self._version_checked = time.monotonic()
+            version = read_data_version(db)
+            if version is None and not self._version_missing:
+                logger.warning(f"No [wf_base].[DataVersion] table; {type(self).__name__} reloads every {self.ttl:g}s.")
+                self._version_missing = True
+            if loaded:
+                if version is None:
+                    if time.monotonic() - self._loaded_at < self.ttl:
+                        return
+                elif version == self.data_version:
+                    return
+            start = time.perf_counter()
+            value = self.load(db)
+            self._value = value
+            self.data_version = version
+            self._loaded_at = time.monotonic()
+            logger.info(f"Loaded {self.describe(value)} (data version {version}) in {time.perf_counter() - start:.2f}s.")
+        finally:
+            self._lock.release()
+
+    def get(self, db):
+        self.refresh(db)
+        return self._value
+
+
+class SnapshotStore(VersionedStore):
+    """In-memory copies of the SNAPSHOT_TABLES (see VersionedStore for reloading)."""
+
+    def __init__(self, version_poll=5.0, ttl=300.0, enabled=False):
+        super().__init__(version_poll, ttl)
+        self.enabled = enabled
+
+    def load(self, db):
+        tables = {}
+        for entity, (table, model, key) in SNAPSHOT_TABLES.items():
+            query = text(f"SELECT {model.columns()} FROM {table} WHERE IsDeleted = 0 ORDER BY {key}")
+            rows = [dict(row._mapping) for row in db.execute(query)]
+            tables[entity] = TableSnapshot(rows, list(model.model_fields))
+        return tables
+
+    def describe(self, tables) -> str:
+        return f"snapshot of {sum(len(snapshot.rows) for snapshot in tables.values())} rows"
+
+    def query(self, db, entity, conditions, params, order_column, descending, skip, limit):
+        return self.get(db)[entity].query(conditions, params, order_column, descending, skip, limit)
+
+
+snapshots = SnapshotStore(
+    version_poll=settings.CACHE_VERSION_POLL_SECONDS,
+    ttl=settings.CACHE_TTL_SECONDS,
+    enabled=settings.SNAPSHOT_ENABLED,
+)
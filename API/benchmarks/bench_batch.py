@@ -0,0 +1,158 @@
+"""
+Benchmark: rendering a page of loadouts with per-id lookups vs batch/expanded.
+
+Seeds the SQLite stand-in and renders one page of loadouts (every frame,
+weapon and arcane filled in) three ways:
+  - n+1:       GET /builds/loadouts, then each build row and each arcane
+               link looked up one at a time (the API has no build detail
+               routes, so these are direct queries), and every warframe,
+               weapon and arcane fetched with its own GET /{entity}/{id}
+  - batch:     the same build lookups, then one POST /batch for all the
+               catalogue items
+  - expanded:  one GET /builds/loadouts/expanded
+Counts HTTP requests and SQL statements (catalogue cache off) and checks
+that all three resolve the same items.
+
+Usage:
+    python API/benchmarks/bench_batch.py [--scale 10] [--page 50] [--repeat 5]
+"""
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+
+from app.cache import catalogue_cache
+from app.main import app
+
+WEAPON_SLOTS = {
+    "Primary": ("PrimaryBuildId", "MyPrimaryWeapons", "PrimaryWeaponArcanes"),
+    "Secondary": ("SecondaryBuildId", "MySecondaryWeapons", "SecondaryWeaponArcanes"),
+    "Melee": ("MeleeBuildId", "MyMeleeWeapons", "MeleeWeaponArcanes"),
+}
+
+
+class Counter:
+    def __init__(self, client):
+        self.client = client
+        self.requests = 0
+
+    def get(self, *args, **kwargs):
+        self.requests += 1
+        response = self.client.get(*args, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def post(self, *args, **kwargs):
+        self.requests += 1
+        response = self.client.post(*args, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+
+def resolve_builds(conn, loadouts):
+    """Per-row build lookups: (loadout id, warframe id, {slot: (weapon id, [arcane ids])})."""
+    resolved = []
+    for loadout in loadouts:
+        frame = conn.execute(text("SELECT WarframeId FROM [wf_user].[MyFrames] WHERE FrameBuildId = :id"),
+                             {"id": loadout["FrameBuildId"]}).fetchone()
+        slots = {}
+        for slot, (column, build_table, link_table) in WEAPON_SLOTS.items():
+            build = conn.execute(text(f"SELECT WeaponId FROM [wf_user].[{build_table}] WHERE WeaponBuildId = :id"),
+                                 {"id": loadout[column]}).fetchone()
+            links = conn.execute(text(f"SELECT ArcaneId FROM [wf_user].[{link_table}] WHERE WeaponBuildId = :id "
+                                      "ORDER BY SlotIndex"), {"id": loadout[column]}).fetchall()
+            slots[slot] = (build.WeaponId, [link.ArcaneId for link in links])
+        resolved.append((loadout["LoadoutId"], frame.WarframeId, slots))
+    return resolved
+
+
+def render_n_plus_one(api, conn, page):
+    loadouts = api.get("/builds/loadouts", params={"limit": page})
+    resolved = resolve_builds(conn, loadouts)
+    for _, warframe_id, slots in resolved:
+        api.get(f"/warframes/{warframe_id}")
+        for weapon_id, arcane_ids in slots.values():
+            api.get(f"/weapons/{weapon_id}")
+            for arcane_id in arcane_ids:
+                api.get(f"/arcanes/{arcane_id}")
+    return resolved
+
+
+def render_batch(api, conn, page):
+    loadouts = api.get("/builds/loadouts", params={"limit": page})
+    resolved = resolve_builds(conn, loadouts)
+    api.post("/batch", json={
+        "warframes": sorted({warframe_id for _, warframe_id, _ in resolved}),
+        "weapons": sorted({weapon_id for *_, slots in resolved for weapon_id, _ in slots.values()}),
+        "arcanes": sorted({a for *_, slots in resolved for _, arcane_ids in slots.values() for a in arcane_ids}),
+    })
+    return resolved
+
+
+def render_expanded(api, conn, page):
+    loadouts = api.get("/builds/loadouts/expanded", params={"limit": page})
+    return [
+        (loadout["LoadoutId"], loadout["Frame"]["Warframe"]["WarframeId"],
+         {slot: (loadout[slot]["Weapon"]["WeaponId"], [a["Arcane"]["ArcaneId"] for a in loadout[slot]["Arcanes"]])
+          for slot in WEAPON_SLOTS})
+        for loadout in loadouts
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Loadout rendering benchmark.")
+    parser.add_argument("--scale", type=float, default=10, help="Multiple of the live catalogue size.")
+    parser.add_argument("--page", type=int, default=50, help="Loadouts per page.")
+    parser.add_argument("--repeat", type=int, default=5, help="Renders per variant (median reported).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn, args.scale)
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = False
+        catalogue_cache.version_poll = float("inf")  # keep the DataVersion read out of the counts
+        client.get("/")
+
+        statements = 0
+
+        def count(*_):
+            nonlocal statements
+            statements += 1
+
+        event.listen(engine, "before_cursor_execute", count)
+
+        print(f"{'variant':<10}{'HTTP':>7}{'SQL':>7}{'ms':>9}")
+        expected = None
+        with engine.connect() as conn:
+            for label, render in (("n+1", render_n_plus_one), ("batch", render_batch),
+                                  ("expanded", render_expanded)):
+                timings = []
+                for _ in range(args.repeat):
+                    api = Counter(client)
+                    statements = 0
+                    start = time.perf_counter()
+                    resolved = render(api, conn, args.page)
+                    timings.append(time.perf_counter() - start)
+                expected = expected or resolved
+                assert resolved == expected, label
+                print(f"{label:<10}{api.requests:>7}{statements:>7}{statistics.median(timings) * 1000:>9.1f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark: catalogue cache under a dashboard-style polling load.
+
+Seeds the SQLite stand-in and replays a fixed mix of catalogue requests
+(warframe/weapon filter and sort combinations, mod and arcane pages) for a
+number of rounds, first with the cache disabled and then enabled. Reports
+per-request p50/p99, the cost of a cache hit on its own, and checks that
+bumping [wf_base].[DataVersion] (as load.py does) invalidates the cache.
+
+Usage:
+    python API/benchmarks/bench_cache.py [--scale 1] [--rounds 50]
+"""
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+
+from app.cache import catalogue_cache
+from app.main import app
+
+DASHBOARD = [
+    ("/warframes/", {}),
+    ("/warframes/", {"sort": "-armor", "limit": 20}),
+    ("/warframes/", {"min_health": 500, "sort": "shields"}),
+    ("/weapons/", {"type": "Primary"}),
+    ("/weapons/", {"min_crit": 0.3, "sort": "-crit", "limit": 50}),
+    ("/weapons/", {"sort": "-status"}),
+    ("/mods/", {"limit": 500}),
+    ("/arcanes/", {}),
+]
+
+
+def replay(client, rounds):
+    timings = []
+    for _ in range(rounds):
+        for path, params in DASHBOARD:
+            start = time.perf_counter()
+            client.get(path, params=params).raise_for_status()
+            timings.append(time.perf_counter() - start)
+    cuts = statistics.quantiles(timings, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000, len(timings) / sum(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Catalogue cache benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--rounds", type=int, default=50, help="Times the dashboard mix is replayed.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn, args.scale)
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        print(f"{'cache':<10}{'p50 ms':>9}{'p99 ms':>9}{'req/s':>9}")
+        for enabled in (False, True):
+            catalogue_cache.enabled = enabled
+            catalogue_cache.clear()
+            p50, p99, rps = replay(client, args.rounds)
+            print(f"{'on' if enabled else 'off':<10}{p50:>9.2f}{p99:>9.2f}{rps:>9.0f}")
+        print(client.get("/cache/stats").json())
+
+        # A hit on its own: no HTTP, no serialisation.
+        session = engine.connect()
+        query = "SELECT [ModId] FROM [wf_base].[Mods] WHERE IsDeleted = 0 ORDER BY Name LIMIT :limit OFFSET :skip"
+        params = {"skip": 0, "limit": 100}
+        catalogue_cache.fetchall(session, query, params)
+        start = time.perf_counter()
+        for _ in range(10000):
+            catalogue_cache.fetchall(session, query, params)
+        print(f"cache hit: {(time.perf_counter() - start) / 10000 * 1e6:.1f} µs")
+        session.close()
+
+        catalogue_cache.version_poll = 0
+        before = catalogue_cache.stats()
+        conn.execute("UPDATE [wf_base].[DataVersion] SET Version = Version + 1 WHERE Id = 1")
+        conn.commit()
+        client.get("/mods/", params={"limit": 500}).raise_for_status()
+        after = catalogue_cache.stats()
+        print(f"after version bump: data_version {before['data_version']} -> {after['data_version']}, "
+              f"invalidations {before['invalidations']} -> {after['invalidations']}, "
+              f"misses {before['misses']} -> {after['misses']}")
+
+        conn.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
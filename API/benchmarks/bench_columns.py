@@ -0,0 +1,89 @@
+"""
+Benchmark: GET /mods?limit=1000 with SELECT * vs the model's column list.
+
+Seeds the SQLite stand-in, points the app at it and measures, for both
+queries:
+  - db:   p50/p99 of the query alone and the bytes of column data fetched
+  - http: p50/p99 of the full request and the response body size
+
+Usage:
+    python API/benchmarks/bench_columns.py [--scale 1] [--requests 200]
+"""
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+import seed
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.main import app
+from app.models.mod import Mod
+
+
+def percentiles(timings):
+    cuts = statistics.quantiles(timings, n=100)
+    return cuts[49] * 1000, cuts[98] * 1000
+
+
+def fetched_bytes(rows):
+    return sum(len(str(value).encode("utf-8")) for row in rows for value in row if value is not None)
+
+
+def bench_db(engine, columns, requests):
+    query = text(f"SELECT {columns} FROM [wf_base].[Mods] WHERE IsDeleted = 0 ORDER BY Name LIMIT 1000")
+    timings = []
+    with engine.connect() as conn:
+        for _ in range(requests):
+            start = time.perf_counter()
+            rows = conn.execute(query).fetchall()
+            timings.append(time.perf_counter() - start)
+    return percentiles(timings), fetched_bytes(rows)
+
+
+def bench_http(client, requests):
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get("/mods/", params={"limit": 1000})
+        timings.append(time.perf_counter() - start)
+    response.raise_for_status()
+    return percentiles(timings), len(response.content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Column projection benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per variant.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn, args.scale)
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        variants = [("SELECT *", "*"), ("columns", Mod.columns())]
+        print(f"{'variant':<10}{'layer':<6}{'p50 ms':>9}{'p99 ms':>9}{'bytes':>12}")
+        for label, columns in variants:
+            (p50, p99), size = bench_db(engine, columns, args.requests)
+            print(f"{label:<10}{'db':<6}{p50:>9.2f}{p99:>9.2f}{size:>12,}")
+            with mock.patch.object(Mod, "columns", classmethod(lambda cls: columns)):
+                (p50, p99), size = bench_http(client, args.requests)
+            print(f"{label:<10}{'http':<6}{p50:>9.2f}{p99:>9.2f}{size:>12,}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark: throughput under many simultaneous slow queries.
+
+Seeds the SQLite stand-in, adds a fixed delay to every query to stand in
+for a slow SQL Server round trip, and drives GET /mods at several
+concurrency levels through an in-process ASGI client. Three handlers are
+compared:
+  - sync:      a plain `def` handler as the routers were written before,
+               running on FastAPI's shared threadpool
+  - executor:  the real /mods route (`async def` + db.run_db on the
+               bounded DB executor)
+  - aiosqlite: an `async def` handler on an async SQLAlchemy engine
+               (skipped if aiosqlite isn't installed)
+All three use a pool of DB_POOL_SIZE + DB_MAX_OVERFLOW connections. While
+each level runs, a probe requests GET / every 10 ms; its p99 shows whether
+the server stays responsive. Requests that fail (e.g. pool checkout
+timeouts) are counted as errors.
+
+On the sync engine the delay is a sleep before each cursor execute, in
+the thread calling the driver. The async engine's hooks run on the event
+loop, so there the delay is a SQL function that sleeps inside aiosqlite's
+worker thread.
+
+Usage:
+    python API/benchmarks/bench_concurrency.py [--latency-ms 20] [--levels 1,16,64,256] [--pool-timeout 5]
+"""
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import seed
+
+import httpx
+from fastapi import APIRouter, Depends
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.cache import catalogue_cache
+from app.config import settings
+from app.db import get_db, page_clause
+from app.main import app
+from app.models.mod import Mod
+
+POOL = {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT}
+MODS_QUERY = f"SELECT {Mod.columns()} FROM [wf_base].[Mods] WHERE IsDeleted = 0 ORDER BY Name"
+
+bench_router = APIRouter(prefix="/bench")
+async_engine = None
+
+
+@bench_router.get("/sync-mods", response_model=List[Mod])
+def read_mods_sync(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+    return db.execute(text(MODS_QUERY + page_clause(db)), {"skip": skip, "limit": limit}).fetchall()
+
+
+@bench_router.get("/aiosqlite-mods")
+async def read_mods_aiosqlite(skip: int = 0, limit: int = 100):
+    query = MODS_QUERY.replace("IsDeleted = 0", "IsDeleted = (SELECT bench_sleep())") + " LIMIT :limit OFFSET :skip"
+    async with async_engine.connect() as conn:
+        result = await conn.execute(text(query), {"skip": skip, "limit": limit})
+        return [dict(row._mapping) for row in result.fetchall()]
+
+
+def make_async_engine(path, latency):
+    """aiosqlite engine with the stand-in attached and a bench_sleep() SQL function."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", **POOL)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def attach(dbapi_conn, _):
+        cursor = dbapi_conn.cursor()
+        for schema in ("wf_base", "wf_user"):
+            cursor.execute("ATTACH DATABASE ? AS " + schema, (f"{Path(path).with_suffix('')}.{schema}.db",))
+        cursor.close()
+        dbapi_conn.create_function("bench_sleep", 0, lambda: time.sleep(latency) or 0)
+
+    return engine
+
+
+async def drive(client, path, concurrency, total):
+    latencies, probes = [], []
+    errors = 0
+    done = asyncio.Event()
+
+    async def worker(count):
+        nonlocal errors
+        for _ in range(count):
+            start = time.perf_counter()
+            response = await client.get(path, params={"limit": 100})
+            if response.status_code != 200:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    async def probe():
+        while not done.is_set():
+            start = time.perf_counter()
+            await client.get("/")
+            probes.append(time.perf_counter() - start)
+            await asyncio.sleep(0.01)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(total // concurrency) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await probe_task
+
+    probe_p99 = statistics.quantiles(probes, n=100)[98] if len(probes) > 1 else probes[0]
+    if len(latencies) < 2:
+        return len(latencies) / elapsed, float("nan"), float("nan"), probe_p99 * 1000, errors
+    cuts = statistics.quantiles(latencies, n=100)
+    return len(latencies) / elapsed, cuts[49] * 1000, cuts[98] * 1000, probe_p99 * 1000, errors
+
+
+async def run(levels, variants, requests):
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'handler':<11}{'conc':>6}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'probe p99':>11}{'errors':>8}")
+        for label, path in variants:
+            for concurrency in levels:
+                total = max(requests, concurrency * 4)
+                rps, p50, p99, probe, errors = await drive(client, path, concurrency, total)
+                print(f"{label:<11}{concurrency:>6}{rps:>9.0f}{p50:>9.1f}{p99:>9.1f}{probe:>11.1f}{errors:>8}")
+
+
+def main():
+    global async_engine
+    parser = argparse.ArgumentParser(description="Concurrent slow-query benchmark.")
+    parser.add_argument("--latency-ms", type=float, default=20, help="Delay added to every query.")
+    parser.add_argument("--levels", default="1,16,64,256", help="Comma-separated concurrency levels.")
+    parser.add_argument("--requests", type=int, default=200, help="Minimum requests per level.")
+    parser.add_argument("--pool-timeout", type=float, default=5, help="Seconds to wait for a pooled connection.")
+    args = parser.parse_args()
+
+    latency = args.latency_ms / 1000
+    POOL["pool_timeout"] = args.pool_timeout
+    levels = [int(level) for level in args.levels.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn)
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path, **POOL)
+        event.listen(engine, "before_cursor_execute", lambda *_: time.sleep(latency))
+        seed.use_engine(app, engine)
+        app.include_router(bench_router)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = False
+
+        variants = [("sync", "/bench/sync-mods"), ("executor", "/mods/")]
+        try:
+            async_engine = make_async_engine(path, latency)
+            variants.append(("aiosqlite", "/bench/aiosqlite-mods"))
+        except ImportError:
+            print("aiosqlite (or greenlet) not installed; skipping the async engine variant.")
+
+        print(f"{args.latency_ms:g} ms per query, pool of {POOL['pool_size'] + POOL['max_overflow']} connections, "
+              f"{args.pool_timeout:g}s checkout timeout")
+        asyncio.run(run(levels, variants, args.requests))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark: dashboard polling with and without If-None-Match.
+
+Seeds the SQLite stand-in and replays a dashboard that polls a fixed set
+of catalogue URLs over and over. One client always asks for the full body;
+the other keeps each URL's ETag and sends it back as If-None-Match. Both
+run with the catalogue cache off and on, and the benchmark counts
+requests/sec, bytes of response body and SQL statements executed.
+Halfway through each run the data version is bumped, as an ETL load would;
+the conditional client must then get fresh 200s, which is checked.
+
+Usage:
+    python API/benchmarks/bench_conditional.py [--scale 10] [--rounds 50]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.cache import catalogue_cache
+from app.main import app
+
+DASHBOARD = [
+    ("/weapons/", {"type": "Primary", "sort": "-crit", "limit": 50}),
+    ("/weapons/", {"sort": "-mastery", "limit": 100}),
+    ("/warframes/", {"sort": "-armor"}),
+    ("/mods/", {"limit": 200}),
+    ("/arcanes/", {}),
+    ("/mods/42", {}),
+]
+
+
+def poll(client, engine, rounds, conditional):
+    etags = {}
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    sent, full = 0, 0
+    start = time.perf_counter()
+    for round_number in range(rounds):
+        if round_number == rounds // 2:
+            with engine.begin() as conn:
+                conn.exec_driver_sql("UPDATE [wf_base].[DataVersion] SET Version = Version + 1 WHERE Id = 1")
+            catalogue_cache._version_checked = float("-inf")  # don't wait out the poll interval
+            etags_before = dict(etags)
+        for index, (path, params) in enumerate(DASHBOARD):
+            headers = {"If-None-Match": etags[index]} if conditional and index in etags else {}
+            response = client.get(path, params=params, headers=headers)
+            assert response.status_code in (200, 304), response.status_code
+            sent += len(response.content)
+            if response.status_code == 200:
+                full += 1
+                etags[index] = response.headers["etag"]
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", count)
+    if conditional:
+        assert all(etags[i] != etags_before[i] for i in etags), "stale ETag after the version bump"
+    return rounds * len(DASHBOARD) / elapsed, sent, full, statements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Conditional GET benchmark.")
+    parser.add_argument("--scale", type=float, default=10, help="Multiple of the live catalogue size.")
+    parser.add_argument("--rounds", type=int, default=50, help="Times the dashboard polls every URL.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn, args.scale)
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        logging.getLogger("app.cache").setLevel(logging.WARNING)
+
+        results = []
+        # The warframes/weapons routers print every query; keep that out of the output.
+        with contextlib.redirect_stdout(io.StringIO()):
+            for cache in (False, True):
+                for conditional in (False, True):
+                    catalogue_cache.enabled = cache
+                    catalogue_cache.clear()
+                    results.append((cache, conditional, *poll(client, engine, args.rounds, conditional)))
+
+        print(f"{args.rounds} rounds of {len(DASHBOARD)} URLs, data version bumped halfway")
+        print(f"{'cache':<7}{'client':<13}{'req/s':>8}{'body MB':>9}{'200s':>6}{'SQL stmts':>11}")
+        for cache, conditional, rps, sent, full, statements in results:
+            client_label = "conditional" if conditional else "full"
+            print(f"{'on' if cache else 'off':<7}{client_label:<13}{rps:>8.0f}{sent / 1e6:>9.2f}{full:>6}{statements:>11}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
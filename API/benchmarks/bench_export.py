@@ -0,0 +1,122 @@
+"""
+Benchmark: bulk catalogue download through paged /mods vs /export/mods.
+
+Seeds the SQLite stand-in with --rows mods and downloads all of them four
+ways:
+  - pages:     /mods?limit=1000, following X-Next-Cursor, as the analytics
+               jobs did
+  - one page:  a single /mods?limit=<rows>, fetched and validated in full
+  - ndjson:    /export/mods streamed from the cursor
+  - csv:       /export/mods?format=csv
+Requests go straight to the ASGI app and the body chunks are counted and
+dropped as they arrive, so only the server's memory is measured. Each
+variant runs twice: once for wall time and once under tracemalloc for the
+peak Python memory allocated while serving it.
+
+Usage:
+    python API/benchmarks/bench_export.py [--rows 100000]
+"""
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from urllib.parse import urlencode
+
+import seed
+
+from app.cache import catalogue_cache
+from app.main import app
+from app.pagination import NEXT_CURSOR_HEADER
+
+
+async def download(path, params):
+    """(status, bytes received, response headers) for one request, discarding the body."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "", "query_string": urlencode(params).encode(),
+        "headers": [(b"host", b"bench")], "server": ("bench", 80), "client": ("bench", 1),
+    }
+    sent = asyncio.Event()
+    response = {"status": None, "bytes": 0, "headers": {}}
+
+    async def receive():
+        if not sent.is_set():
+            sent.set()
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()  # the client never disconnects
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {k.decode().lower(): v.decode() for k, v in message["headers"]}
+        elif message["type"] == "http.response.body":
+            response["bytes"] += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return response["status"], response["bytes"], response["headers"]
+
+
+async def pages(rows):
+    total, requests, cursor = 0, 0, None
+    while True:
+        params = {"limit": 1000, **({"cursor": cursor} if cursor else {})}
+        status, size, headers = await download("/mods/", params)
+        assert status == 200, status
+        total, requests = total + size, requests + 1
+        cursor = headers.get(NEXT_CURSOR_HEADER.lower())
+        if cursor is None:
+            return total, requests
+
+
+async def single(path, params):
+    status, size, _ = await download(path, params)
+    assert status == 200, status
+    return size, 1
+
+
+def variants(rows):
+    return [
+        ("pages", lambda: pages(rows)),
+        ("one page", lambda: single("/mods/", {"limit": rows})),
+        ("ndjson", lambda: single("/export/mods", {})),
+        ("csv", lambda: single("/export/mods", {"format": "csv"})),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paged download vs streaming export benchmark.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Mods to seed and download.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        counts = seed.seed(conn, args.rows / seed.BASE_COUNTS["mods"])
+        conn.close()
+        print(f"{counts['mods']:,} mods")
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = False  # a cached 100k-row page would stay in memory
+
+        print(f"{'variant':<10}{'requests':>10}{'seconds':>9}{'MB sent':>9}{'peak MB':>9}")
+        for label, run in variants(counts["mods"]):
+            start = time.perf_counter()
+            size, requests = asyncio.run(run())
+            elapsed = time.perf_counter() - start
+
+            tracemalloc.start()
+            asyncio.run(run())
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{label:<10}{requests:>10}{elapsed:>9.2f}{size / 1e6:>9.1f}{peak / 1e6:>9.1f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
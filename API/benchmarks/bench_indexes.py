@@ -0,0 +1,103 @@
+"""
+Benchmark: router queries before and after DB/migrations/003_indexes.sql
+(plus the later index migrations mirrored in DB/sqlite_schema.sql).
+
+Seeds the SQLite stand-in without indexes, runs the queries the /warframes,
+/weapons, /mods, /arcanes and /builds routers issue (OFFSET/FETCH written as
+LIMIT/OFFSET), then creates the indexes and runs them again. Prints the
+median time and the EXPLAIN QUERY PLAN for each query on both sides.
+
+Usage:
+    python API/benchmarks/bench_indexes.py [--scale 100] [--repeat 20]
+"""
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+PAGE = " LIMIT 100 OFFSET 0"
+
+QUERIES = [
+    ("warframes default",
+     "SELECT * FROM [wf_base].[Warframes] WHERE IsDeleted = 0 ORDER BY Name" + PAGE, {}),
+    ("warframes min_armor sort -health",
+     "SELECT * FROM [wf_base].[Warframes] WHERE IsDeleted = 0 AND Armor >= :a ORDER BY Health DESC" + PAGE,
+     {"a": 300}),
+    ("warframes sort shields",
+     "SELECT * FROM [wf_base].[Warframes] WHERE IsDeleted = 0 ORDER BY Shields ASC" + PAGE, {}),
+    ("weapons type=Primary",
+     "SELECT * FROM [wf_base].[Weapons] WHERE IsDeleted = 0 AND Type = :t ORDER BY Name" + PAGE,
+     {"t": "Primary"}),
+    ("weapons min_crit sort -crit",
+     "SELECT * FROM [wf_base].[Weapons] WHERE IsDeleted = 0 AND CritChance >= :c ORDER BY CritChance DESC" + PAGE,
+     {"c": 0.45}),
+    ("weapons sort -status",
+     "SELECT * FROM [wf_base].[Weapons] WHERE IsDeleted = 0 ORDER BY StatusChance DESC" + PAGE, {}),
+    ("weapons sort -damage (persisted)",
+     "SELECT * FROM [wf_base].[Weapons] WHERE IsDeleted = 0 ORDER BY TotalDamage DESC" + PAGE, {}),
+    ("weapons sort -damage (computed)",
+     "SELECT * FROM [wf_base].[Weapons] WHERE IsDeleted = 0 ORDER BY Impact + Puncture + Slash DESC" + PAGE, {}),
+    ("mods list",
+     "SELECT * FROM [wf_base].[Mods] WHERE IsDeleted = 0 ORDER BY Name" + PAGE, {}),
+    ("arcanes list",
+     "SELECT * FROM [wf_base].[Arcanes] WHERE IsDeleted = 0 ORDER BY Name" + PAGE, {}),
+    ("UniqueName probe (ETL)",
+     "SELECT 1 FROM [wf_base].[Mods] WHERE UniqueName = :u", {"u": "/Lotus/Upgrades/Mods/Bench/Mod17"}),
+    ("loadouts by frame build",
+     "SELECT * FROM [wf_user].[Loadouts] WHERE FrameBuildId = :f", {"f": 7}),
+    ("builds using weapon",
+     "SELECT * FROM [wf_user].[MyPrimaryWeapons] WHERE WeaponId = :w", {"w": 42}),
+    ("loadouts latest",
+     "SELECT * FROM [wf_user].[Loadouts] ORDER BY CreatedAt DESC, LoadoutId DESC" + PAGE, {}),
+]
+
+
+def plan(conn, sql, params):
+    return "; ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params))
+
+
+def median_ms(conn, sql, params, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        conn.execute(sql, params).fetchall()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def measure(conn, repeat):
+    return {label: (median_ms(conn, sql, params, repeat), plan(conn, sql, params))
+            for label, sql, params in QUERIES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index migration benchmark.")
+    parser.add_argument("--scale", type=float, default=100, help="Multiple of the live catalogue size.")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query (median reported).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = seed.connect(Path(tmp) / "bench.db", indexes=False)
+        counts = seed.seed(conn, args.scale)
+        print("Seeded " + ", ".join(f"{name}={count:,}" for name, count in counts.items()))
+
+        before = measure(conn, args.repeat)
+        seed.create_indexes(conn)
+        after = measure(conn, args.repeat)
+        conn.close()
+
+    print(f"\n{'query':<36}{'before ms':>11}{'after ms':>10}{'speedup':>9}")
+    for label, _, _ in QUERIES:
+        b, a = before[label][0], after[label][0]
+        print(f"{label:<36}{b:>11.2f}{a:>10.2f}{b / a:>8.1f}x")
+
+    print("\nQuery plans")
+    for label, _, _ in QUERIES:
+        print(f"  {label}\n    before: {before[label][1]}\n    after:  {after[label][1]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: deep pages with OFFSET vs keyset cursors.
+
+Seeds the SQLite stand-in (with every seventh warframe's Energy set to NULL,
+so NULL sort values are covered) and, for a set of list routes and sort
+options, first walks every page by following X-Next-Cursor and checks the
+pages join up to the same rows, in the same order and without repeats, as
+paging with skip. Then times one page at increasing depths both ways: a
+page at skip=N has to read and discard N rows, a page fetched by cursor
+seeks straight to it.
+
+Usage:
+    python API/benchmarks/bench_keyset.py [--scale 100] [--limit 100] [--repeat 20]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+
+from app.cache import catalogue_cache
+from app.main import app
+from app.pagination import NEXT_CURSOR_HEADER
+
+# (label, path, params, key column)
+ROUTES = [
+    ("warframes -shields", "/warframes/", {"sort": "-shields"}, "WarframeId"),
+    ("warframes energy", "/warframes/", {"sort": "energy"}, "WarframeId"),
+    ("warframes -energy", "/warframes/", {"sort": "-energy"}, "WarframeId"),
+    ("weapons type", "/weapons/", {"sort": "type"}, "WeaponId"),
+    ("weapons -crit", "/weapons/", {"sort": "-crit", "type": "Primary"}, "WeaponId"),
+    ("mods", "/mods/", {}, "ModId"),
+    ("loadouts", "/builds/loadouts", {}, "LoadoutId"),
+]
+DEPTHS = [0, 0.1, 0.5, 0.9]
+
+
+def walk(client, path, params, limit, key, use_cursor):
+    """Every row's key, paging with skip or by following the cursor header."""
+    keys, cursor, skip = [], None, 0
+    while True:
+        page_params = dict(params, limit=limit)
+        if use_cursor:
+            if cursor:
+                page_params["cursor"] = cursor
+        else:
+            page_params["skip"] = skip
+        response = client.get(path, params=page_params)
+        response.raise_for_status()
+        rows = response.json()
+        keys += [row[key] for row in rows]
+        cursor, skip = response.headers.get(NEXT_CURSOR_HEADER), skip + limit
+        if len(rows) < limit:
+            return keys
+
+
+def cursor_at(client, path, params, offset):
+    """The cursor for the page starting at <offset>, built from the row before it."""
+    if offset == 0:
+        return None
+    response = client.get(path, params=dict(params, skip=offset - 1, limit=1))
+    return response.headers[NEXT_CURSOR_HEADER]
+
+
+def timed(client, path, params, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        client.get(path, params=params).raise_for_status()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OFFSET vs keyset pagination benchmark.")
+    parser.add_argument("--scale", type=float, default=100, help="Multiple of the live catalogue size.")
+    parser.add_argument("--limit", type=int, default=100, help="Page size.")
+    parser.add_argument("--repeat", type=int, default=20, help="Requests per timing (median reported).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        counts = seed.seed(conn, args.scale)
+        conn.execute("UPDATE [wf_base].[Warframes] SET Energy = NULL WHERE WarframeId % 7 = 0")
+        conn.execute("ANALYZE")
+        conn.commit()
+        conn.close()
+        print(f"Scale {args.scale}x: {counts['warframes']:,} warframes, {counts['weapons']:,} weapons, "
+              f"{counts['mods']:,} mods, {counts['loadouts']:,} loadouts")
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = False
+
+        results = []
+        # The warframes/weapons routers print every query; keep that out of the output.
+        with contextlib.redirect_stdout(io.StringIO()):
+            for label, route, params, key in ROUTES:
+                by_skip = walk(client, route, params, args.limit, key, use_cursor=False)
+                by_cursor = walk(client, route, params, args.limit, key, use_cursor=True)
+                assert by_cursor == by_skip, label
+                assert len(set(by_cursor)) == len(by_cursor), label
+
+                for depth in DEPTHS:
+                    offset = int(len(by_skip) * depth)
+                    cursor = cursor_at(client, route, params, offset)
+                    skip_ms = timed(client, route, dict(params, skip=offset, limit=args.limit), args.repeat)
+                    cursor_params = dict(params, limit=args.limit)
+                    if cursor:
+                        cursor_params["cursor"] = cursor
+                    cursor_ms = timed(client, route, cursor_params, args.repeat)
+                    results.append((label, offset, skip_ms, cursor_ms))
+
+        print(f"{'route':<20}{'offset':>9}{'skip ms':>10}{'cursor ms':>11}")
+        for label, offset, skip_ms, cursor_ms in results:
+            print(f"{label:<20}{offset:>9,}{skip_ms:>10.2f}{cursor_ms:>11.2f}")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
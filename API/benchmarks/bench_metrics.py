@@ -0,0 +1,96 @@
+"""
+Benchmark: what the metrics middleware and statement timing cost per request.
+
+Seeds the SQLite stand-in and replays a mix of catalogue routes (lists,
+single rows, filters, a 404) with the catalogue cache off, so every
+request reaches the database. Reports the per-request latency three ways:
+  - off:       METRICS_ENABLED off (middleware passes straight through)
+  - on:        request, response-size and per-statement histograms
+  - on + SQL:  as on, plus the X-Debug-SQL header (Server-Timing and a log
+               line per statement), with SQL_DEBUG_HEADER_ENABLED turned on
+Then it times rendering /metrics once the series are populated.
+
+Usage:
+    python API/benchmarks/bench_metrics.py [--scale 1] [--rounds 20]
+"""
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+
+from app.cache import catalogue_cache
+from app.config import settings
+from app.main import app
+from app.metrics import DEBUG_SQL_HEADER, metrics
+
+URLS = ["/warframes/", "/warframes/1", "/weapons/?weapon_type=Rifle", "/weapons/1", "/mods/?limit=50",
+        "/mods/17/ranks", "/arcanes/", "/weapons/999999999"]
+
+
+def percentile(values, fraction):
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def replay(client, rounds, headers=None):
+    timings = []
+    for _ in range(rounds):
+        for url in URLS:
+            start = time.perf_counter()
+            client.get(url, headers=headers)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Metrics overhead benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the route mix per variant.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn, args.scale)
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        metrics.instrument_engine(engine, "bench")
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        logging.getLogger("app.metrics").setLevel(logging.WARNING)  # time the header, not the terminal
+        catalogue_cache.enabled = False
+        settings.SQL_DEBUG_HEADER_ENABLED = True
+        client = TestClient(app)
+        replay(client, 2)  # warm up
+
+        print(f"{'variant':<12}{'requests':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+        for label, enabled, headers in (
+            ("off", False, None),
+            ("on", True, None),
+            ("on + SQL", True, {DEBUG_SQL_HEADER: "1"}),
+        ):
+            metrics.enabled = enabled
+            timings = replay(client, args.rounds, headers)
+            print(f"{label:<12}{len(timings):>9}{statistics.median(timings):>9.2f}"
+                  f"{percentile(timings, 0.95):>9.2f}{percentile(timings, 0.99):>9.2f}")
+
+        response = client.get("/metrics")
+        print(f"\nServer-Timing example: {client.get(URLS[2], headers={DEBUG_SQL_HEADER: '1'}).headers['Server-Timing']}")
+        timings = []
+        for _ in range(args.rounds):
+            start = time.perf_counter()
+            body = metrics.render()
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"/metrics: {len(body.splitlines()):,} lines, {len(body):,} bytes, "
+              f"rendered in {statistics.median(timings):.2f} ms (HTTP {response.status_code})")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
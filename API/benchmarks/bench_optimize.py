@@ -0,0 +1,108 @@
+"""
+Benchmark: /builds/optimize search time and quality.
+
+Seeds the SQLite stand-in (mods carry warframestat-style levelStats and
+baseDrain), builds the mod matrix once, then asks the optimiser for the
+top-k builds of every weapon, with and without slot polarities, and
+reports the per-weapon search time. On a cut-down mod pool small enough to
+enumerate, it also checks the beam search against an exhaustive search
+over every valid mod set.
+
+Usage:
+    python API/benchmarks/bench_optimize.py [--scale 1] [--k 5] [--weapons 200] [--verify 20]
+"""
+import argparse
+import itertools
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.models.weapon import Weapon
+from app.optimizer import COLUMN, ModMatrix, ModMatrixStore, final_stats, optimize
+
+POLARITIES = ["madurai", "madurai", "vazarin", "naramon"]
+
+
+def percentile(values, fraction):
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def exhaustive_best(matrix, weapon, slots, capacity):
+    """Best burst DPS over every valid mod set on neutral slots (drain is then order-independent)."""
+    rows = matrix.candidates(weapon["Type"])
+    best = 0.0
+    for size in range(1, slots + 1):
+        for combo in itertools.combinations(rows, size):
+            if matrix.drain[list(combo)].sum() > capacity or len(set(matrix.groups[list(combo)])) < size:
+                continue
+            totals = matrix.effects[list(combo)].sum(axis=0)
+            best = max(best, float(final_stats(weapon, lambda effect: totals[COLUMN[effect]])["FinalBurstDPS"]))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build optimiser benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--k", type=int, default=5, help="Builds returned per weapon.")
+    parser.add_argument("--weapons", type=int, default=200, help="Weapons timed.")
+    parser.add_argument("--verify", type=int, default=20, help="Weapons checked against exhaustive search.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        seed.seed(conn, args.scale)
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path)
+        with Session(engine) as db:
+            start = time.perf_counter()
+            matrix = ModMatrixStore().load(db)
+            print(f"mod matrix: {len(matrix.ids):,} mods with DPS effects, built in "
+                  f"{(time.perf_counter() - start) * 1000:.0f} ms")
+            weapons = [dict(row._mapping) for row in db.execute(text(
+                f"SELECT {Weapon.columns()} FROM [wf_base].[Weapons] ORDER BY WeaponId LIMIT :n"), {"n": args.weapons})]
+            mod_rows = db.execute(text(
+                "SELECT ModId, Name, ModType, Polarity, MaxRank, RawJson FROM [wf_base].[Mods] ORDER BY ModId LIMIT 60"
+            )).fetchall()
+        engine.dispose()
+
+    print(f"\n{'variant':<22}{'weapons':>8}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}")
+    for label, options in (
+        ("burst", {}),
+        ("sustained", {"objective": "sustained"}),
+        ("burst, polarised", {"polarities": POLARITIES}),
+        ("burst, capacity 30", {"capacity": 30}),
+    ):
+        timings = []
+        for weapon in weapons:
+            start = time.perf_counter()
+            builds = optimize(matrix, weapon, k=args.k, **options)
+            timings.append((time.perf_counter() - start) * 1000)
+            assert all(build["CapacityUsed"] <= options.get("capacity", 60) for build in builds)
+        print(f"{label:<22}{len(timings):>8}{statistics.median(timings):>9.1f}"
+              f"{percentile(timings, 0.95):>9.1f}{max(timings):>9.1f}")
+
+    if not args.verify:
+        return
+    # A 60-mod pool and 4 slots keep the exhaustive search to a few thousand sets per weapon
+    small = ModMatrix(mod_rows)
+    ratios = []
+    for weapon in weapons[:args.verify]:
+        best = exhaustive_best(small, weapon, 4, 30)
+        builds = optimize(small, weapon, k=1, capacity=30, slot_count=4)
+        ratios.append(builds[0]["FinalBurstDPS"] / best if best else 1.0)
+    exact = sum(np.isclose(ratios, 1.0))
+    print(f"\nbeam vs exhaustive ({len(small.ids)} mods, 4 slots, capacity 30): "
+          f"optimum found for {exact}/{len(ratios)} weapons, worst {min(ratios):.1%} of optimum")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Benchmark: rank-stat side tables against parsing RawJson per row.
+
+Seeds the SQLite stand-in (mods carry warframestat-style levelStats, and
+ModRankStats holds what the ETL parses from them) and answers two
+questions three ways:
+  - "mods with at least N% Critical Chance at some rank"
+  - "every stat of one mod at every rank"
+The ways are: the side table (the /mods?stat= subquery, which seeks
+IX_ModRankStats_Stat_Value, and /mods/{id}/ranks), json_each over RawJson
+in SQL (what OPENJSON does on SQL Server), and loading RawJson into Python
+and parsing it there. All three must agree. Also times both routes over
+HTTP with the catalogue cache off. First checks stats.rank_stat against
+PARSE_CASES, levelStats lines as warframestat serves them.
+
+Usage:
+    python API/benchmarks/bench_rank_stats.py [--scale 1] [--repeat 20]
+"""
+import argparse
+import json
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+import stats
+
+from fastapi.testclient import TestClient
+
+from app.cache import catalogue_cache
+from app.main import app
+
+STAT, MIN_VALUE = "Critical Chance", 100
+MOD_ID = 17
+
+FILTER_QUERIES = {
+    "side table": (
+        "SELECT ModId FROM [wf_base].[Mods] WHERE IsDeleted = 0 AND ModId IN "
+        "(SELECT ModId FROM [wf_base].[ModRankStats] WHERE Stat = :stat AND Value >= :min) ORDER BY ModId"
+    ),
+    "json_each": (
+        "SELECT DISTINCT m.ModId FROM [wf_base].[Mods] AS m, json_each(m.RawJson, '$.levelStats') AS level, "
+        "json_each(level.value, '$.stats') AS line "
+        "WHERE m.IsDeleted = 0 AND line.value LIKE '%% ' || :stat "
+        "AND CAST(ltrim(line.value, '+') AS REAL) >= :min ORDER BY m.ModId"
+    ),
+}
+RANK_QUERIES = {
+    "side table": ("SELECT Rank, Position, Stat, Value, Unit, Text FROM [wf_base].[ModRankStats] "
+                   "WHERE ModId = :id ORDER BY Rank, Position"),
+    "json_each": (
+        "SELECT level.key, line.key, line.value FROM [wf_base].[Mods] AS m, "
+        "json_each(m.RawJson, '$.levelStats') AS level, json_each(level.value, '$.stats') AS line "
+        "WHERE m.ModId = :id ORDER BY level.key, line.key"
+    ),
+}
+
+# (levelStats line, (Stat, Value, Unit))
+PARSE_CASES = [
+    ("+165% Damage", ("Damage", 165.0, "%")),
+    ("<DT_FIRE_COLOR>+90% Heat", ("Heat", 90.0, "%")),
+    ("+1.5x Critical Damage", ("Critical Damage", 1.5, "x")),
+    ("Combo Duration +5s", ("Combo Duration", 5.0, "s")),
+    ("+12s Bleed Duration", ("Bleed Duration", 12.0, "s")),
+    ("On Kill: +10% Damage for 12s", ("Damage", 10.0, "%")),
+    ("+40% Status Chance (x2 for Bows)", ("Status Chance", 40.0, "%")),
+    ("2.5 Energy Regen/s", ("Energy Regen/s", 2.5, None)),
+    ("+60 Shield Capacity", ("Shield Capacity", 60.0, None)),
+    ("+0.6 s Channeling", (None, None, None)),
+    ("On Kill: +10%", (None, None, None)),
+]
+
+
+def check_parser():
+    for line, expected in PARSE_CASES:
+        assert stats.rank_stat(line) == expected, f"rank_stat({line!r}) = {stats.rank_stat(line)}, not {expected}"
+
+
+def python_filter(conn):
+    ids = []
+    for mod_id, raw in conn.execute("SELECT ModId, RawJson FROM [wf_base].[Mods] WHERE IsDeleted = 0 ORDER BY ModId"):
+        rows = stats.rank_stats(json.loads(raw or "null").get("levelStats"))
+        if any(row["Stat"] == STAT and row["Value"] >= MIN_VALUE for row in rows):
+            ids.append(mod_id)
+    return ids
+
+
+def python_ranks(conn):
+    (raw,) = conn.execute("SELECT RawJson FROM [wf_base].[Mods] WHERE ModId = :id", {"id": MOD_ID}).fetchone()
+    return stats.rank_stats(json.loads(raw).get("levelStats"))
+
+
+def median_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rank-stat side table benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per variant (median reported).")
+    args = parser.parse_args()
+    params = {"stat": STAT, "min": MIN_VALUE, "id": MOD_ID}
+    check_parser()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        counts = seed.seed(conn, args.scale)
+        conn.execute("ANALYZE")
+        rank_rows = conn.execute("SELECT COUNT(*) FROM [wf_base].[ModRankStats]").fetchone()[0]
+        print(f"{counts['mods']:,} mods, {rank_rows:,} rank stats\n")
+
+        print(f"{'query':<30}{'variant':<12}{'ms':>9}{'rows':>7}")
+        for label, queries, python in (
+            (f"{STAT} >= {MIN_VALUE}", FILTER_QUERIES, python_filter),
+            (f"ranks of mod {MOD_ID}", RANK_QUERIES, python_ranks),
+        ):
+            results = {}
+            for variant, sql in queries.items():
+                ms, results[variant] = median_ms(lambda: conn.execute(sql, params).fetchall(), args.repeat)
+                print(f"{label:<30}{variant:<12}{ms:>9.2f}{len(results[variant]):>7}")
+            ms, results["python"] = median_ms(lambda: python(conn), args.repeat)
+            print(f"{label:<30}{'python':<12}{ms:>9.2f}{len(results['python']):>7}")
+            if python is python_filter:
+                assert [row[0] for row in results["side table"]] == results["python"], "variants disagree"
+            assert len({len(rows) for rows in results.values()}) == 1, "variants disagree"
+
+        print("\nplan: " + "; ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN " + FILTER_QUERIES["side table"], params)))
+        conn.close()
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = False
+        client = TestClient(app)
+        print(f"\n{'route':<52}{'HTTP ms':>9}")
+        for url in (f"/mods/?stat={STAT}&min_value={MIN_VALUE}", f"/mods/{MOD_ID}/ranks"):
+            ms, _ = median_ms(lambda: client.get(url).raise_for_status(), args.repeat)
+            print(f"{url:<52}{ms:>9.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark: /search against Name LIKE '%q%' on realistic names and typos.
+
+Seeds the SQLite stand-in and renames every warframe, weapon, mod and
+arcane to a Warframe-style name ("Braton Prime", "Primed Point Strike",
+...). Then it replays queries made from random names: the exact name, a
+prefix, one typo (a dropped, doubled, swapped or wrong letter) and two
+typos. For each kind it reports:
+  - index:  SearchIndex.search latency (p50/p95/p99) and whether the target
+            row is the first result or in the top 5 (for prefixes, which
+            many names share: whether the first / all top 5 results start
+            with the query)
+  - like:   the routers' Name LIKE '%q%' query per table, and whether it
+            finds the row at all
+  - http:   GET /search end to end (median)
+
+Usage:
+    python API/benchmarks/bench_search.py [--scale 1] [--queries 500]
+"""
+import argparse
+import logging
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.batch import CATALOGUE_TABLES
+from app.main import app
+from app.search import SearchIndexStore, normalize
+
+BASES = {
+    "warframes": ["Excalibur", "Rhino", "Mag", "Volt", "Loki", "Nova", "Nyx", "Saryn", "Trinity", "Valkyr",
+                  "Ember", "Frost", "Ash", "Banshee", "Mesa", "Nekros", "Oberon", "Vauban", "Wukong", "Zephyr"],
+    "weapons": ["Braton", "Soma", "Boltor", "Latron", "Paris", "Tigris", "Hek", "Lex", "Akbolto", "Kunai",
+                "Galatine", "Orthos", "Nikana", "Scindo", "Fragor", "Rubico", "Ignis", "Vectis", "Acceltra", "Kuva Zarr"],
+    "mods": ["Serration", "Split Chamber", "Point Strike", "Vital Sense", "Hornet Strike", "Pressure Point",
+             "Blood Rush", "Condition Overload", "Heavy Caliber", "Speed Trigger", "Hellfire", "Cryo Rounds",
+             "Infected Clip", "Stormbringer", "Magazine Warp", "Fast Hands", "Redirection", "Vitality", "Flow",
+             "Streamline"],
+    "arcanes": ["Energize", "Grace", "Guardian", "Avenger", "Fury", "Strike", "Velocity", "Rage", "Eruption",
+                "Nullifier", "Aegis", "Barrier", "Deflection", "Healing", "Pulse", "Momentum", "Precision",
+                "Resistance", "Trickery", "Ultimatum"],
+}
+PREFIXES = {"warframes": [""], "weapons": ["", "Kuva ", "Tenet ", "Prisma ", "Mk1-"],
+            "mods": ["", "Primed ", "Amalgam ", "Galvanized "], "arcanes": ["Arcane ", "Magus ", "Virtuos "]}
+SUFFIXES = {"warframes": ["", " Prime", " Umbra"], "weapons": ["", " Prime", " Vandal", " Wraith"],
+            "mods": [""], "arcanes": [""]}
+KINDS = ["exact", "prefix", "1 typo", "2 typos"]
+
+
+def catalogue_names(entity, count):
+    """count distinct names: every prefix/base/suffix combination, then numbered variants."""
+    names = [p + b + s for b in BASES[entity] for p in PREFIXES[entity] for s in SUFFIXES[entity]]
+    return [names[i % len(names)] + ("" if i < len(names) else f" {i // len(names) + 1}") for i in range(count)]
+
+
+def typo(name, rng):
+    i = rng.randrange(1, max(2, len(name) - 1))
+    edit = rng.choice(["drop", "double", "swap", "replace"])
+    if edit == "drop":
+        return name[:i] + name[i + 1:]
+    if edit == "double":
+        return name[:i] + name[i] + name[i:]
+    if edit == "swap" and i + 1 < len(name):
+        return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+    return name[:i] + rng.choice("aeiourstnl") + name[i + 1:]
+
+
+def make_query(name, kind, rng):
+    if kind == "exact":
+        return name
+    if kind == "prefix":
+        return name[:max(3, len(name) // 2)]
+    query = typo(name, rng)
+    return typo(query, rng) if kind == "2 typos" else query
+
+
+def percentile(values, fraction):
+    return sorted(values)[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Name search benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--queries", type=int, default=500, help="Queries per kind.")
+    args = parser.parse_args()
+    rng = random.Random(7)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        counts = seed.seed(conn, args.scale)
+        rows = []
+        for entity, (table, _, key) in CATALOGUE_TABLES.items():
+            names = catalogue_names(entity, counts[entity])
+            conn.executemany(f"UPDATE {table} SET Name = ? WHERE {key} = ?",
+                             ((name, i + 1) for i, name in enumerate(names)))
+            rows += [(entity, i + 1, name) for i, name in enumerate(names)]
+        conn.commit()
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        with engine.connect() as db:
+            start = time.perf_counter()
+            index = SearchIndexStore().load(db)
+            print(f"index: {len(index):,} names built in {(time.perf_counter() - start) * 1000:.0f} ms\n")
+
+            print(f"{'query':<9}{'p50 us':>8}{'p95 us':>8}{'p99 us':>8}{'top 1':>7}{'top 5':>7}"
+                  f"{'LIKE ms':>9}{'LIKE found':>12}{'HTTP ms':>9}")
+            with TestClient(app) as client:  # runs the lifespan, which builds the app's own index
+                for kind in KINDS:
+                    targets = [rng.choice(rows) for _ in range(args.queries)]
+                    queries = [make_query(name, kind, rng) for _, _, name in targets]
+                    timings, top1, top5 = [], 0, 0
+                    for (entity, row_id, _), query in zip(targets, queries):
+                        start = time.perf_counter()
+                        results = index.search(query, limit=5)
+                        timings.append((time.perf_counter() - start) * 1e6)
+                        if kind == "prefix":
+                            # Many names share a prefix, so count results that start with it
+                            found = [normalize(name).startswith(normalize(query)) for _, _, name, _ in results]
+                            top1 += found[:1] == [True]
+                            top5 += bool(found) and all(found)
+                        else:
+                            found = [(e, i) for e, i, _, _ in results]
+                            top1 += found[:1] == [(entity, row_id)]
+                            top5 += (entity, row_id) in found
+
+                    like_timings, like_found = [], 0
+                    for (entity, row_id, _), query in list(zip(targets, queries))[:50]:
+                        table, _, key = CATALOGUE_TABLES[entity]
+                        start = time.perf_counter()
+                        ids = db.execute(text(f"SELECT {key} FROM {table} WHERE IsDeleted = 0 AND Name LIKE :name"),
+                                         {"name": f"%{query}%"}).scalars().all()
+                        like_timings.append((time.perf_counter() - start) * 1000)
+                        like_found += row_id in ids
+
+                    http_timings = []
+                    for query in queries[:50]:
+                        start = time.perf_counter()
+                        client.get("/search/", params={"q": query, "limit": 5}).raise_for_status()
+                        http_timings.append((time.perf_counter() - start) * 1000)
+
+                    print(f"{kind:<9}{statistics.median(timings):>8.0f}{percentile(timings, 0.95):>8.0f}"
+                          f"{percentile(timings, 0.99):>8.0f}{top1 / len(targets):>7.0%}{top5 / len(targets):>7.0%}"
+                          f"{statistics.median(like_timings):>9.2f}{like_found / len(like_timings):>12.0%}"
+                          f"{statistics.median(http_timings):>9.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
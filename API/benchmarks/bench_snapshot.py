@@ -0,0 +1,135 @@
+"""
+Benchmark: /warframes and /weapons from NumPy snapshots vs SQL.
+
+Seeds the SQLite stand-in and replays randomised filter/sort/paging
+combinations against both endpoints, first through SQL (catalogue cache
+off, so every request runs its query) and then from the snapshot. Checks
+that both paths return the same rows in the same sort order, then reports
+requests/sec through the app and the cost of the query step on its own.
+
+Usage:
+    python API/benchmarks/bench_snapshot.py [--scale 10] [--requests 500]
+"""
+import argparse
+import contextlib
+import io
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import seed
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.cache import catalogue_cache
+from app.main import app
+from app.models.weapon import Weapon
+from app.snapshot import snapshots
+
+WARFRAME_SORTS = ["name", "armor", "health", "shields", "energy", "sprintspeed"]
+WEAPON_SORTS = ["name", "type", "mastery", "crit", "status"]
+
+
+def random_request(rng):
+    if rng.random() < 0.5:
+        params = {"sort": rng.choice(["", "-"]) + rng.choice(WARFRAME_SORTS)}
+        for field, low, high in (("armor", 65, 600), ("health", 270, 1100), ("shields", 0, 640)):
+            if rng.random() < 0.3:
+                params[f"min_{field}"] = rng.randint(low, high)
+        path = "/warframes/"
+    else:
+        params = {"sort": rng.choice(["", "-"]) + rng.choice(WEAPON_SORTS)}
+        if rng.random() < 0.5:
+            params["type"] = rng.choice(["Primary", "Secondary", "Melee"])
+        if rng.random() < 0.3:
+            params["min_crit"] = round(rng.uniform(0.02, 0.5), 2)
+        if rng.random() < 0.3:
+            params["max_status"] = round(rng.uniform(0.02, 0.5), 2)
+        if rng.random() < 0.2:
+            params["min_mastery"] = rng.randint(0, 16)
+        path = "/weapons/"
+    if rng.random() < 0.2:
+        params["name"] = str(rng.randint(1, 99))
+    params["skip"] = rng.choice([0, 0, 0, 50, 200])
+    params["limit"] = rng.choice([20, 50, 100])
+    return path, params
+
+
+def sort_values(rows, params):
+    field = params["sort"].lstrip("-")
+    column = {"mastery": "MasteryRank", "crit": "CritChance", "status": "StatusChance",
+              "sprintspeed": "SprintSpeed"}.get(field, field.capitalize())
+    return [row[column] for row in rows]
+
+
+def replay(client, requests):
+    start = time.perf_counter()
+    bodies = []
+    for path, params in requests:
+        response = client.get(path, params=params)
+        response.raise_for_status()
+        bodies.append(response.json())
+    return len(requests) / (time.perf_counter() - start), bodies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snapshot serving benchmark.")
+    parser.add_argument("--scale", type=float, default=10, help="Multiple of the live catalogue size.")
+    parser.add_argument("--requests", type=int, default=500, help="Randomised requests per path.")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    requests = [random_request(rng) for _ in range(args.requests)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        counts = seed.seed(conn, args.scale)
+        conn.close()
+        print(f"Scale {args.scale}x: {counts['warframes']:,} warframes, {counts['weapons']:,} weapons")
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        client = TestClient(app)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = False
+
+        # The SQL path prints every query; keep that out of the timings' output.
+        with contextlib.redirect_stdout(io.StringIO()):
+            snapshots.enabled = False
+            sql_rps, sql_bodies = replay(client, requests)
+            snapshots.enabled = True
+            replay(client, requests[:1])  # loads the snapshot
+            snap_rps, snap_bodies = replay(client, requests)
+
+        for (_, params), sql_rows, snap_rows in zip(requests, sql_bodies, snap_bodies):
+            assert len(sql_rows) == len(snap_rows), params
+            assert sort_values(sql_rows, params) == sort_values(snap_rows, params), params
+
+        print(f"{'path':<10}{'req/s':>9}")
+        print(f"{'sql':<10}{sql_rps:>9.0f}")
+        print(f"{'snapshot':<10}{snap_rps:>9.0f}")
+
+        # The query step alone: one SQL round trip vs one vectorised snapshot lookup.
+        with engine.connect() as db:
+            conditions = ["IsDeleted = 0", "Type = :type", "CritChance >= :min_crit"]
+            params = {"type": "Primary", "min_crit": 0.3, "skip": 0, "limit": 100}
+            sql = text(f"SELECT {Weapon.columns()} FROM [wf_base].[Weapons] WHERE " + " AND ".join(conditions)
+                       + " ORDER BY CritChance DESC LIMIT :limit OFFSET :skip")
+            for label, run in (
+                ("sql", lambda: db.execute(sql, params).fetchall()),
+                ("snapshot", lambda: snapshots.query(db, "weapons", conditions, params, "CritChance", True, 0, 100)),
+            ):
+                start = time.perf_counter()
+                for _ in range(200):
+                    run()
+                print(f"query step ({label}): {(time.perf_counter() - start) / 200 * 1000:.3f} ms")
+
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
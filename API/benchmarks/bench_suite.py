@@ -0,0 +1,256 @@
+"""
+Benchmark: every router at fixed concurrency levels, with a regression check.
+
+Seeds the SQLite stand-in ([wf_base] and [wf_user]) at --scale and drives a
+fixed set of scenarios through an in-process ASGI client: /warframes with
+filter and sort combinations, /weapons, /mods, /arcanes, /builds/* (the
+optimiser with a 50 ms budget), /batch, /search and an export. Each
+scenario runs at each concurrency level, --rounds times; ids in the paths
+are drawn at random from the seeded rows. Reports requests per second
+(median of the rounds), p50/p95/p99 latency, errors (any non-2xx) and the
+process peak RSS while the scenario ran. The catalogue cache is off unless
+--cache is given.
+
+Results are written to --output as JSON. With --baseline <earlier output>,
+each scenario and level is compared with the baseline and flagged when its
+req/s falls, or its p95 rises, by more than --threshold and beyond the
+spread of the baseline's rounds, or when it has more errors; the exit
+status is 1 if anything regressed.
+
+Usage:
+    python API/benchmarks/bench_suite.py [--scale 1] [--levels 1,8,32] [--requests 100] [--rounds 3]
+        [--only warframes] [--output bench_suite.json] [--baseline baseline.json] [--threshold 0.2]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import seed
+import report  # ETL/Scripts/report.py, on the path via seed
+
+import httpx
+
+from app.cache import catalogue_cache
+from app.main import app
+
+# (name, method, path, JSON body). {warframes}, {weapons}, ... become a random seeded id.
+SCENARIOS = [
+    ("warframes", "GET", "/warframes/", None),
+    ("warframes armor+health", "GET", "/warframes/?min_armor=150&max_health=640", None),
+    ("warframes sort -armor", "GET", "/warframes/?sort=-armor", None),
+    ("warframes shields, sort -health", "GET", "/warframes/?min_shields=180&sort=-health&limit=50", None),
+    ("warframes name", "GET", "/warframes/?name=Frame 1", None),
+    ("warframe by id", "GET", "/warframes/{warframes}", None),
+    ("weapons", "GET", "/weapons/", None),
+    ("weapons type, sort -dps", "GET", "/weapons/?type=Primary&sort=-dps", None),
+    ("weapons damage+crit", "GET", "/weapons/?min_damage=60&min_crit=0.25&sort=-crit", None),
+    ("weapon by id", "GET", "/weapons/{weapons}", None),
+    ("mods", "GET", "/mods/", None),
+    ("mods stat filter", "GET", "/mods/?stat=Critical Chance&min_value=100", None),
+    ("mod by id", "GET", "/mods/{mods}", None),
+    ("mod ranks", "GET", "/mods/{mods}/ranks", None),
+    ("arcanes", "GET", "/arcanes/", None),
+    ("arcane by id", "GET", "/arcanes/{arcanes}", None),
+    ("builds frames", "GET", "/builds/frames", None),
+    ("builds loadouts", "GET", "/builds/loadouts", None),
+    ("builds loadouts expanded", "GET", "/builds/loadouts/expanded?limit=20", None),
+    ("builds loadout expanded", "GET", "/builds/loadouts/{loadouts}/expanded", None),
+    ("builds optimize", "GET", "/builds/optimize?weapon_id={weapons}&budget_ms=50", None),
+    ("batch", "POST", "/batch", {"warframes": [1, 2, 3], "weapons": list(range(1, 21)), "mods": list(range(1, 51))}),
+    ("search", "GET", "/search/?q=wepon 12&limit=5", None),
+    ("export arcanes", "GET", "/export/arcanes", None),
+]
+
+
+def percentiles(latencies):
+    """The 99 cut points of latencies (seconds), or None if there are none."""
+    if not latencies:
+        return None
+    return statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+
+
+def percentile_ms(cuts, p):
+    return round(cuts[p - 1] * 1000, 3) if cuts else None
+
+
+def fill(path, counts, rng):
+    return path.format(**{entity: rng.randint(1, count) for entity, count in counts.items()})
+
+
+async def drive(client, scenario, concurrency, total, counts, rng):
+    """Sends total requests from concurrency workers; returns (latencies, errors, elapsed)."""
+    _, method, path, body = scenario
+    latencies, errors = [], 0
+    remaining = total
+
+    async def worker():
+        nonlocal errors, remaining
+        while remaining > 0:
+            remaining -= 1
+            url = fill(path, counts, rng)
+            start = time.perf_counter()
+            response = await client.request(method, url, json=body)
+            elapsed = time.perf_counter() - start
+            if response.is_success:
+                latencies.append(elapsed)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def measure(client, scenario, concurrency, total, rounds, counts, rng):
+    """
+    One result row: the median req/s of `rounds` runs and latency
+    percentiles over every request of every round. Each round's req/s and
+    p95 are kept too, so compare() can tell a shift from run-to-run noise.
+    """
+    report.reset_peak_memory()
+    latencies, errors, rates, p95s = [], 0, [], []
+    for _ in range(rounds):
+        round_latencies, round_errors, elapsed = await drive(client, scenario, concurrency, total, counts, rng)
+        latencies += round_latencies
+        errors += round_errors
+        rates.append(round(len(round_latencies) / elapsed, 1))
+        p95s.append(percentile_ms(percentiles(round_latencies), 95))
+
+    cuts = percentiles(latencies)
+    peak = report.peak_memory_mb()
+    return {
+        "scenario": scenario[0],
+        "concurrency": concurrency,
+        "requests": total * rounds,
+        "errors": errors,
+        "rps": round(statistics.median(rates), 1),
+        "p50_ms": percentile_ms(cuts, 50),
+        "p95_ms": percentile_ms(cuts, 95),
+        "p99_ms": percentile_ms(cuts, 99),
+        "peak_rss_mb": round(peak, 1) if peak is not None else None,
+        "rps_rounds": rates,
+        "p95_ms_rounds": p95s,
+    }
+
+
+async def run(scenarios, levels, requests, rounds, warmup, counts):
+    rng = random.Random(7)
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+        for scenario in scenarios:
+            await drive(client, scenario, 1, warmup, counts, rng)  # builds the search index, mod matrix, ...
+        print(f"{'scenario':<34}{'conc':>5}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>7}{'peak MB':>9}")
+        for scenario in scenarios:
+            for concurrency in levels:
+                row = await measure(client, scenario, concurrency, max(requests, concurrency), rounds, counts, rng)
+                results.append(row)
+                print(f"{row['scenario']:<34}{concurrency:>5}{row['rps']:>9.0f}{row['p50_ms']:>9.2f}"
+                      f"{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['errors']:>7}{row['peak_rss_mb'] or 0:>9.1f}")
+    return results
+
+
+def regressed(row, old, threshold):
+    """
+    Worse than the baseline by more than threshold, and outside the spread
+    of the baseline's rounds (every new round slower than every old one), so
+    a noisy machine doesn't flag unchanged code. More errors always count.
+    """
+    if row["errors"] > old["errors"]:
+        return True
+    slower = (row["rps"] < old["rps"] * (1 - threshold)
+              and max(row["rps_rounds"]) < min(old["rps_rounds"]))
+    p95s, old_p95s = [p for p in row["p95_ms_rounds"] if p], [p for p in old["p95_ms_rounds"] if p]
+    laggier = (row["p95_ms"] > old["p95_ms"] * (1 + threshold)
+               and bool(p95s and old_p95s) and min(p95s) > max(old_p95s))
+    return slower or laggier
+
+
+def compare(results, baseline, threshold):
+    """Prints each result against the baseline; returns the regressed (scenario, concurrency) pairs."""
+    base = {(row["scenario"], row["concurrency"]): row for row in baseline["results"]}
+    regressions = []
+    print(f"\n{'vs baseline':<34}{'conc':>5}{'req/s':>9}{'change':>8}{'p95 ms':>9}{'change':>8}  ")
+    for row in results:
+        old = base.get((row["scenario"], row["concurrency"]))
+        if old is None or not old["rps"] or not old["p95_ms"]:
+            continue
+        rps_change = row["rps"] / old["rps"] - 1
+        p95_change = row["p95_ms"] / old["p95_ms"] - 1
+        flagged = regressed(row, old, threshold)
+        if flagged:
+            regressions.append((row["scenario"], row["concurrency"]))
+        print(f"{row['scenario']:<34}{row['concurrency']:>5}{row['rps']:>9.0f}{rps_change:>+8.0%}"
+              f"{row['p95_ms']:>9.2f}{p95_change:>+8.0%}  {'REGRESSION' if flagged else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API load benchmark suite.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--levels", default="1,8,32", help="Comma-separated concurrency levels.")
+    parser.add_argument("--requests", type=int, default=100, help="Requests per scenario, level and round.")
+    parser.add_argument("--rounds", type=int, default=3, help="Runs per scenario and level (median req/s kept).")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests per scenario first.")
+    parser.add_argument("--only", help="Only scenarios whose name contains this.")
+    parser.add_argument("--cache", action="store_true", help="Leave the catalogue cache on.")
+    parser.add_argument("--output", default="bench_suite.json", help="JSON results file.")
+    parser.add_argument("--baseline", help="Earlier --output to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Fractional req/s drop or p95 rise that counts as a regression.")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.levels.split(",")]
+    scenarios = [scenario for scenario in SCENARIOS if not args.only or args.only in scenario[0]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        conn = seed.connect(path)
+        counts = seed.seed(conn, args.scale)
+        conn.execute("ANALYZE")
+        conn.close()
+        counts = {entity: counts[entity] for entity in ("warframes", "weapons", "mods", "arcanes", "loadouts")}
+
+        engine = seed.sqlalchemy_engine(path)
+        seed.use_engine(app, engine)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        catalogue_cache.enabled = args.cache
+        print(f"scale {args.scale:g}x, levels {args.levels}, {args.rounds} x {args.requests} requests each, "
+              f"cache {'on' if args.cache else 'off'}\n")
+        results = asyncio.run(run(scenarios, levels, args.requests, args.rounds, args.warmup, counts))
+        engine.dispose()
+
+    output = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "levels": levels,
+        "requests": args.requests,
+        "rounds": args.rounds,
+        "cache": args.cache,
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(output, indent=2), encoding="utf-8")
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if (baseline.get("scale"), baseline.get("cache")) != (args.scale, args.cache):
+            print(f"Warning: baseline ran at scale {baseline.get('scale')}, cache {baseline.get('cache')}.")
+        regressions = compare(results, baseline, args.threshold)
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}.")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Seeded SQLite stand-in for the API benchmarks.
+
+Builds DB/sqlite_schema.sql ([wf_base] and [wf_user] as attached databases)
+and fills it with deterministic synthetic rows. Scale 1 matches the live
+catalogue size (114 warframes, 595 weapons, 1751 mods, 162 arcanes) plus a
+few hundred user builds and loadouts.
+"""
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+API_DIR = Path(__file__).resolve().parents[1]
+SCHEMA_FILE = API_DIR.parent / "DB" / "sqlite_schema.sql"
+
+sys.path.append(str(API_DIR))
+# Keeps app.db from building the SQL Server engine (and loading pyodbc) on import
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+# Derived weapon stats and mod rank stats come from the ETL's own code, as in a real load
+sys.path.append(str(API_DIR.parent / "ETL" / "Scripts"))
+import stats
+
+BASE_COUNTS = {"warframes": 114, "weapons": 595, "mods": 1751, "arcanes": 162, "builds": 100, "loadouts": 200}
+
+WEAPON_TYPES = ["Primary", "Secondary", "Melee"]
+MOD_TYPES = ["Warframe Mod", "Rifle Mod", "Pistol Mod", "Melee Mod", "Shotgun Mod"]
+POLARITIES = ["madurai", "vazarin", "naramon", "zenurik", "unairu", "penjaga", "umbra"]
+RAW_JSON = '{"description": "' + "Lorem ipsum dolor sit amet " * 20 + '"}'
+# (levelStats stat, percent per rank) for seeded mods
+MOD_STATS = [
+    ("Damage", 15), ("Multishot", 15), ("Critical Chance", 25), ("Critical Damage", 15), ("Fire Rate", 10),
+    ("Attack Speed", 5), ("Magazine Capacity", 5), ("Reload Speed", 5), ("Status Chance", 15),
+    ("<DT_IMPACT_COLOR>Impact", 20), ("<DT_SLASH_COLOR>Slash", 20), ("<DT_FIRE_COLOR>Heat", 15),
+    ("<DT_FREEZE_COLOR>Cold", 15), ("Zoom", 10),
+]
+
+
+def mod_raw_json(rng, max_rank):
+    """warframestat-shaped mod record with one or two stats per rank, as app/optimizer.py reads them."""
+    stats = rng.sample(MOD_STATS, rng.choice([1, 1, 2]))
+    return json.dumps({
+        "description": "Lorem ipsum dolor sit amet " * 4,
+        "baseDrain": rng.randint(2, 10),
+        "levelStats": [{"stats": [f"+{per_rank * (rank + 1)}% {name}" for name, per_rank in stats]}
+                       for rank in range(max_rank + 1)],
+    })
+
+
+def schema_statements(kind=None):
+    """
+    Statements from the stand-in schema. kind="index" selects just the
+    CREATE INDEX statements, kind="table" everything else.
+    """
+    script = re.sub(r"/\*.*?\*/|--[^\n]*", "", SCHEMA_FILE.read_text(encoding="utf-8"), flags=re.S)
+    statements = [s.strip() for s in script.split(";") if s.strip()]
+    if kind == "table":
+        return [s for s in statements if "INDEX" not in s]
+    if kind == "index":
+        return [s for s in statements if "INDEX" in s]
+    return statements
+
+
+def connect(path=":memory:", indexes=True):
+    """
+    Opens the stand-in with [wf_base] and [wf_user] attached next to <path>
+    (or in memory) and creates the tables, plus the indexes unless
+    indexes=False.
+    """
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    for schema in ("wf_base", "wf_user"):
+        schema_path = ":memory:" if str(path) == ":memory:" else f"{Path(path).with_suffix('')}.{schema}.db"
+        conn.execute("ATTACH DATABASE ? AS " + schema, (schema_path,))
+    for statement in schema_statements(None if indexes else "table"):
+        conn.execute(statement)
+    conn.commit()
+    return conn
+
+
+def create_indexes(conn):
+    for statement in schema_statements("index"):
+        conn.execute(statement)
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def sqlalchemy_engine(path, **options):
+    """SQLAlchemy engine on an existing stand-in, attaching the schemas on every connection."""
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False}, **options)
+
+    @event.listens_for(engine, "connect")
+    def attach(dbapi_conn, _):
+        for schema in ("wf_base", "wf_user"):
+            dbapi_conn.execute("ATTACH DATABASE ? AS " + schema, (f"{Path(path).with_suffix('')}.{schema}.db",))
+
+    return engine
+
+
+def use_engine(app, engine):
+    """Points the app's get_db dependency at <engine>."""
+    from sqlalchemy.orm import sessionmaker
+    from app.db import get_db
+
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    def get_bench_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = get_bench_db
+
+
+def counts_for(scale):
+    return {name: max(1, int(count * scale)) for name, count in BASE_COUNTS.items()}
+
+
+def seed(conn, scale=1, seed=42):
+    """Fills an empty stand-in. Returns the row count per entity."""
+    rng = random.Random(seed)
+    counts = counts_for(scale)
+    now = "2025-01-01 00:00:00"
+
+    conn.executemany(
+        "INSERT INTO [wf_base].[Warframes] (UniqueName, Name, Armor, Health, Shields, Energy, SprintSpeed, RawJson) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (f"/Lotus/Powersuits/Bench/Frame{i}", f"Frame {i}", rng.choice([65, 100, 150, 225, 300, 600]),
+             rng.choice([270, 455, 550, 640, 1100]), rng.choice([0, 180, 270, 455, 640]),
+             rng.choice([100, 150, 175, 200]), round(rng.uniform(0.9, 1.25), 2), RAW_JSON)
+            for i in range(counts["warframes"])
+        ),
+    )
+    weapon_columns = ["UniqueName", "Name", "Type", "MasteryRank", "Impact", "Puncture", "Slash", "CritChance",
+                      "CritMultiplier", "StatusChance", "FireRate", "MagazineSize", "ReloadTime", "Multishot"]
+    weapons = [
+        dict(zip(weapon_columns, (
+            f"/Lotus/Weapons/Bench/Weapon{i}", f"Weapon {i}", WEAPON_TYPES[i % len(WEAPON_TYPES)],
+            rng.randint(0, 16), round(rng.uniform(0, 60), 1), round(rng.uniform(0, 60), 1),
+            round(rng.uniform(0, 60), 1), round(rng.uniform(0.02, 0.5), 2), round(rng.uniform(1.5, 3.2), 1),
+            round(rng.uniform(0.02, 0.5), 2), round(rng.uniform(0.5, 20), 2),
+            rng.choice([1, 6, 30, 45, 60, 100, 200]), round(rng.uniform(0.5, 4), 1),
+            rng.choice([1, 1, 1, 2, 5, 8]),
+        )))
+        for i in range(counts["weapons"])
+    ]
+    weapon_columns += stats.STAT_COLUMNS
+    stats.add_weapon_stats(weapons)
+    conn.executemany(
+        f"INSERT INTO [wf_base].[Weapons] ({', '.join(weapon_columns)}, RawJson) "
+        f"VALUES ({', '.join('?' for _ in weapon_columns)}, ?)",
+        ((*(weapon[column] for column in weapon_columns), RAW_JSON) for weapon in weapons),
+    )
+    # Mod stats come from their own generator so the other tables match earlier seeds
+    stat_rng = random.Random(seed + 1)
+    mods = [
+        (f"/Lotus/Upgrades/Mods/Bench/Mod{i}", f"Mod {i}", rng.choice(MOD_TYPES), rng.choice(POLARITIES),
+         rng.choice([3, 5, 10]))
+        for i in range(counts["mods"])
+    ]
+    mod_json = [mod_raw_json(stat_rng, mod[-1]) for mod in mods]
+    conn.executemany(
+        "INSERT INTO [wf_base].[Mods] (UniqueName, Name, ModType, Polarity, MaxRank, RawJson) VALUES (?, ?, ?, ?, ?, ?)",
+        ((*mod, raw) for mod, raw in zip(mods, mod_json)),
+    )
+    conn.executemany(
+        f"INSERT INTO [wf_base].[ModRankStats] (ModId, {', '.join(stats.RANK_STAT_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        ((mod_id, *(row[column] for column in stats.RANK_STAT_COLUMNS))
+         for mod_id, raw in enumerate(mod_json, start=1)
+         for row in stats.rank_stats(json.loads(raw)["levelStats"])),
+    )
+    conn.executemany(
+        "INSERT INTO [wf_base].[Arcanes] (UniqueName, Name, ItemType, MaxRank, RawJson) VALUES (?, ?, ?, ?, ?)",
+        (
+            (f"/Lotus/Upgrades/CosmeticEnhancers/Bench/Arcane{i}", f"Arcane {i}", "Arcane", rng.choice([3, 5]),
+             RAW_JSON)
+            for i in range(counts["arcanes"])
+        ),
+    )
+
+    builds = counts["builds"]
+    conn.executemany(
+        "INSERT INTO [wf_user].[MyFrames] (WarframeId, BuildName, FormaCount, CreatedAt) VALUES (?, ?, ?, ?)",
+        ((rng.randint(1, counts["warframes"]), f"Frame build {i}", rng.randint(0, 6), now) for i in range(builds)),
+    )
+    for table, arcanes in (("MyPrimaryWeapons", "PrimaryWeaponArcanes"),
+                           ("MySecondaryWeapons", "SecondaryWeaponArcanes"),
+                           ("MyMeleeWeapons", "MeleeWeaponArcanes")):
+        conn.executemany(
+            f"INSERT INTO [wf_user].[{table}] (WeaponId, BuildName, FormaCount, CreatedAt) VALUES (?, ?, ?, ?)",
+            ((rng.randint(1, counts["weapons"]), f"Weapon build {i}", rng.randint(0, 6), now) for i in range(builds)),
+        )
+        conn.executemany(
+            f"INSERT INTO [wf_user].[{arcanes}] (WeaponBuildId, ArcaneId, SlotIndex, Rank) VALUES (?, ?, ?, ?)",
+            ((build, rng.randint(1, counts["arcanes"]), slot, rng.randint(0, 5))
+             for build in range(1, builds + 1) for slot in (1, 2)),
+        )
+    conn.executemany(
+        "INSERT INTO [wf_user].[Loadouts] (Name, FrameBuildId, PrimaryBuildId, SecondaryBuildId, MeleeBuildId, "
+        "FocusSchool, CreatedAt) VALUES (?, ?, ?, ?, ?, ?, ?)",
+        (
+            (f"Loadout {i}", rng.randint(1, builds), rng.randint(1, builds), rng.randint(1, builds),
+             rng.randint(1, builds), rng.choice(["Madurai", "Vazarin", "Naramon", "Zenurik", "Unairu"]), now)
+            for i in range(counts["loadouts"])
+        ),
+    )
+    conn.commit()
+    return counts
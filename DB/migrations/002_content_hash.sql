@@ -0,0 +1,48 @@
+/*
+    Warframe Analytics - Migration 002: change detection for upserts
+
+    Applies on top of phase1_schema.sql (migration 001).
+    Adds a per-row content hash computed by ETL/Scripts/transform.py plus
+    soft-delete bookkeeping, so load.py --upsert can update only the rows
+    that changed and flag rows that disappeared upstream.
+*/
+
+-- wf_base.Weapons
+IF COL_LENGTH('wf_base.Weapons', 'ContentHash') IS NULL
+BEGIN
+    ALTER TABLE [wf_base].[Weapons] ADD
+        [ContentHash] [char](64) NULL,
+        [IsDeleted] [bit] NOT NULL CONSTRAINT [DF_Weapons_IsDeleted] DEFAULT 0,
+        [UpdatedAt] [datetime2](7) NULL
+END
+GO
+
+-- wf_base.Warframes
+IF COL_LENGTH('wf_base.Warframes', 'ContentHash') IS NULL
+BEGIN
+    ALTER TABLE [wf_base].[Warframes] ADD
+        [ContentHash] [char](64) NULL,
+        [IsDeleted] [bit] NOT NULL CONSTRAINT [DF_Warframes_IsDeleted] DEFAULT 0,
+        [UpdatedAt] [datetime2](7) NULL
+END
+GO
+
+-- wf_base.Mods
+IF COL_LENGTH('wf_base.Mods', 'ContentHash') IS NULL
+BEGIN
+    ALTER TABLE [wf_base].[Mods] ADD
+        [ContentHash] [char](64) NULL,
+        [IsDeleted] [bit] NOT NULL CONSTRAINT [DF_Mods_IsDeleted] DEFAULT 0,
+        [UpdatedAt] [datetime2](7) NULL
+END
+GO
+
+-- wf_base.Arcanes
+IF COL_LENGTH('wf_base.Arcanes', 'ContentHash') IS NULL
+BEGIN
+    ALTER TABLE [wf_base].[Arcanes] ADD
+        [ContentHash] [char](64) NULL,
+        [IsDeleted] [bit] NOT NULL CONSTRAINT [DF_Arcanes_IsDeleted] DEFAULT 0,
+        [UpdatedAt] [datetime2](7) NULL
+END
+GO
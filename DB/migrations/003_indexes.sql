@@ -0,0 +1,183 @@
+/*
+    Warframe Analytics - Migration 003: lookup and API indexes
+
+    - Unique index on UniqueName for every wf_base table (the ETL probes and
+      merges on it). Filtered to non-NULL names so legacy NULL rows don't
+      collide.
+    - Covering nonclustered indexes for the filter / sort columns used by the
+      /warframes, /weapons, /mods and /arcanes routers. They are filtered on
+      IsDeleted = 0 to match the routers, and INCLUDE the response columns
+      (never RawJson) so list queries don't touch the base table.
+    - Indexes on the wf_user foreign key and CreatedAt columns.
+
+    Benchmark: API/benchmarks/bench_indexes.py
+*/
+
+-- STEP 1: UniqueName
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'UX_Warframes_UniqueName')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_Warframes_UniqueName]
+        ON [wf_base].[Warframes] ([UniqueName]) WHERE [UniqueName] IS NOT NULL
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'UX_Weapons_UniqueName')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_Weapons_UniqueName]
+        ON [wf_base].[Weapons] ([UniqueName]) WHERE [UniqueName] IS NOT NULL
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'UX_Mods_UniqueName')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_Mods_UniqueName]
+        ON [wf_base].[Mods] ([UniqueName]) WHERE [UniqueName] IS NOT NULL
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'UX_Arcanes_UniqueName')
+    CREATE UNIQUE NONCLUSTERED INDEX [UX_Arcanes_UniqueName]
+        ON [wf_base].[Arcanes] ([UniqueName]) WHERE [UniqueName] IS NOT NULL
+GO
+
+-- STEP 2: Router filter / sort columns
+
+-- /warframes: default sort Name; min/max armor, health, shields
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Warframes_Name')
+    CREATE NONCLUSTERED INDEX [IX_Warframes_Name]
+        ON [wf_base].[Warframes] ([Name], [WarframeId])
+        INCLUDE ([UniqueName], [Armor], [Health], [Shields], [Energy], [SprintSpeed])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Warframes_Armor')
+    CREATE NONCLUSTERED INDEX [IX_Warframes_Armor]
+        ON [wf_base].[Warframes] ([Armor], [WarframeId])
+        INCLUDE ([UniqueName], [Name], [Health], [Shields], [Energy], [SprintSpeed])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Warframes_Health')
+    CREATE NONCLUSTERED INDEX [IX_Warframes_Health]
+        ON [wf_base].[Warframes] ([Health], [WarframeId])
+        INCLUDE ([UniqueName], [Name], [Armor], [Shields], [Energy], [SprintSpeed])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Warframes_Shields')
+    CREATE NONCLUSTERED INDEX [IX_Warframes_Shields]
+        ON [wf_base].[Warframes] ([Shields], [WarframeId])
+        INCLUDE ([UniqueName], [Name], [Armor], [Health], [Energy], [SprintSpeed])
+        WHERE [IsDeleted] = 0
+GO
+
+-- /weapons: default sort Name, usually filtered by Type; crit / status / mastery ranges and sorts
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_Type_Name')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_Type_Name]
+        ON [wf_base].[Weapons] ([Type], [Name], [WeaponId])
+        INCLUDE ([UniqueName], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_Name')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_Name]
+        ON [wf_base].[Weapons] ([Name], [WeaponId])
+        INCLUDE ([UniqueName], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_CritChance')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_CritChance]
+        ON [wf_base].[Weapons] ([CritChance], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_StatusChance')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_StatusChance]
+        ON [wf_base].[Weapons] ([StatusChance], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance],
+                 [CritMultiplier], [FireRate], [MagazineSize], [ReloadTime], [Multishot])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_MasteryRank')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_MasteryRank]
+        ON [wf_base].[Weapons] ([MasteryRank], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot])
+        WHERE [IsDeleted] = 0
+GO
+
+-- /mods, /arcanes: sorted by Name
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Mods_Name')
+    CREATE NONCLUSTERED INDEX [IX_Mods_Name]
+        ON [wf_base].[Mods] ([Name], [ModId])
+        INCLUDE ([UniqueName], [ModType], [Polarity], [MaxRank])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Arcanes_Name')
+    CREATE NONCLUSTERED INDEX [IX_Arcanes_Name]
+        ON [wf_base].[Arcanes] ([Name], [ArcaneId])
+        INCLUDE ([UniqueName], [ItemType], [MaxRank])
+        WHERE [IsDeleted] = 0
+GO
+
+-- STEP 3: wf_user foreign keys and CreatedAt ordering
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MyFrames_WarframeId')
+    CREATE NONCLUSTERED INDEX [IX_MyFrames_WarframeId] ON [wf_user].[MyFrames] ([WarframeId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MyFrames_CreatedAt')
+    CREATE NONCLUSTERED INDEX [IX_MyFrames_CreatedAt] ON [wf_user].[MyFrames] ([CreatedAt] DESC, [FrameBuildId] DESC)
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MyPrimaryWeapons_WeaponId')
+    CREATE NONCLUSTERED INDEX [IX_MyPrimaryWeapons_WeaponId] ON [wf_user].[MyPrimaryWeapons] ([WeaponId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MySecondaryWeapons_WeaponId')
+    CREATE NONCLUSTERED INDEX [IX_MySecondaryWeapons_WeaponId] ON [wf_user].[MySecondaryWeapons] ([WeaponId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MyMeleeWeapons_WeaponId')
+    CREATE NONCLUSTERED INDEX [IX_MyMeleeWeapons_WeaponId] ON [wf_user].[MyMeleeWeapons] ([WeaponId])
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_PrimaryWeaponArcanes_WeaponBuildId')
+    CREATE NONCLUSTERED INDEX [IX_PrimaryWeaponArcanes_WeaponBuildId] ON [wf_user].[PrimaryWeaponArcanes] ([WeaponBuildId], [SlotIndex])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_PrimaryWeaponArcanes_ArcaneId')
+    CREATE NONCLUSTERED INDEX [IX_PrimaryWeaponArcanes_ArcaneId] ON [wf_user].[PrimaryWeaponArcanes] ([ArcaneId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_SecondaryWeaponArcanes_WeaponBuildId')
+    CREATE NONCLUSTERED INDEX [IX_SecondaryWeaponArcanes_WeaponBuildId] ON [wf_user].[SecondaryWeaponArcanes] ([WeaponBuildId], [SlotIndex])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_SecondaryWeaponArcanes_ArcaneId')
+    CREATE NONCLUSTERED INDEX [IX_SecondaryWeaponArcanes_ArcaneId] ON [wf_user].[SecondaryWeaponArcanes] ([ArcaneId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MeleeWeaponArcanes_WeaponBuildId')
+    CREATE NONCLUSTERED INDEX [IX_MeleeWeaponArcanes_WeaponBuildId] ON [wf_user].[MeleeWeaponArcanes] ([WeaponBuildId], [SlotIndex])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_MeleeWeaponArcanes_ArcaneId')
+    CREATE NONCLUSTERED INDEX [IX_MeleeWeaponArcanes_ArcaneId] ON [wf_user].[MeleeWeaponArcanes] ([ArcaneId])
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_FrameBuildId')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_FrameBuildId] ON [wf_user].[Loadouts] ([FrameBuildId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_PrimaryBuildId')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_PrimaryBuildId] ON [wf_user].[Loadouts] ([PrimaryBuildId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_SecondaryBuildId')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_SecondaryBuildId] ON [wf_user].[Loadouts] ([SecondaryBuildId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_MeleeBuildId')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_MeleeBuildId] ON [wf_user].[Loadouts] ([MeleeBuildId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_CompanionBuildId')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_CompanionBuildId] ON [wf_user].[Loadouts] ([CompanionBuildId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_ParazonBuildId')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_ParazonBuildId] ON [wf_user].[Loadouts] ([ParazonBuildId])
+GO
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Loadouts_CreatedAt')
+    CREATE NONCLUSTERED INDEX [IX_Loadouts_CreatedAt] ON [wf_user].[Loadouts] ([CreatedAt] DESC, [LoadoutId] DESC)
+GO
@@ -0,0 +1,19 @@
+/*
+    Warframe Analytics - Migration 004: catalogue data version
+
+    A single-row stamp that ETL/Scripts/load.py increments whenever a load
+    commits. The API polls it to invalidate its catalogue cache.
+*/
+
+IF OBJECT_ID('wf_base.DataVersion', 'U') IS NULL
+BEGIN
+    CREATE TABLE [wf_base].[DataVersion](
+        [Id] [tinyint] NOT NULL CONSTRAINT [PK_DataVersion] PRIMARY KEY
+            CONSTRAINT [CK_DataVersion_SingleRow] CHECK ([Id] = 1),
+        [Version] [bigint] NOT NULL,
+        [LoadedAt] [datetime2](7) NULL
+    )
+
+    INSERT INTO [wf_base].[DataVersion] ([Id], [Version], [LoadedAt]) VALUES (1, 1, SYSDATETIME())
+END
+GO
@@ -0,0 +1,34 @@
+/*
+    Warframe Analytics - Migration 005: keyset pagination indexes
+
+    List endpoints page with a cursor on (sort column, primary key). Every
+    sort the routers accept needs an index in that order, or the first page
+    sorts the whole table. 003 covers Name, Armor, Health, Shields,
+    CritChance, StatusChance and MasteryRank. This adds the remaining ones:
+    /warframes?sort=energy|sprintspeed and /weapons?sort=type.
+
+    Benchmark: API/benchmarks/bench_keyset.py
+*/
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Warframes_Energy')
+    CREATE NONCLUSTERED INDEX [IX_Warframes_Energy]
+        ON [wf_base].[Warframes] ([Energy], [WarframeId])
+        INCLUDE ([UniqueName], [Name], [Armor], [Health], [Shields], [SprintSpeed])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Warframes_SprintSpeed')
+    CREATE NONCLUSTERED INDEX [IX_Warframes_SprintSpeed]
+        ON [wf_base].[Warframes] ([SprintSpeed], [WarframeId])
+        INCLUDE ([UniqueName], [Name], [Armor], [Health], [Shields], [Energy])
+        WHERE [IsDeleted] = 0
+GO
+
+-- IX_Weapons_Type_Name orders by Name within a type, not by WeaponId
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_Type_WeaponId')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_Type_WeaponId]
+        ON [wf_base].[Weapons] ([Type], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot])
+        WHERE [IsDeleted] = 0
+GO
@@ -0,0 +1,118 @@
+/*
+    Warframe Analytics - Migration 006: derived weapon stats
+
+    ETL/Scripts/stats.py computes TotalDamage, AvgCritMultiplier, BurstDPS
+    and SustainedDPS for every weapon at transform time; load.py writes them
+    with the other columns. /weapons filters on TotalDamage and sorts by
+    damage, dps and sustained, so each gets a (column, key) index like the
+    other sorts in 003/005.
+
+    The API now selects the new columns, so the weapon indexes from 003 and
+    005 are rebuilt with them in INCLUDE to stay covering.
+
+    Rows loaded before this migration have NULL stats until the next
+    `pipeline.py --upsert` (their ContentHash changes with the new columns).
+
+    Benchmarks: ETL/Benchmarks/bench_stats.py, API/benchmarks/bench_indexes.py
+*/
+
+IF COL_LENGTH('wf_base.Weapons', 'TotalDamage') IS NULL
+BEGIN
+    ALTER TABLE [wf_base].[Weapons] ADD
+        [TotalDamage] [float] NULL,
+        [AvgCritMultiplier] [float] NULL,
+        [BurstDPS] [float] NULL,
+        [SustainedDPS] [float] NULL
+END
+GO
+
+-- Sort indexes for /weapons?sort=damage|dps|sustained
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_TotalDamage')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_TotalDamage]
+        ON [wf_base].[Weapons] ([TotalDamage], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance],
+                 [CritMultiplier], [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_BurstDPS')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_BurstDPS]
+        ON [wf_base].[Weapons] ([BurstDPS], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance],
+                 [CritMultiplier], [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_SustainedDPS')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_SustainedDPS]
+        ON [wf_base].[Weapons] ([SustainedDPS], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance],
+                 [CritMultiplier], [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS])
+        WHERE [IsDeleted] = 0
+GO
+
+-- Existing weapon indexes, rebuilt with the stat columns included (safe to re-run)
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_Type_Name')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_Type_Name]
+        ON [wf_base].[Weapons] ([Type], [Name], [WeaponId])
+        INCLUDE ([UniqueName], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+        WITH (DROP_EXISTING = ON)
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_Name')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_Name]
+        ON [wf_base].[Weapons] ([Name], [WeaponId])
+        INCLUDE ([UniqueName], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+        WITH (DROP_EXISTING = ON)
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_CritChance')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_CritChance]
+        ON [wf_base].[Weapons] ([CritChance], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+        WITH (DROP_EXISTING = ON)
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_StatusChance')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_StatusChance]
+        ON [wf_base].[Weapons] ([StatusChance], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance],
+                 [CritMultiplier], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+        WITH (DROP_EXISTING = ON)
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_MasteryRank')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_MasteryRank]
+        ON [wf_base].[Weapons] ([MasteryRank], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [Type], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+        WITH (DROP_EXISTING = ON)
+GO
+
+IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_Weapons_Type_WeaponId')
+    CREATE NONCLUSTERED INDEX [IX_Weapons_Type_WeaponId]
+        ON [wf_base].[Weapons] ([Type], [WeaponId])
+        INCLUDE ([UniqueName], [Name], [MasteryRank], [Impact], [Puncture], [Slash], [CritChance], [CritMultiplier],
+                 [StatusChance], [FireRate], [MagazineSize], [ReloadTime], [Multishot],
+                 [TotalDamage], [AvgCritMultiplier], [BurstDPS], [SustainedDPS])
+        WHERE [IsDeleted] = 0
+        WITH (DROP_EXISTING = ON)
+GO
@@ -0,0 +1,64 @@
+/*
+    Warframe Analytics - Migration 007: mod and arcane rank stats
+
+    ETL/Scripts/stats.py explodes each mod's and arcane's levelStats into one
+    row per stat per rank ("+165% Damage" at rank 10 -> Stat 'Damage',
+    Value 165, Unit '%'), and load.py writes them to these side tables
+    with the parent rows, replacing the stats of every row a load inserts or
+    rewrites. Lines without a readable value keep only their Text.
+
+    /mods/{id}/ranks and /arcanes/{id}/ranks read the clustered key;
+    ?stat=...&min_value=... on /mods and /arcanes seeks the (Stat, Value)
+    index instead of parsing RawJson row by row.
+
+    Rows loaded before this migration get their rank stats on the next
+    `pipeline.py --upsert` (their ContentHash changes with the new field).
+
+    Benchmark: API/benchmarks/bench_rank_stats.py
+*/
+
+IF OBJECT_ID('wf_base.ModRankStats', 'U') IS NULL
+    CREATE TABLE [wf_base].[ModRankStats](
+        [ModId] [int] NOT NULL,
+        [Rank] [int] NOT NULL,
+        [Position] [int] NOT NULL,
+        [Stat] [nvarchar](100) NULL,
+        [Value] [float] NULL,
+        [Unit] [nvarchar](10) NULL,
+        [Text] [nvarchar](max) NULL,
+        CONSTRAINT [PK_ModRankStats] PRIMARY KEY CLUSTERED ([ModId], [Rank], [Position]),
+        CONSTRAINT [FK_ModRankStats_Mods] FOREIGN KEY([ModId])
+            REFERENCES [wf_base].[Mods] ([ModId])
+    )
+GO
+
+IF OBJECT_ID('wf_base.ArcaneRankStats', 'U') IS NULL
+    CREATE TABLE [wf_base].[ArcaneRankStats](
+        [ArcaneId] [int] NOT NULL,
+        [Rank] [int] NOT NULL,
+        [Position] [int] NOT NULL,
+        [Stat] [nvarchar](100) NULL,
+        [Value] [float] NULL,
+        [Unit] [nvarchar](10) NULL,
+        [Text] [nvarchar](max) NULL,
+        CONSTRAINT [PK_ArcaneRankStats] PRIMARY KEY CLUSTERED ([ArcaneId], [Rank], [Position]),
+        CONSTRAINT [FK_ArcaneRankStats_Arcanes] FOREIGN KEY([ArcaneId])
+            REFERENCES [wf_base].[Arcanes] ([ArcaneId])
+    )
+GO
+
+-- Stat filters: ?stat=Critical Chance&min_value=100
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_ModRankStats_Stat_Value')
+    CREATE NONCLUSTERED INDEX [IX_ModRankStats_Stat_Value]
+        ON [wf_base].[ModRankStats] ([Stat], [Value])
+        INCLUDE ([ModId], [Rank])
+        WHERE [Stat] IS NOT NULL
+GO
+
+IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'IX_ArcaneRankStats_Stat_Value')
+    CREATE NONCLUSTERED INDEX [IX_ArcaneRankStats_Stat_Value]
+        ON [wf_base].[ArcaneRankStats] ([Stat], [Value])
+        INCLUDE ([ArcaneId], [Rank])
+        WHERE [Stat] IS NOT NULL
+GO
@@ -0,0 +1,312 @@
+/*
+    Warframe Analytics - SQLite stand-in schema
+
+    Mirrors DB/phase1_schema.sql for local testing and benchmarks. SQLite has
+    no schemas, so [wf_base] and [wf_user] are attached databases: the
+    connection helpers attach <db>.wf_base.db and <db>.wf_user.db (or
+    :memory:) before running this script. Cross-database foreign keys are
+    not supported by SQLite, so FK columns are plain integers here.
+
+    Keep this file in step with phase1_schema.sql plus DB/migrations/*.sql.
+*/
+
+-- STEP 2: Base Game Tables (wf_base)
+
+CREATE TABLE IF NOT EXISTS [wf_base].[Weapons](
+    [WeaponId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [UniqueName] TEXT NULL,
+    [Name] TEXT NULL,
+    [Type] TEXT NULL,
+    [MasteryRank] INTEGER NULL,
+    [Impact] REAL NULL,
+    [Puncture] REAL NULL,
+    [Slash] REAL NULL,
+    [CritChance] REAL NULL,
+    [CritMultiplier] REAL NULL,
+    [StatusChance] REAL NULL,
+    [FireRate] REAL NULL,
+    [MagazineSize] INTEGER NULL,
+    [ReloadTime] REAL NULL,
+    [Multishot] REAL NULL,
+    [TotalDamage] REAL NULL,
+    [AvgCritMultiplier] REAL NULL,
+    [BurstDPS] REAL NULL,
+    [SustainedDPS] REAL NULL,
+    [RawJson] TEXT NULL,
+    [ContentHash] TEXT NULL,
+    [IsDeleted] INTEGER NOT NULL DEFAULT 0,
+    [UpdatedAt] TEXT NULL
+);
+
+CREATE TABLE IF NOT EXISTS [wf_base].[Warframes](
+    [WarframeId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [UniqueName] TEXT NULL,
+    [Name] TEXT NULL,
+    [Armor] INTEGER NULL,
+    [Health] INTEGER NULL,
+    [Shields] INTEGER NULL,
+    [Energy] INTEGER NULL,
+    [SprintSpeed] REAL NULL,
+    [RawJson] TEXT NULL,
+    [ContentHash] TEXT NULL,
+    [IsDeleted] INTEGER NOT NULL DEFAULT 0,
+    [UpdatedAt] TEXT NULL
+);
+
+CREATE TABLE IF NOT EXISTS [wf_base].[Mods](
+    [ModId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [UniqueName] TEXT NULL,
+    [Name] TEXT NULL,
+    [ModType] TEXT NULL,
+    [Polarity] TEXT NULL,
+    [MaxRank] INTEGER NULL,
+    [RawJson] TEXT NULL,
+    [ContentHash] TEXT NULL,
+    [IsDeleted] INTEGER NOT NULL DEFAULT 0,
+    [UpdatedAt] TEXT NULL
+);
+
+CREATE TABLE IF NOT EXISTS [wf_base].[Arcanes](
+    [ArcaneId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [UniqueName] TEXT NULL,
+    [Name] TEXT NULL,
+    [ItemType] TEXT NULL,
+    [MaxRank] INTEGER NULL,
+    [RawJson] TEXT NULL,
+    [ContentHash] TEXT NULL,
+    [IsDeleted] INTEGER NOT NULL DEFAULT 0,
+    [UpdatedAt] TEXT NULL
+);
+
+CREATE TABLE IF NOT EXISTS [wf_base].[ModRankStats](
+    [ModId] INTEGER NOT NULL,
+    [Rank] INTEGER NOT NULL,
+    [Position] INTEGER NOT NULL,
+    [Stat] TEXT NULL COLLATE NOCASE,
+    [Value] REAL NULL,
+    [Unit] TEXT NULL,
+    [Text] TEXT NULL,
+    PRIMARY KEY ([ModId], [Rank], [Position])
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS [wf_base].[ArcaneRankStats](
+    [ArcaneId] INTEGER NOT NULL,
+    [Rank] INTEGER NOT NULL,
+    [Position] INTEGER NOT NULL,
+    [Stat] TEXT NULL COLLATE NOCASE,
+    [Value] REAL NULL,
+    [Unit] TEXT NULL,
+    [Text] TEXT NULL,
+    PRIMARY KEY ([ArcaneId], [Rank], [Position])
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS [wf_base].[DataVersion](
+    [Id] INTEGER PRIMARY KEY CHECK ([Id] = 1),
+    [Version] INTEGER NOT NULL,
+    [LoadedAt] TEXT NULL
+);
+
+INSERT OR IGNORE INTO [wf_base].[DataVersion] ([Id], [Version], [LoadedAt]) VALUES (1, 1, CURRENT_TIMESTAMP);
+
+-- STEP 3: User Build Tables (wf_user)
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MyFrames](
+    [FrameBuildId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WarframeId] INTEGER NOT NULL,
+    [BuildName] TEXT NULL,
+    [FormaCount] INTEGER DEFAULT 0,
+    [FinalArmor] REAL NULL,
+    [FinalHealth] REAL NULL,
+    [FinalShields] REAL NULL,
+    [FinalStrength] REAL NULL,
+    [FinalRange] REAL NULL,
+    [FinalDuration] REAL NULL,
+    [FinalEfficiency] REAL NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MyPrimaryWeapons](
+    [WeaponBuildId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WeaponId] INTEGER NOT NULL,
+    [BuildName] TEXT NOT NULL,
+    [FormaCount] INTEGER DEFAULT 0,
+    [FinalTotalDamage] REAL NULL,
+    [FinalImpactDamage] REAL NULL,
+    [FinalPunctureDamage] REAL NULL,
+    [FinalSlashDamage] REAL NULL,
+    [FinalCritChance] REAL NULL,
+    [FinalCritMultiplier] REAL NULL,
+    [FinalStatusChance] REAL NULL,
+    [FinalFireRate] REAL NULL,
+    [FinalMagazineSize] INTEGER NULL,
+    [FinalReloadTime] REAL NULL,
+    [FinalMultishot] REAL NULL,
+    [FinalPunchThrough] REAL NULL,
+    [FinalBurstDPS] REAL NULL,
+    [FinalSustainedDPS] REAL NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MySecondaryWeapons](
+    [WeaponBuildId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WeaponId] INTEGER NOT NULL,
+    [BuildName] TEXT NOT NULL,
+    [FormaCount] INTEGER DEFAULT 0,
+    [FinalTotalDamage] REAL NULL,
+    [FinalImpactDamage] REAL NULL,
+    [FinalPunctureDamage] REAL NULL,
+    [FinalSlashDamage] REAL NULL,
+    [FinalCritChance] REAL NULL,
+    [FinalCritMultiplier] REAL NULL,
+    [FinalStatusChance] REAL NULL,
+    [FinalFireRate] REAL NULL,
+    [FinalMagazineSize] INTEGER NULL,
+    [FinalReloadTime] REAL NULL,
+    [FinalMultishot] REAL NULL,
+    [FinalPunchThrough] REAL NULL,
+    [FinalBurstDPS] REAL NULL,
+    [FinalSustainedDPS] REAL NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MyMeleeWeapons](
+    [WeaponBuildId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WeaponId] INTEGER NOT NULL,
+    [BuildName] TEXT NOT NULL,
+    [FormaCount] INTEGER DEFAULT 0,
+    [FinalTotalDamage] REAL NULL,
+    [FinalImpactDamage] REAL NULL,
+    [FinalPunctureDamage] REAL NULL,
+    [FinalSlashDamage] REAL NULL,
+    [FinalCritChance] REAL NULL,
+    [FinalCritMultiplier] REAL NULL,
+    [FinalStatusChance] REAL NULL,
+    [FinalFireRate] REAL NULL,
+    [FinalMagazineSize] INTEGER NULL,
+    [FinalReloadTime] REAL NULL,
+    [FinalMultishot] REAL NULL,
+    [FinalPunchThrough] REAL NULL,
+    [FinalBurstDPS] REAL NULL,
+    [FinalSustainedDPS] REAL NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- STEP 4: Weapon Arcane Link Tables
+
+CREATE TABLE IF NOT EXISTS [wf_user].[PrimaryWeaponArcanes](
+    [PrimaryWeaponArcaneId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WeaponBuildId] INTEGER NOT NULL,
+    [ArcaneId] INTEGER NOT NULL,
+    [SlotIndex] INTEGER NOT NULL,
+    [Rank] INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS [wf_user].[SecondaryWeaponArcanes](
+    [SecondaryWeaponArcaneId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WeaponBuildId] INTEGER NOT NULL,
+    [ArcaneId] INTEGER NOT NULL,
+    [SlotIndex] INTEGER NOT NULL,
+    [Rank] INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MeleeWeaponArcanes](
+    [MeleeWeaponArcaneId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [WeaponBuildId] INTEGER NOT NULL,
+    [ArcaneId] INTEGER NOT NULL,
+    [SlotIndex] INTEGER NOT NULL,
+    [Rank] INTEGER NOT NULL
+);
+
+-- STEP 5: Companion & Parazon Builds
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MyCompanions](
+    [CompanionBuildId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [CompanionBaseId] INTEGER NOT NULL,
+    [BuildName] TEXT NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS [wf_user].[MyParazons](
+    [ParazonBuildId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [BuildName] TEXT NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- STEP 6: Loadouts
+
+CREATE TABLE IF NOT EXISTS [wf_user].[Loadouts](
+    [LoadoutId] INTEGER PRIMARY KEY AUTOINCREMENT,
+    [Name] TEXT NOT NULL,
+    [FrameBuildId] INTEGER NULL,
+    [PrimaryBuildId] INTEGER NULL,
+    [SecondaryBuildId] INTEGER NULL,
+    [MeleeBuildId] INTEGER NULL,
+    [CompanionBuildId] INTEGER NULL,
+    [ParazonBuildId] INTEGER NULL,
+    [FocusSchool] TEXT NULL,
+    [Notes] TEXT NULL,
+    [CreatedAt] TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
+-- STEP 7: Indexes (DB/migrations/003_indexes.sql, without the INCLUDE columns SQLite lacks)
+
+CREATE UNIQUE INDEX IF NOT EXISTS [wf_base].[UX_Warframes_UniqueName] ON [Warframes] ([UniqueName]) WHERE [UniqueName] IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS [wf_base].[UX_Weapons_UniqueName] ON [Weapons] ([UniqueName]) WHERE [UniqueName] IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS [wf_base].[UX_Mods_UniqueName] ON [Mods] ([UniqueName]) WHERE [UniqueName] IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS [wf_base].[UX_Arcanes_UniqueName] ON [Arcanes] ([UniqueName]) WHERE [UniqueName] IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Warframes_Name] ON [Warframes] ([Name]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Warframes_Armor] ON [Warframes] ([Armor]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Warframes_Health] ON [Warframes] ([Health]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Warframes_Shields] ON [Warframes] ([Shields]) WHERE [IsDeleted] = 0;
+
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_Type_Name] ON [Weapons] ([Type], [Name]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_Name] ON [Weapons] ([Name]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_CritChance] ON [Weapons] ([CritChance]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_StatusChance] ON [Weapons] ([StatusChance]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_MasteryRank] ON [Weapons] ([MasteryRank]) WHERE [IsDeleted] = 0;
+
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Mods_Name] ON [Mods] ([Name]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Arcanes_Name] ON [Arcanes] ([Name]) WHERE [IsDeleted] = 0;
+
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MyFrames_WarframeId] ON [MyFrames] ([WarframeId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MyFrames_CreatedAt] ON [MyFrames] ([CreatedAt] DESC, [FrameBuildId] DESC);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MyPrimaryWeapons_WeaponId] ON [MyPrimaryWeapons] ([WeaponId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MySecondaryWeapons_WeaponId] ON [MySecondaryWeapons] ([WeaponId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MyMeleeWeapons_WeaponId] ON [MyMeleeWeapons] ([WeaponId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_PrimaryWeaponArcanes_WeaponBuildId] ON [PrimaryWeaponArcanes] ([WeaponBuildId], [SlotIndex]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_PrimaryWeaponArcanes_ArcaneId] ON [PrimaryWeaponArcanes] ([ArcaneId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_SecondaryWeaponArcanes_WeaponBuildId] ON [SecondaryWeaponArcanes] ([WeaponBuildId], [SlotIndex]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_SecondaryWeaponArcanes_ArcaneId] ON [SecondaryWeaponArcanes] ([ArcaneId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MeleeWeaponArcanes_WeaponBuildId] ON [MeleeWeaponArcanes] ([WeaponBuildId], [SlotIndex]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_MeleeWeaponArcanes_ArcaneId] ON [MeleeWeaponArcanes] ([ArcaneId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_FrameBuildId] ON [Loadouts] ([FrameBuildId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_PrimaryBuildId] ON [Loadouts] ([PrimaryBuildId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_SecondaryBuildId] ON [Loadouts] ([SecondaryBuildId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_MeleeBuildId] ON [Loadouts] ([MeleeBuildId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_CompanionBuildId] ON [Loadouts] ([CompanionBuildId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_ParazonBuildId] ON [Loadouts] ([ParazonBuildId]);
+CREATE INDEX IF NOT EXISTS [wf_user].[IX_Loadouts_CreatedAt] ON [Loadouts] ([CreatedAt] DESC, [LoadoutId] DESC);
+
+-- STEP 8: Keyset pagination indexes (DB/migrations/005_keyset_indexes.sql)
+
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Warframes_Energy] ON [Warframes] ([Energy]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Warframes_SprintSpeed] ON [Warframes] ([SprintSpeed]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_Type_WeaponId] ON [Weapons] ([Type]) WHERE [IsDeleted] = 0;
+
+-- STEP 9: Derived weapon stat indexes (DB/migrations/006_weapon_stats.sql)
+
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_TotalDamage] ON [Weapons] ([TotalDamage]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_BurstDPS] ON [Weapons] ([BurstDPS]) WHERE [IsDeleted] = 0;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_Weapons_SustainedDPS] ON [Weapons] ([SustainedDPS]) WHERE [IsDeleted] = 0;
+
+-- STEP 10: Rank stats (DB/migrations/007_rank_stats.sql). Stat is NOCASE, like SQL Server's default collation.
+
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_ModRankStats_Stat_Value] ON [ModRankStats] ([Stat], [Value]) WHERE [Stat] IS NOT NULL;
+CREATE INDEX IF NOT EXISTS [wf_base].[IX_ArcaneRankStats_Stat_Value] ON [ArcaneRankStats] ([Stat], [Value]) WHERE [Stat] IS NOT NULL;
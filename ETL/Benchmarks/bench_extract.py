@@ -0,0 +1,89 @@
+"""
+Benchmark: sequential vs concurrent extraction against a local stub server.
+
+The stub serves small JSON catalogues for each endpoint after an artificial
+delay, so the concurrent run should finish in roughly the time of the slowest
+endpoint rather than the sum of all of them. A final conditional run shows
+the cost of a night where nothing changed upstream (ETag -> 304).
+
+Usage:
+    python ETL/Benchmarks/bench_extract.py
+"""
+import hashlib
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+import extract
+
+# endpoint -> (delay in seconds, payload)
+STUB_ENDPOINTS = {
+    "warframes": (0.4, [{"uniqueName": f"/Frame/{i}", "category": "Warframes", "health": 100} for i in range(100)]),
+    "weapons": (0.6, [{"uniqueName": f"/Weapon/{i}", "category": "Primary"} for i in range(600)]),
+    "mods": (0.8, [{"uniqueName": f"/Mod/{i}", "category": "Mods"} for i in range(1750)]),
+    "items": (1.2, [{"uniqueName": f"/Item/{i}", "category": "Arcanes" if i % 50 == 0 else "Misc"} for i in range(8000)]),
+}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        endpoint = self.path.strip("/")
+        if endpoint not in STUB_ENDPOINTS:
+            self.send_error(404)
+            return
+        delay, payload = STUB_ENDPOINTS[endpoint]
+        time.sleep(delay)
+        body = json.dumps(payload).encode("utf-8")
+        etag = '"' + hashlib.md5(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    extract.BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    with tempfile.TemporaryDirectory() as tmp:
+        extract.RAW_DIR = Path(tmp)
+
+        results = {}
+        runs = (("sequential", False, True), ("concurrent", True, True), ("conditional", True, False))
+        for label, concurrent, force in runs:
+            start = time.perf_counter()
+            timings = extract.run_extraction(concurrent=concurrent, force=force)
+            results[label] = (time.perf_counter() - start, timings)
+
+    server.shutdown()
+
+    slowest = max(delay for delay, _ in STUB_ENDPOINTS.values())
+    total_delay = sum(delay for delay, _ in STUB_ENDPOINTS.values())
+    print(f"\nStub delays: slowest={slowest:.2f}s, sum={total_delay:.2f}s")
+    for label, (total, timings) in results.items():
+        per_endpoint = ", ".join(
+            f"{endpoint}={result['elapsed']:.2f}s{'' if result['changed'] else ' (unchanged)'}"
+            for endpoint, result in timings.items()
+        )
+        print(f"{label:<11} total={total:.2f}s  ({per_endpoint})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark: load throughput (rows/sec) for each load strategy.
+
+Transforms a synthetic catalogue, then:
+  - script:    writes load_data.sql (generation only; it is run by hand)
+  - row-by-row: replays the script's per-row "probe UniqueName, then insert"
+               pattern against SQLite, one statement pair per record
+  - direct:    load.bulk_load into a fresh SQLite stand-in (staging + one
+               set-based merge per table)
+  - reload:    load.bulk_load again into the populated database
+
+Usage:
+    python ETL/Benchmarks/bench_load.py [--scale 10]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+import load
+import transform
+from fixtures import synthetic_catalogue
+
+
+def row_by_row(target, processed):
+    conn = load.connect(target)
+    cursor = conn.cursor()
+    for entity, records in processed.items():
+        table, cols = load.TABLES[entity]
+        insert = f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})"
+        for item in records:
+            cursor.execute(f"SELECT 1 FROM {table} WHERE UniqueName = ?", (item["UniqueName"],))
+            if cursor.fetchone() is None:
+                cursor.execute(insert, tuple(item.get(col) for col in cols))
+    conn.commit()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load strategy benchmark.")
+    parser.add_argument("--scale", type=float, default=10, help="Multiple of the live catalogue size.")
+    args = parser.parse_args()
+
+    catalogue = synthetic_catalogue(args.scale)
+    processed = {entity: list(transform.iter_transform(entity, raw)) for entity, raw in catalogue.items()}
+    rows = sum(len(records) for records in processed.values())
+    print(f"Scale {args.scale}x: {rows:,} rows")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        runs = [
+            ("script", lambda: load.write_load_script(processed.items(), tmp / "load_data.sql")),
+            ("row-by-row", lambda: row_by_row(f"sqlite:///{tmp / 'rows.db'}", processed)),
+            ("direct", lambda: load.bulk_load(processed.items(), f"sqlite:///{tmp / 'bulk.db'}")),
+            ("reload", lambda: load.bulk_load(processed.items(), f"sqlite:///{tmp / 'bulk.db'}")),
+        ]
+        print(f"{'strategy':<12}{'seconds':>10}{'rows/s':>12}")
+        for label, run in runs:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<12}{elapsed:>10.2f}{rows / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: file-based vs streaming pipeline (end-to-end time and peak memory).
+
+Serves a synthetic catalogue from a local stub server and runs
+pipeline.run_pipeline once per mode, each in a fresh subprocess so peak RSS
+is measured independently. The per-stage wall times come from the run
+report (report.py).
+
+Usage:
+    python ETL/Benchmarks/bench_pipeline.py [--scale 10]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+from fixtures import synthetic_endpoints
+
+
+def make_handler(bodies):
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = bodies.get(self.path.strip("/"))
+            if body is None:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StubHandler
+
+
+def run_mode(base_url, mode):
+    """Runs inside the child process and prints a JSON result line."""
+    import extract
+    import load
+    import pipeline
+    import report
+    import transform
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        extract.BASE_URL = base_url
+        extract.RAW_DIR = transform.RAW_DIR = tmp / "Raw"
+        transform.PROCESSED_DIR = load.PROCESSED_DIR = tmp / "Processed"
+        load.OUTPUT_SQL_FILE = tmp / "load_data.sql"
+        report.REPORT_FILE = tmp / "run_report.json"
+        report.HISTORY_FILE = tmp / "run_history.jsonl"
+        extract.RAW_DIR.mkdir()
+        transform.PROCESSED_DIR.mkdir()
+
+        start = time.perf_counter()
+        pipeline.run_pipeline(force=True, mode=mode)
+        elapsed = time.perf_counter() - start
+        sql_bytes = load.OUTPUT_SQL_FILE.stat().st_size
+        run = json.loads(report.REPORT_FILE.read_text(encoding="utf-8"))
+
+    stages = {stage["stage"]: stage["wall_s"] for stage in run["stages"]}
+    print(json.dumps({"elapsed": elapsed, "peak_mb": run["peak_rss_mb"], "sql_bytes": sql_bytes, "stages": stages}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline mode benchmark.")
+    parser.add_argument("--scale", type=float, default=10, help="Multiple of the live catalogue size.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_mode(args.child, args.mode)
+        return
+
+    # 'items' is the whole catalogue plus filler; arcanes are a small slice of it.
+    bodies = {endpoint: json.dumps(list(records)).encode("utf-8")
+              for endpoint, records in synthetic_endpoints(args.scale).items()}
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(bodies))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    total_mb = sum(len(body) for body in bodies.values()) / 1e6
+    print(f"Scale {args.scale}x, {total_mb:.1f} MB served")
+    for mode in ("files", "stream"):
+        cmd = [sys.executable, __file__, "--child", base_url, "--mode", mode]
+        out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+        result = json.loads(out.strip().splitlines()[-1])
+        stages = "  ".join(f"{stage}={seconds:.2f}s" for stage, seconds in result["stages"].items())
+        print(f"{mode:<7} time={result['elapsed']:.2f}s  peak={result['peak_mb']:.1f} MB  "
+              f"sql={result['sql_bytes']:,} bytes  ({stages})")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark: how the transform and load stages scale with catalogue size.
+
+For each scale, a fresh subprocess writes a synthetic catalogue (with
+--messy of the records in irregular shapes) to a temporary ETL/Raw, then
+runs transform.run_transformation and load.run_load on it offline, timed
+by the pipeline's own run report (report.py). Reports wall and CPU time,
+time and peak RSS per record, and "x linear": the time per record relative
+to the smallest scale, which stays near 1.0 while a stage scales linearly.
+
+Both stages hold each entity's records in memory, so 1000x (2.6M records)
+needs about 14 GB of RAM (peak RSS was 1.4 GB at 100x).
+
+Usage:
+    python ETL/Benchmarks/bench_scaling.py [--scales 1,10,100] [--messy 0.1] [--load script|direct]
+        [--workers 1] [--entities]
+"""
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+from fixtures import BASE_COUNTS, iter_entity
+
+
+def run_scale(scale, messy, load_mode, workers):
+    """Runs inside the child process and prints the stage reports as a JSON line."""
+    import load
+    import report
+    import storage
+    import transform
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        transform.RAW_DIR = tmp / "Raw"
+        transform.PROCESSED_DIR = load.PROCESSED_DIR = tmp / "Processed"
+        load.OUTPUT_SQL_FILE = tmp / "load_data.sql"
+        transform.RAW_DIR.mkdir()
+        transform.PROCESSED_DIR.mkdir()
+
+        start = time.perf_counter()
+        for entity in BASE_COUNTS:
+            storage.save_records(iter_entity(entity, scale, messy=messy), transform.RAW_DIR, entity)
+        generate_s = time.perf_counter() - start
+
+        run = report.RunReport("bench", scale=scale, messy=messy, load_mode=load_mode, transform_workers=workers)
+        with run.stage("transform") as stage:
+            stage["entities"] = transform.run_transformation(workers=workers)
+        with run.stage("load") as stage:
+            stage["entities"] = load.run_load(mode=load_mode, target=f"sqlite:///{tmp / 'bench.db'}")
+            if load_mode == "script":
+                stage["bytes_written"] = report.file_size(load.OUTPUT_SQL_FILE)
+        data = run.finish("succeeded")
+
+    print(json.dumps({"generate_s": generate_s, "stages": data["stages"]}))
+
+
+def per_record_us(row):
+    return row["wall_s"] / row["records_in"] * 1e6 if row.get("wall_s") is not None and row.get("records_in") else None
+
+
+def print_row(label, scale, row, base_us):
+    us = per_record_us(row)
+    linear = f"{us / base_us:>9.2f}" if us and base_us else f"{'-':>9}"
+    mb_out = f"{row['bytes_written'] / 1e6:>9.1f}" if row.get("bytes_written") is not None else f"{'-':>9}"
+    seconds = f"{row['wall_s']:>9.2f}{row['cpu_s']:>9.2f}" if row.get("wall_s") is not None else f"{'-':>9}{'-':>9}"
+    peak = f"{row['peak_rss_mb']:>9.0f}" if row.get("peak_rss_mb") is not None else f"{'-':>9}"
+    print(f"{scale:>7g}{label:<20}{row['records_in'] or 0:>11,}{row['records_skipped'] or 0:>9,}{seconds}"
+          f"{us or 0:>10.1f}{linear}{peak}{mb_out}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ETL stage scaling benchmark.")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated catalogue multiples (up to 1000).")
+    parser.add_argument("--messy", type=float, default=0.1, help="Fraction of records in an irregular shape.")
+    parser.add_argument("--load", choices=["script", "direct"], default="script",
+                        help="script: write load_data.sql; direct: bulk load into a SQLite stand-in.")
+    parser.add_argument("--workers", type=int, default=1, help="Transform worker processes.")
+    parser.add_argument("--entities", action="store_true", help="Also show each entity within a stage.")
+    parser.add_argument("--child", type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        run_scale(args.child, args.messy, args.load, args.workers)
+        return
+
+    print(f"messy {args.messy:.0%}, load {args.load}, {args.workers} transform worker(s)")
+    print(f"{'scale':>7}{' stage':<20}{'records':>11}{'skipped':>9}{'wall s':>9}{'cpu s':>9}"
+          f"{'us/rec':>10}{'x linear':>9}{'peak MB':>9}{'MB out':>9}")
+    base_us = {}
+    for scale in (float(s) for s in args.scales.split(",")):
+        cmd = [sys.executable, __file__, "--child", str(scale), "--messy", str(args.messy),
+               "--load", args.load, "--workers", str(args.workers)]
+        # The ETL modules log to etl_*.log in the working directory
+        with tempfile.TemporaryDirectory() as cwd:
+            proc = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
+        if proc.returncode != 0:
+            print(f"{scale:>7g} failed (exit {proc.returncode}): {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        for stage in result["stages"]:
+            rows = [(f" {stage['stage']}", stage, stage["stage"])]
+            if args.entities:
+                rows += [(f"   {entity}", row, f"{stage['stage']}/{entity}") for entity, row in stage["entities"].items()]
+            for label, row, key in rows:
+                base_us.setdefault(key, per_record_us(row))
+                print_row(label, scale, row, base_us[key])
+        print(f"{scale:>7g}{' (generate raw)':<20}{'':>38}{result['generate_s']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: per-record vs vectorised derived weapon stats.
+
+Shapes the weapons of a synthetic catalogue at each scale (default 1x, 10x
+and 100x the live catalogue), then computes TotalDamage, AvgCritMultiplier,
+BurstDPS and SustainedDPS with stats.weapon_stats one record at a time and
+with stats.add_weapon_stats over the whole list, checking both give the
+same values. Also reports the share of the full weapons transform the
+vectorised step takes.
+
+Usage:
+    python ETL/Benchmarks/bench_stats.py [--scales 1,10,100] [--repeat 5]
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+import stats
+import transform
+from fixtures import synthetic_catalogue
+
+
+def median_seconds(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Derived weapon stats benchmark.")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated catalogue multiples.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per variant (median reported).")
+    args = parser.parse_args()
+
+    print(f"{'scale':>6}{'weapons':>10}{'per-record ms':>15}{'vectorised ms':>15}{'speedup':>9}{'of transform':>14}")
+    for scale in (float(s) for s in args.scales.split(",")):
+        raw = synthetic_catalogue(scale)["weapons"]
+        shaped = [transform.transform_weapon(item) for item in raw]
+
+        per_record, expected = median_seconds(lambda: [stats.weapon_stats(record) for record in shaped], args.repeat)
+        # Rewrites the same columns in place on every repeat
+        vectorised, records = median_seconds(lambda: stats.add_weapon_stats(shaped), args.repeat)
+        assert [{c: r[c] for c in stats.STAT_COLUMNS} for r in records] == expected, "vectorised stats differ"
+
+        full, _ = median_seconds(lambda: list(transform.iter_transform("weapons", raw)), args.repeat)
+        print(f"{scale:>6g}{len(shaped):>10,}{per_record * 1000:>15.1f}{vectorised * 1000:>15.1f}"
+              f"{per_record / vectorised:>9.1f}{vectorised / full:>13.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark: bytes on disk and load time per storage format.
+
+Writes a synthetic raw and processed catalogue in every storage format whose
+dependencies are installed, then reports file size and the time
+storage.load_records takes to read it back.
+
+Usage:
+    python ETL/Benchmarks/bench_storage.py [--scale 1]
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+import storage
+import transform
+from fixtures import synthetic_catalogue
+
+
+def indented_json(records, path):
+    """The pre-storage-layer format: one json.dump(..., indent=4) per file."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Storage format benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--repeat", type=int, default=3, help="Loads per format; the best time is reported.")
+    args = parser.parse_args()
+
+    catalogue = synthetic_catalogue(args.scale)
+    datasets = {
+        "raw mods": catalogue["mods"],
+        "processed mods": transform.transform_mods(catalogue["mods"]),
+        "raw weapons": catalogue["weapons"],
+        "processed weapons": transform.transform_weapons(catalogue["weapons"]),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for label, records in datasets.items():
+            print(f"\n{label} ({len(records)} records)")
+            print(f"{'format':<18}{'bytes':>12}{'load ms':>10}")
+
+            legacy = tmp / "legacy.json"
+            indented_json(records, legacy)
+            rows = [("json (indent=4)", legacy)]
+            for fmt in storage.FORMATS:
+                try:
+                    path, _ = storage.save_records(records, tmp, label.replace(" ", "_"), fmt)
+                except RuntimeError as e:
+                    print(f"{fmt:<18}{'skipped':>12}  ({e})")
+                    continue
+                rows.append((fmt, path))
+
+            for fmt, path in rows:
+                best = float("inf")
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    loaded = list(storage.iter_records(path))
+                    best = min(best, time.perf_counter() - start)
+                assert len(loaded) == len(records)
+                print(f"{fmt:<18}{path.stat().st_size:>12,}{best * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: peak memory of buffered vs streaming extraction of the 'items' catalogue.
+
+Writes a large synthetic 'items' fixture, serves it from a local stub server and
+runs extract.extract_endpoint("items", ...) once per mode, each in a fresh
+subprocess so peak RSS is not shared between runs.
+
+Usage:
+    python ETL/Benchmarks/bench_stream.py [--items 200000]
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def write_fixture(path, count):
+    categories = ["Misc", "Resources", "Skins", "Arcanes", "Mods", "Primary"]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[")
+        for i in range(count):
+            item = {
+                "uniqueName": f"/Lotus/Upgrades/Bench/Item{i}",
+                "name": f"Bench Item {i}",
+                "category": categories[i % len(categories)],
+                "type": "Arcane" if i % len(categories) == 3 else "Misc",
+                "description": "Lorem ipsum dolor sit amet " * 8,
+                "levelStats": [{"stats": [f"+{rank * 10}% Bench Stat"]} for rank in range(6)],
+                "tradable": bool(i % 2),
+            }
+            f.write(("," if i else "") + json.dumps(item))
+        f.write("]")
+
+
+def run_mode(base_url, stream):
+    """Runs inside the child process and prints a JSON result line."""
+    import extract
+    import storage
+
+    extract.BASE_URL = base_url
+    with tempfile.TemporaryDirectory() as tmp:
+        extract.RAW_DIR = Path(tmp)
+        tracemalloc.start()
+        start = time.perf_counter()
+        extract.extract_endpoint("items", "arcanes.json", extract.is_arcane, force=True, stream=stream)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        count = len(storage.load_records(tmp, "arcanes"))
+
+    maxrss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"elapsed": elapsed, "py_peak": peak, "maxrss_kb": maxrss_kb, "arcanes": count}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200000, help="Items in the synthetic catalogue.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--stream", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_mode(args.child, args.stream)
+        return
+
+    with tempfile.TemporaryDirectory() as fixture_dir:
+        fixture = Path(fixture_dir) / "items"
+        write_fixture(fixture, args.items)
+        size_mb = fixture.stat().st_size / 1e6
+
+        handler = partial(QuietHandler, directory=fixture_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+        print(f"Fixture: {args.items} items, {size_mb:.1f} MB")
+        for label, stream in (("buffered", False), ("streaming", True)):
+            cmd = [sys.executable, __file__, "--child", base_url] + (["--stream"] if stream else [])
+            out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(
+                f"{label:<10} time={result['elapsed']:.2f}s  "
+                f"python_peak={result['py_peak'] / 1e6:.1f} MB  "
+                f"max_rss={result['maxrss_kb'] / 1e3:.1f} MB  "
+                f"arcanes={result['arcanes']}"
+            )
+
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
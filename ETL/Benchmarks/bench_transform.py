@@ -0,0 +1,59 @@
+"""
+Benchmark: serial vs process-pool transform on synthetic catalogues.
+
+Runs the in-memory transform for every entity at each scale (default 1x, 10x
+and 100x the live catalogue) serially and with process pools of several
+sizes, checking that the parallel output is identical to the serial one.
+Disk I/O is excluded so the numbers reflect the transform itself.
+
+Usage:
+    python ETL/Benchmarks/bench_transform.py [--scales 1,10,100] [--workers 2,4]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+import transform
+from fixtures import synthetic_catalogue
+
+
+def serial(raw_by_entity):
+    return {entity: list(transform.iter_transform(entity, raw)) for entity, raw in raw_by_entity.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Transform scaling benchmark.")
+    parser.add_argument("--scales", default="1,10,100", help="Comma-separated catalogue multiples.")
+    parser.add_argument("--workers", default=f"2,{os.cpu_count() or 4}", help="Comma-separated pool sizes.")
+    parser.add_argument("--chunk-size", type=int, default=transform.CHUNK_SIZE)
+    args = parser.parse_args()
+
+    scales = [float(s) for s in args.scales.split(",")]
+    pool_sizes = sorted({int(w) for w in args.workers.split(",")})
+
+    print(f"{'scale':>6}{'records':>10}{'mode':>12}{'seconds':>10}{'speedup':>9}")
+    for scale in scales:
+        raw_by_entity = synthetic_catalogue(scale)
+        records = sum(len(raw) for raw in raw_by_entity.values())
+
+        start = time.perf_counter()
+        expected = serial(raw_by_entity)
+        baseline = time.perf_counter() - start
+        print(f"{scale:>6g}{records:>10,}{'serial':>12}{baseline:>10.2f}{1:>9.2f}")
+
+        for workers in pool_sizes:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                start = time.perf_counter()
+                result = transform.parallel_transform(raw_by_entity, executor, args.chunk_size)
+                elapsed = time.perf_counter() - start
+            assert result == expected, "parallel output differs from serial output"
+            print(f"{scale:>6g}{records:>10,}{f'{workers} workers':>12}{elapsed:>10.2f}{baseline / elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
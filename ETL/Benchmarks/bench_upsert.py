@@ -0,0 +1,77 @@
+"""
+Benchmark: upsert reload after a simulated balance patch.
+
+Loads a synthetic catalogue into a SQLite stand-in, then applies a "patch"
+(tweaks stats on a few dozen weapons, removes and adds some mods) and
+reloads with load.bulk_load(..., upsert=True). Reports how many rows each
+reload actually touched next to a full truncate-and-reload.
+
+Usage:
+    python ETL/Benchmarks/bench_upsert.py [--scale 1] [--patched 30]
+"""
+import argparse
+import copy
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+
+import load
+import transform
+from fixtures import make_mod, synthetic_catalogue
+
+
+def processed(catalogue):
+    return {entity: list(transform.iter_transform(entity, raw)) for entity, raw in catalogue.items()}
+
+
+def timed_load(target, data, upsert=True):
+    start = time.perf_counter()
+    results = load.bulk_load(data.items(), target, upsert=upsert)
+    return time.perf_counter() - start, results
+
+
+def summarize(label, elapsed, results):
+    touched = {key: sum(counts[key] for counts in results.values()) for key in ("inserted", "updated", "deleted")}
+    print(f"{label:<22}{elapsed:>8.2f}s  inserted={touched['inserted']:<7} "
+          f"updated={touched['updated']:<7} soft-deleted={touched['deleted']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upsert reload benchmark.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size.")
+    parser.add_argument("--patched", type=int, default=30, help="Weapons whose stats change in the patch.")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    before = synthetic_catalogue(args.scale)
+    after = copy.deepcopy(before)
+    for weapon in rng.sample(after["weapons"], args.patched):
+        weapon["critChance"] = round(weapon["critChance"] + 0.02, 2)
+    del after["mods"][:5]
+    after["mods"] += [make_mod(len(before["mods"]) + i, rng) for i in range(10)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        target = f"sqlite:///{Path(tmp) / 'upsert.db'}"
+        summarize("initial load", *timed_load(target, processed(before)))
+        summarize("unchanged reload", *timed_load(target, processed(before)))
+        summarize("patch reload", *timed_load(target, processed(after)))
+
+        full_target = f"sqlite:///{Path(tmp) / 'full.db'}"
+        timed_load(full_target, processed(before))
+        conn = load.connect(full_target)
+        start = time.perf_counter()
+        for table, _ in load.TABLES.values():
+            conn.execute(f"DELETE FROM {table}")
+        conn.commit()
+        conn.close()
+        truncate = time.perf_counter() - start
+        elapsed, results = timed_load(full_target, processed(after))
+        summarize("truncate + reload", truncate + elapsed, results)
+
+
+if __name__ == "__main__":
+    main()
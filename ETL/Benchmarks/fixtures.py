@@ -0,0 +1,229 @@
+"""
+Synthetic warframestat-shaped catalogues for the ETL benchmarks.
+
+Scale 1 matches the live catalogue size seen in etl_load.log
+(114 warframes, 595 weapons, 1751 mods, 162 arcanes). The 'items'
+endpoint is every catalogue record plus ITEM_FILLER_COUNT per scale of
+resources, relics and the like, which the extract filters out.
+
+With messy > 0 that fraction of records takes one of the irregular shapes
+the live API serves: list-shaped damagePerShot, missing stats, helmets and
+skins without stats, mods without levelStats, markup and notes in stat
+lines, apostrophes and non-ASCII in names.
+
+Writes warframestat-shaped JSON files when run directly:
+    python ETL/Benchmarks/fixtures.py --scale 100 --messy 0.1 --out /tmp/catalogue
+"""
+import random
+import sys
+from pathlib import Path
+
+BASE_COUNTS = {"warframes": 114, "weapons": 595, "mods": 1751, "arcanes": 162}
+ITEM_FILLER_COUNT = 1500
+ITEM_FILLER_CATEGORIES = ["Resources", "Relics", "Skins", "Fish", "Gear", "Sentinels", "Misc"]
+# Arch-guns and arch-melee come through /weapons but the transform skips them
+MESSY_WEAPON_CATEGORIES = ["Arch-Gun", "Arch-Melee"]
+MESSY_NAMES = ["Kuva Bramma", "Ash's Edge", "Prisma Dual Cleavers", "Quellor \u2122", "Ga\u00efa"]
+MESSY_STATS = ["+40% <DT_FIRE_COLOR>Heat", "+90% Fire Rate (x2 for Bows)", "+30% Ability Strength, -10% Ability Efficiency",
+               "On Kill:\r\n+10% Damage for 12s", "+1.5x Critical Damage", "Combo Duration +5s"]
+
+POLARITIES = ["madurai", "vazarin", "naramon", "zenurik", "unairu", "penjaga", "umbra"]
+WEAPON_CATEGORIES = ["Primary", "Secondary", "Melee"]
+MOD_TYPES = ["Warframe Mod", "Rifle Mod", "Pistol Mod", "Melee Mod", "Shotgun Mod"]
+
+
+def make_warframe(i, rng):
+    return {
+        "uniqueName": f"/Lotus/Powersuits/Bench/Frame{i}",
+        "name": f"Frame {i}",
+        "category": "Warframes",
+        "type": "Warframe",
+        "armor": rng.choice([65, 100, 150, 225, 300, 600]),
+        "health": rng.choice([270, 455, 550, 640, 1100]),
+        "shield": rng.choice([0, 180, 270, 455, 640]),
+        "power": rng.choice([100, 150, 175, 200]),
+        "sprint": round(rng.uniform(0.9, 1.25), 2),
+        "abilities": [{"name": f"Ability {n}", "description": "Lorem ipsum dolor sit amet " * 3} for n in range(4)],
+        "description": "Lorem ipsum dolor sit amet " * 6,
+    }
+
+
+def make_weapon(i, rng):
+    return {
+        "uniqueName": f"/Lotus/Weapons/Bench/Weapon{i}",
+        "name": f"Weapon {i}",
+        "category": WEAPON_CATEGORIES[i % len(WEAPON_CATEGORIES)],
+        "masteryReq": rng.randint(0, 16),
+        "damage": {
+            "impact": round(rng.uniform(0, 60), 1),
+            "puncture": round(rng.uniform(0, 60), 1),
+            "slash": round(rng.uniform(0, 60), 1),
+            "total": 0,
+        },
+        "critChance": round(rng.uniform(0.02, 0.5), 2),
+        "critMult": round(rng.uniform(1.5, 3.2), 1),
+        "procChance": round(rng.uniform(0.02, 0.5), 2),
+        "fireRate": round(rng.uniform(0.5, 20), 2),
+        "magazineSize": rng.choice([1, 6, 30, 45, 60, 100, 200]),
+        "reloadTime": round(rng.uniform(0.5, 4), 1),
+        "multishot": rng.choice([1, 1, 1, 2, 5, 8]),
+        "description": "Lorem ipsum dolor sit amet " * 4,
+    }
+
+
+def make_mod(i, rng):
+    max_rank = rng.choice([3, 5, 10])
+    return {
+        "uniqueName": f"/Lotus/Upgrades/Mods/Bench/Mod{i}",
+        "name": f"Mod {i}",
+        "category": "Mods",
+        "type": MOD_TYPES[i % len(MOD_TYPES)],
+        "polarity": rng.choice(POLARITIES),
+        "fusionLimit": max_rank,
+        "baseDrain": rng.randint(2, 10),
+        "levelStats": [{"stats": [f"+{(rank + 1) * 15}% Critical Chance"]} for rank in range(max_rank + 1)],
+    }
+
+
+def make_arcane(i, rng):
+    return {
+        "uniqueName": f"/Lotus/Upgrades/CosmeticEnhancers/Bench/Arcane{i}",
+        "name": f"Arcane {i}",
+        "category": "Arcanes",
+        "type": "Arcane",
+        "levelStats": [{"stats": [f"On Kill: +{(rank + 1) * 10}% Damage for 12s"]} for rank in range(6)],
+    }
+
+
+def make_filler_item(i, rng):
+    return {
+        "uniqueName": f"/Lotus/Types/Bench/Item{i}",
+        "name": f"Item {i}",
+        "category": rng.choice(ITEM_FILLER_CATEGORIES),
+        "tradable": rng.random() < 0.5,
+        "description": "Lorem ipsum dolor sit amet " * 2,
+    }
+
+
+def mess_warframe(record, i, rng):
+    variant = rng.randrange(3)
+    if variant == 0:  # helmets and skins: no stats, skipped by the transform
+        for key in ("health", "armor", "shield", "power", "sprint", "abilities"):
+            record.pop(key)
+        record["category"] = rng.choice(["Warframes", "Skins"])
+    elif variant == 1:  # Sprint speed and shields missing
+        record.pop("sprint")
+        record.pop("shield")
+    else:  # only the type says it's a warframe
+        record.pop("category")
+        record["name"] = f"{rng.choice(MESSY_NAMES)} {i}"
+
+
+def mess_weapon(record, i, rng):
+    variant = rng.randrange(4)
+    if variant == 0:  # the older shape: 20-element damagePerShot list, no damage dict
+        damage = record.pop("damage")
+        record["damagePerShot"] = [damage["impact"], damage["puncture"], damage["slash"]] + [0.0] * 17
+        record["totalDamage"] = round(damage["impact"] + damage["puncture"] + damage["slash"], 1)
+    elif variant == 1:  # damage as a bare total next to the list
+        damage = record["damage"]
+        record["damage"] = round(damage["impact"] + damage["puncture"] + damage["slash"], 1)
+        record["damagePerShot"] = [damage["impact"], damage["puncture"], damage["slash"]]
+    elif variant == 2:  # stats missing
+        for key in rng.sample(["critChance", "critMult", "procChance", "fireRate", "magazineSize",
+                               "reloadTime", "multishot", "masteryReq"], 3):
+            record.pop(key)
+        record["damage"].pop("slash")
+    else:
+        record["category"] = rng.choice(MESSY_WEAPON_CATEGORIES)
+    record["name"] = f"{rng.choice(MESSY_NAMES)} {i}"
+
+
+def mess_mod(record, i, rng):
+    variant = rng.randrange(3)
+    if variant == 0:  # Riven-style and flawed mods carry no levelStats or drain
+        for key in ("levelStats", "baseDrain", "fusionLimit"):
+            record.pop(key)
+    elif variant == 1:
+        record.pop("polarity")
+        record["levelStats"] = [{"stats": [rng.choice(MESSY_STATS)]} for _ in record["levelStats"]]
+    else:
+        record["name"] = f"{rng.choice(MESSY_NAMES)} {i}"
+
+
+def mess_arcane(record, i, rng):
+    if rng.random() < 0.5:
+        record.pop("levelStats")
+    else:
+        record["levelStats"] = [{"stats": [rng.choice(MESSY_STATS)]} for _ in record["levelStats"]]
+
+
+MAKERS = {"warframes": make_warframe, "weapons": make_weapon, "mods": make_mod, "arcanes": make_arcane}
+MESSERS = {"warframes": mess_warframe, "weapons": mess_weapon, "mods": mess_mod, "arcanes": mess_arcane}
+
+
+def iter_entity(entity, scale=1, seed=42, messy=0.0):
+    """
+    Lazily yields one entity's raw records at `scale` times the live count,
+    so even 1000x catalogues can be written without holding them. Each
+    entity has its own seeded generator, so output doesn't depend on which
+    entities are generated.
+    """
+    rng = random.Random(f"{seed}-{entity}")
+    make, mess = MAKERS[entity], MESSERS[entity]
+    for i in range(int(BASE_COUNTS[entity] * scale)):
+        record = make(i, rng)
+        if messy and rng.random() < messy:
+            mess(record, i, rng)
+        yield record
+
+
+def iter_items(scale=1, seed=42, messy=0.0):
+    """
+    Lazily yields the 'items' endpoint: every catalogue entity (arcanes
+    first) then the filler items.
+    """
+    for entity in ("arcanes", "mods", "weapons", "warframes"):
+        yield from iter_entity(entity, scale, seed, messy)
+    rng = random.Random(f"{seed}-items")
+    for i in range(int(ITEM_FILLER_COUNT * scale)):
+        yield make_filler_item(i, rng)
+
+
+def synthetic_endpoints(scale=1, seed=42, messy=0.0):
+    """
+    Returns {endpoint: record iterator} for the endpoints extract.EXTRACTS fetches.
+    """
+    return {
+        "warframes": iter_entity("warframes", scale, seed, messy),
+        "weapons": iter_entity("weapons", scale, seed, messy),
+        "mods": iter_entity("mods", scale, seed, messy),
+        "items": iter_items(scale, seed, messy),
+    }
+
+
+def synthetic_catalogue(scale=1, seed=42, messy=0.0):
+    """
+    Returns {entity: [raw records]} at `scale` times the live catalogue size.
+    """
+    return {entity: list(iter_entity(entity, scale, seed, messy)) for entity in BASE_COUNTS}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    sys.path.append(str(Path(__file__).parent.parent / "Scripts"))
+    import storage
+
+    parser = argparse.ArgumentParser(description="Write a synthetic warframestat catalogue as JSON.")
+    parser.add_argument("--scale", type=float, default=1, help="Multiple of the live catalogue size (1 to 1000).")
+    parser.add_argument("--messy", type=float, default=0.1, help="Fraction of records in an irregular shape.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", required=True, help="Directory for warframes.json, weapons.json, mods.json and items.json.")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for endpoint, records in synthetic_endpoints(args.scale, args.seed, args.messy).items():
+        count = storage.write_records(records, out / f"{endpoint}.json", "json")
+        print(f"{endpoint}: {count:,} records")
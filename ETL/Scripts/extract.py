@@ -1,9 +1,24 @@
 import requests
 import json
 import os
+import codecs
 import time
+import random
+import hashlib
 import logging
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+
+import report
+import storage
+
+try:
+    import ijson
+except ImportError:  # optional: falls back to the pure-Python array splitter below
+    ijson = None
 
 # Configure logging
 logging.basicConfig(
@@ -18,77 +33,383 @@ logging.basicConfig(
 BASE_URL = "https://api.warframestat.us"
 RAW_DIR = Path(__file__).parent.parent / "Raw"
 
+# Upper bound on parallel requests; also sizes the shared connection pool.
+MAX_WORKERS = 4
+# Ceiling for a single backoff sleep, in seconds.
+MAX_BACKOFF = 30
+# Per-endpoint ETag / Last-Modified / content hash from previous runs.
+MANIFEST_FILENAME = "manifest.json"
+# Bytes read from the socket at a time when streaming a response.
+CHUNK_SIZE = 64 * 1024
+
 # Ensure Raw directory exists
 RAW_DIR.mkdir(parents=True, exist_ok=True)
 
-def fetch_data(endpoint, retries=3, delay=2):
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
     """
-    Fetches data from the specified API endpoint with retry logic.
+    Returns the shared keep-alive session, creating it on first use.
+    The adapter pool is sized so every worker can hold its own connection.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+def backoff_delay(attempt, delay=2):
+    """
+    Exponential backoff with full jitter: a random sleep in [0, delay * 2^attempt],
+    capped at MAX_BACKOFF, so parallel workers don't retry in lockstep.
+    """
+    return random.uniform(0, min(MAX_BACKOFF, delay * (2 ** attempt)))
+
+def request_endpoint(endpoint, headers=None, retries=3, delay=2, session=None, stream=False):
+    """
+    GETs the specified API endpoint with retry logic and returns the response.
+    A 304 Not Modified is returned as-is; other error statuses raise.
+    With stream=True the body is left on the socket for iter_content().
     """
     url = f"{BASE_URL}/{endpoint}"
+    session = session or get_session()
     logging.info(f"Fetching data from {url}...")
     
     for attempt in range(retries):
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            logging.info(f"Successfully fetched {len(data)} items from {endpoint}.")
-            return data
+            response = session.get(url, headers=headers, timeout=30, stream=stream)
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
         except requests.exceptions.RequestException as e:
             logging.warning(f"Attempt {attempt + 1}/{retries} failed for {endpoint}: {e}")
             if attempt < retries - 1:
-                time.sleep(delay)
+                time.sleep(backoff_delay(attempt, delay))
             else:
                 logging.error(f"Failed to fetch data from {endpoint} after {retries} attempts.")
                 raise
 
-def save_json(data, filename):
+def fetch_data(endpoint, retries=3, delay=2, session=None):
+    """
+    Fetches data from the specified API endpoint with retry logic.
+    """
+    response = request_endpoint(endpoint, retries=retries, delay=delay, session=session)
+    data = response.json()
+    logging.info(f"Successfully fetched {len(data)} items from {endpoint}.")
+    return data
+
+def manifest_path():
+    return RAW_DIR / MANIFEST_FILENAME
+
+def load_manifest():
+    """
+    Loads the raw snapshot manifest, or an empty one if none exists yet.
+    """
+    try:
+        with open(manifest_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (IOError, ValueError):
+        return {}
+
+def save_manifest(manifest):
+    filepath = manifest_path()
+    tmp_path = filepath.with_suffix(".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=4, sort_keys=True)
+    os.replace(tmp_path, filepath)
+
+def conditional_headers(entry):
+    headers = {}
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+def has_changes(manifest=None):
     """
-    Saves data to a JSON file in the ETL/Raw directory.
+    True if any raw snapshot has not yet been consumed by transform/load.
+    This is the "no change" signal downstream stages use to short-circuit.
+    """
+    manifest = load_manifest() if manifest is None else manifest
+    if not manifest:
+        return True
+    return any(entry.get("sha256") != entry.get("consumed_sha256") for entry in manifest.values())
+
+def mark_consumed():
+    """
+    Records that the current raw snapshots have been processed downstream.
+    Called by the pipeline once load has succeeded.
+    """
+    manifest = load_manifest()
+    for entry in manifest.values():
+        entry["consumed_sha256"] = entry.get("sha256")
+    save_manifest(manifest)
+
+def save_json(data, filename, fmt=None):
+    """
+    Saves data to the ETL/Raw directory in the configured storage format.
+    Returns the path written.
     """
-    filepath = RAW_DIR / filename
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        filepath, _ = storage.save_records(data, RAW_DIR, filename, fmt)
         logging.info(f"Saved data to {filepath}")
+        return filepath
     except IOError as e:
-        logging.error(f"Failed to save data to {filepath}: {e}")
+        logging.error(f"Failed to save data to {RAW_DIR / filename}: {e}")
         raise
 
-def run_extraction():
+class _ChunkReader:
+    """
+    Minimal file-like wrapper so ijson can read from an iterator of byte chunks.
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buffer = b""
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+def iter_json_array(chunks):
+    """
+    Incrementally yields the elements of a top-level JSON array from an
+    iterable of byte chunks, so only one element (plus the current chunk)
+    is held in memory at a time. Uses ijson when it is installed.
+    """
+    if ijson is not None:
+        yield from ijson.items(_ChunkReader(chunks), "item", use_float=True)
+        return
+
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    started = False
+    exhausted = False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,\ufeff":
+            pos += 1
+
+        if pos < len(buffer):
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a top-level JSON array")
+                started = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                end = None
+            # A value is only complete once the next separator is in the
+            # buffer; otherwise it may be truncated (e.g. a number split
+            # across chunks), so wait for more data.
+            if end is not None:
+                nxt = end
+                while nxt < len(buffer) and buffer[nxt] in " \t\r\n":
+                    nxt += 1
+                if nxt < len(buffer) and buffer[nxt] in ",]":
+                    yield item
+                    pos = nxt
+                    continue
+                if exhausted:
+                    raise ValueError("Unexpected end of JSON array")
+        elif exhausted:
+            raise ValueError("Unexpected end of JSON array")
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[pos:] + utf8.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + utf8.decode(chunk)
+        pos = 0
+
+def is_arcane(item):
+    return item.get('category') == 'Arcanes'
+
+# (endpoint, output name, optional record filter)
+# The direct 'arcanes' endpoint returns simplified data without uniqueName.
+# We fetch from 'items' and filter for category 'Arcanes'.
+EXTRACTS = [
+    ("warframes", "warframes", None),
+    ("weapons", "weapons", None),
+    ("mods", "mods", None),
+    ("items", "arcanes", is_arcane),
+]
+
+def iter_endpoint(endpoint, record_filter=None):
+    """
+    Yields the (optionally filtered) records of an endpoint as they are parsed
+    off the socket, without writing a raw snapshot. Used by the streaming
+    pipeline; always does a full, unconditional fetch.
+    """
+    response = request_endpoint(endpoint, stream=True)
+    with response:
+        records = iter_json_array(response.iter_content(CHUNK_SIZE))
+        if record_filter is not None:
+            records = filter(record_filter, records)
+        yield from records
+
+def snapshot_entry(response, digest, size, filename):
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "sha256": digest,
+        "bytes": size,
+        "file": filename,
+    }
+
+def extract_endpoint(endpoint, filename, record_filter=None, manifest=None, force=False, stream=True):
+    """
+    Fetches one endpoint, applies the optional filter and saves the result.
+    Sends a conditional request using the manifest entry; on a 304 or an
+    unchanged content hash the raw file is left untouched.
+    With stream=True the response is parsed incrementally, so even the full
+    'items' catalogue is never held in memory at once.
+    Returns a dict with the wall and thread CPU time, whether the snapshot
+    changed, and the records parsed / kept and bytes fetched / written for
+    the run report (None where a 304 or buffered no-change skipped them).
+    """
+    start, cpu_start = time.perf_counter(), time.thread_time()
+    counts = dict.fromkeys(["records_in", "records_out", "bytes_read", "bytes_written"])
+    manifest = {} if manifest is None else manifest
+    entry = manifest.get(endpoint, {})
+    have_snapshot = storage.find(RAW_DIR, filename) is not None
+
+    headers = conditional_headers(entry) if have_snapshot and not force else {}
+    response = request_endpoint(endpoint, headers=headers, stream=stream)
+
+    if response.status_code == 304:
+        changed = False
+        counts.update(records_in=0, records_out=0, bytes_read=0, bytes_written=0)
+        logging.info(f"{endpoint} not modified (304); keeping {filename}.")
+    elif stream:
+        # Parse straight off the socket into a temp file, hashing as we go;
+        # the temp file only replaces the snapshot if the content changed.
+        hasher = hashlib.sha256()
+        size = 0
+
+        def chunks():
+            nonlocal size
+            for chunk in response.iter_content(CHUNK_SIZE):
+                hasher.update(chunk)
+                size += len(chunk)
+                yield chunk
+
+        parsed = records = report.Counted(iter_json_array(chunks()))
+        if record_filter is not None:
+            records = filter(record_filter, records)
+        filepath = storage.path_for(RAW_DIR, filename)
+        tmp_path = filepath.with_name(filepath.name + ".part")
+        count = storage.write_records(records, tmp_path, storage.format_of(filepath))
+
+        digest = hasher.hexdigest()
+        changed = force or not have_snapshot or digest != entry.get("sha256")
+        counts.update(records_in=parsed.count, records_out=count, bytes_read=size, bytes_written=0)
+        if changed:
+            os.replace(tmp_path, filepath)
+            counts["bytes_written"] = report.file_size(filepath)
+            logging.info(f"Streamed {count} items from {endpoint} ({size} bytes) to {filepath.name}.")
+        else:
+            tmp_path.unlink()
+            logging.info(f"{endpoint} content hash unchanged; keeping {filename}.")
+        entry = {**entry, **snapshot_entry(response, digest, size, filename)}
+    else:
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        changed = force or not have_snapshot or digest != entry.get("sha256")
+        counts.update(bytes_read=len(body), bytes_written=0)
+        if changed:
+            data = response.json()
+            logging.info(f"Successfully fetched {len(data)} items from {endpoint}.")
+            counts["records_in"] = len(data)
+            if record_filter is not None:
+                data = [item for item in data if record_filter(item)]
+            counts.update(records_out=len(data), bytes_written=report.file_size(save_json(data, filename)))
+        else:
+            logging.info(f"{endpoint} content hash unchanged; keeping {filename}.")
+        entry = {**entry, **snapshot_entry(response, digest, len(body), filename)}
+    manifest[endpoint] = entry
+
+    elapsed = time.perf_counter() - start
+    logging.info(f"Extracted {endpoint} -> {filename} in {elapsed:.2f}s ({'changed' if changed else 'unchanged'})")
+    return {"elapsed": elapsed, "cpu": time.thread_time() - cpu_start, "changed": changed, **counts}
+
+def run_extraction(concurrent=True, max_workers=MAX_WORKERS, force=False, stream=True):
     """
     Main extraction function.
+    With concurrent=True all endpoints are fetched in parallel over the shared
+    session, so the run takes roughly as long as the slowest endpoint.
+    force=True ignores the manifest and rewrites every raw file.
+    stream=False buffers each response and parses it in one go.
+    Returns a dict of endpoint -> extract_endpoint's result
+    ({"elapsed": seconds, "changed": bool, ...}). A failed endpoint raises;
+    the manifest still records the endpoints that were fetched.
     """
-    logging.info("Starting extraction process...")
+    logging.info(f"Starting extraction process ({'concurrent' if concurrent else 'sequential'})...")
+    start = time.perf_counter()
+    manifest = load_manifest()
+    results = {}
     
     try:
-        # 1. Warframes
-        warframes = fetch_data("warframes")
-        save_json(warframes, "warframes.json")
-
-        # 2. Weapons
-        weapons = fetch_data("weapons")
-        save_json(weapons, "weapons.json")
-
-        # 3. Mods
-        mods = fetch_data("mods")
-        save_json(mods, "mods.json")
-
-        # 4. Arcanes
-        # The direct 'arcanes' endpoint returns simplified data without uniqueName.
-        # We fetch from 'items' and filter for category 'Arcanes'.
-        logging.info("Fetching Arcanes from 'items' endpoint...")
-        items = fetch_data("items")
-        arcanes = [item for item in items if item.get('category') == 'Arcanes']
-        save_json(arcanes, "arcanes.json")
-
-        logging.info("Extraction process completed successfully.")
+        if concurrent:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="extract") as executor:
+                futures = {
+                    endpoint: executor.submit(extract_endpoint, endpoint, filename, record_filter, manifest, force, stream)
+                    for endpoint, filename, record_filter in EXTRACTS
+                }
+                for endpoint, future in futures.items():
+                    results[endpoint] = future.result()
+        else:
+            for endpoint, filename, record_filter in EXTRACTS:
+                results[endpoint] = extract_endpoint(endpoint, filename, record_filter, manifest, force, stream)
+
+        total = time.perf_counter() - start
+        summary = ", ".join(f"{endpoint}={result['elapsed']:.2f}s" for endpoint, result in results.items())
+        changed = [endpoint for endpoint, result in results.items() if result["changed"]]
+        logging.info(f"Extraction process completed successfully in {total:.2f}s ({summary}).")
+        logging.info(f"Changed endpoints: {', '.join(changed) if changed else 'none'}")
         
     except Exception as e:
         logging.error(f"Extraction process failed: {e}")
-        # We might want to re-raise if this is part of a larger pipeline
-        # raise 
+        # The pipeline stops here and reports the run as failed
+        raise
+    finally:
+        save_manifest(manifest)
+
+    return results
 
 if __name__ == "__main__":
-    run_extraction()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Extract raw Warframe data.")
+    parser.add_argument("--sequential", action="store_true", help="Fetch endpoints one after another.")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS, help="Parallel fetch workers.")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and rewrite every raw file.")
+    parser.add_argument("--no-stream", action="store_true", help="Buffer whole responses instead of parsing incrementally.")
+    args = parser.parse_args()
+    try:
+        run_extraction(concurrent=not args.sequential, max_workers=args.workers, force=args.force,
+                       stream=not args.no_stream)
+    except Exception:
+        sys.exit(1)
@@ -1,8 +1,14 @@
 import json
 import os
+import time
+import textwrap
+import sqlite3
 import logging
 from pathlib import Path
 
+import report
+import storage
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -15,14 +21,22 @@ logging.basicConfig(
 
 PROCESSED_DIR = Path(__file__).parent.parent / "Processed"
 OUTPUT_SQL_FILE = Path(__file__).parent.parent / "load_data.sql"
+SQLITE_SCHEMA_FILE = Path(__file__).parent.parent.parent / "DB" / "sqlite_schema.sql"
+
+# Rows sent per executemany() call in direct-load mode.
+BATCH_SIZE = 1000
+# Direct-load target: "sqlite:///path.db" for the local stand-in, otherwise an
+# ODBC connection string for SQL Server.
+DB_TARGET = os.environ.get("WF_DB_TARGET", "")
 
 def load_json(filename):
-    filepath = PROCESSED_DIR / filename
+    """
+    Loads processed records in whatever storage format they were saved in.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except IOError as e:
-        logging.error(f"Failed to load {filepath}: {e}")
+        return storage.load_records(PROCESSED_DIR, filename)
+    except (IOError, ValueError) as e:
+        logging.error(f"Failed to load {filename} from {PROCESSED_DIR}: {e}")
         return []
 
 def escape_sql(value):
@@ -35,151 +49,503 @@ def escape_sql(value):
     # String escaping
     return "'" + str(value).replace("'", "''") + "'"
 
-def generate_insert_warframes(data):
-    statements = []
-    for item in data:
-        cols = ["UniqueName", "Name", "Armor", "Health", "Shields", "Energy", "SprintSpeed", "RawJson"]
-        vals = [
-            escape_sql(item.get("UniqueName")),
-            escape_sql(item.get("Name")),
-            escape_sql(item.get("Armor")),
-            escape_sql(item.get("Health")),
-            escape_sql(item.get("Shields")),
-            escape_sql(item.get("Energy")),
-            escape_sql(item.get("SprintSpeed")),
-            escape_sql(item.get("RawJson"))
-        ]
-        
-        # Idempotent insert
-        unique_name = escape_sql(item.get("UniqueName"))
-        sql = f"""
-        IF NOT EXISTS (SELECT 1 FROM [wf_base].[Warframes] WHERE UniqueName = {unique_name})
+# Entity name -> (target table, columns in insert order)
+TABLES = {
+    "warframes": ("[wf_base].[Warframes]",
+                  ["UniqueName", "Name", "Armor", "Health", "Shields", "Energy", "SprintSpeed", "RawJson"]),
+    "weapons": ("[wf_base].[Weapons]",
+                ["UniqueName", "Name", "Type", "MasteryRank", "Impact", "Puncture", "Slash", 
+                 "CritChance", "CritMultiplier", "StatusChance", "FireRate", "MagazineSize", 
+                 "ReloadTime", "Multishot", "TotalDamage", "AvgCritMultiplier", "BurstDPS",
+                 "SustainedDPS", "RawJson"]),
+    "mods": ("[wf_base].[Mods]",
+             ["UniqueName", "Name", "ModType", "Polarity", "MaxRank", "RawJson"]),
+    "arcanes": ("[wf_base].[Arcanes]",
+                ["UniqueName", "Name", "ItemType", "MaxRank", "RawJson"]),
+}
+
+# Entity name -> (side table, parent key) for the per-rank stats transform
+# explodes from levelStats (DB/migrations/007_rank_stats.sql)
+RANK_TABLES = {
+    "mods": ("[wf_base].[ModRankStats]", "ModId"),
+    "arcanes": ("[wf_base].[ArcaneRankStats]", "ArcaneId"),
+}
+RANK_COLUMNS = ["Rank", "Position", "Stat", "Value", "Unit", "Text"]
+# Staged rank rows carry the parent's UniqueName in place of its key
+RANK_STAGE_COLUMNS = ["UniqueName"] + RANK_COLUMNS
+
+def rank_records(item):
+    """
+    The record's RankStats rows, each tagged with the record's UniqueName.
+    """
+    return [{"UniqueName": item.get("UniqueName"), **row} for row in item.get("RankStats") or []]
+
+def generate_insert(entity, item):
+    """
+    Idempotent insert statement for one processed record, plus its rank
+    stats when the entity has a side table.
+    """
+    table, cols = TABLES[entity]
+    vals = [escape_sql(item.get(col)) for col in cols]
+    
+    unique_name = escape_sql(item.get("UniqueName"))
+    ranks = ""
+    if entity in RANK_TABLES and item.get("RankStats"):
+        rank_table, key = RANK_TABLES[entity]
+        rows = ",\n                   ".join(
+            "(SCOPE_IDENTITY(), " + ", ".join(escape_sql(row.get(col)) for col in RANK_COLUMNS) + ")"
+            for row in item["RankStats"]
+        )
+        ranks = f"""
+            INSERT INTO {rank_table} ({key}, {', '.join(RANK_COLUMNS)})
+            VALUES {rows};"""
+    return f"""
+        IF NOT EXISTS (SELECT 1 FROM {table} WHERE UniqueName = {unique_name})
         BEGIN
-            INSERT INTO [wf_base].[Warframes] ({', '.join(cols)})
-            VALUES ({', '.join(vals)});
+            INSERT INTO {table} ({', '.join(cols)})
+            VALUES ({', '.join(vals)});{ranks}
         END
         """
-        statements.append(sql)
-    return statements
+
+def generate_insert_warframes(data):
+    return [generate_insert("warframes", item) for item in data]
 
 def generate_insert_weapons(data):
-    statements = []
-    for item in data:
-        cols = ["UniqueName", "Name", "Type", "MasteryRank", "Impact", "Puncture", "Slash", 
-                "CritChance", "CritMultiplier", "StatusChance", "FireRate", "MagazineSize", 
-                "ReloadTime", "Multishot", "RawJson"]
-        vals = [
-            escape_sql(item.get("UniqueName")),
-            escape_sql(item.get("Name")),
-            escape_sql(item.get("Type")),
-            escape_sql(item.get("MasteryRank")),
-            escape_sql(item.get("Impact")),
-            escape_sql(item.get("Puncture")),
-            escape_sql(item.get("Slash")),
-            escape_sql(item.get("CritChance")),
-            escape_sql(item.get("CritMultiplier")),
-            escape_sql(item.get("StatusChance")),
-            escape_sql(item.get("FireRate")),
-            escape_sql(item.get("MagazineSize")),
-            escape_sql(item.get("ReloadTime")),
-            escape_sql(item.get("Multishot")),
-            escape_sql(item.get("RawJson"))
-        ]
-        
-        unique_name = escape_sql(item.get("UniqueName"))
-        sql = f"""
-        IF NOT EXISTS (SELECT 1 FROM [wf_base].[Weapons] WHERE UniqueName = {unique_name})
-        BEGIN
-            INSERT INTO [wf_base].[Weapons] ({', '.join(cols)})
-            VALUES ({', '.join(vals)});
-        END
-        """
-        statements.append(sql)
-    return statements
+    return [generate_insert("weapons", item) for item in data]
 
 def generate_insert_mods(data):
-    statements = []
-    for item in data:
-        cols = ["UniqueName", "Name", "ModType", "Polarity", "MaxRank", "RawJson"]
-        vals = [
-            escape_sql(item.get("UniqueName")),
-            escape_sql(item.get("Name")),
-            escape_sql(item.get("ModType")),
-            escape_sql(item.get("Polarity")),
-            escape_sql(item.get("MaxRank")),
-            escape_sql(item.get("RawJson"))
-        ]
-        
-        unique_name = escape_sql(item.get("UniqueName"))
-        sql = f"""
-        IF NOT EXISTS (SELECT 1 FROM [wf_base].[Mods] WHERE UniqueName = {unique_name})
-        BEGIN
-            INSERT INTO [wf_base].[Mods] ({', '.join(cols)})
-            VALUES ({', '.join(vals)});
-        END
-        """
-        statements.append(sql)
-    return statements
+    return [generate_insert("mods", item) for item in data]
 
 def generate_insert_arcanes(data):
-    statements = []
-    for item in data:
-        cols = ["UniqueName", "Name", "ItemType", "MaxRank", "RawJson"]
-        vals = [
-            escape_sql(item.get("UniqueName")),
-            escape_sql(item.get("Name")),
-            escape_sql(item.get("ItemType")),
-            escape_sql(item.get("MaxRank")),
-            escape_sql(item.get("RawJson"))
-        ]
-        
-        unique_name = escape_sql(item.get("UniqueName"))
-        sql = f"""
-        IF NOT EXISTS (SELECT 1 FROM [wf_base].[Arcanes] WHERE UniqueName = {unique_name})
-        BEGIN
-            INSERT INTO [wf_base].[Arcanes] ({', '.join(cols)})
-            VALUES ({', '.join(vals)});
-        END
-        """
-        statements.append(sql)
-    return statements
+    return [generate_insert("arcanes", item) for item in data]
 
-def run_load():
-    logging.info("Starting load process (generating SQL)...")
-    
-    all_statements = []
-    all_statements.append("BEGIN TRANSACTION;")
-    all_statements.append("-- Auto-generated by ETL/Scripts/load.py")
-    
-    # 1. Warframes
-    warframes = load_json("warframes.json")
-    all_statements.extend(generate_insert_warframes(warframes))
-    logging.info(f"Generated {len(warframes)} inserts for Warframes.")
-    
-    # 2. Weapons
-    weapons = load_json("weapons.json")
-    all_statements.extend(generate_insert_weapons(weapons))
-    logging.info(f"Generated {len(weapons)} inserts for Weapons.")
-    
-    # 3. Mods
-    mods = load_json("mods.json")
-    all_statements.extend(generate_insert_mods(mods))
-    logging.info(f"Generated {len(mods)} inserts for Mods.")
-    
-    # 4. Arcanes
-    arcanes = load_json("arcanes.json")
-    all_statements.extend(generate_insert_arcanes(arcanes))
-    logging.info(f"Generated {len(arcanes)} inserts for Arcanes.")
-    
-    all_statements.append("COMMIT TRANSACTION;")
-    all_statements.append("PRINT 'Data loaded successfully';")
-    
+def bump_data_version(sqlite=False):
+    """
+    Statement incrementing the catalogue data version the API polls to
+    invalidate its cache (DB/migrations/004_data_version.sql). On SQL Server
+    it is skipped when the migration hasn't been applied.
+    """
+    if sqlite:
+        return "UPDATE [wf_base].[DataVersion] SET Version = Version + 1, LoadedAt = CURRENT_TIMESTAMP WHERE Id = 1"
+    return ("IF OBJECT_ID('wf_base.DataVersion', 'U') IS NOT NULL\n"
+            "    UPDATE [wf_base].[DataVersion] SET Version = Version + 1, LoadedAt = SYSDATETIME() WHERE Id = 1")
+
+def write_load_script(sections, filepath=None):
+    """
+    Streams the load script to filepath one statement at a time.
+    sections is an iterable of (entity, records) pairs; records may be a
+    generator. Returns a dict of entity -> statements written.
+    """
+    filepath = filepath or OUTPUT_SQL_FILE
+    counts = {}
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write("BEGIN TRANSACTION;\n")
+        f.write("-- Auto-generated by ETL/Scripts/load.py")
+        for entity, records in sections:
+            count = 0
+            for item in records:
+                f.write("\n")
+                f.write(generate_insert(entity, item))
+                count += 1
+            counts[entity] = count
+            logging.info(f"Generated {count} inserts for {entity.capitalize()}.")
+        f.write("\n" + bump_data_version() + ";")
+        f.write("\nCOMMIT TRANSACTION;")
+        f.write("\nPRINT 'Data loaded successfully';")
+    return counts
+
+def connect(target):
+    """
+    Opens a DB-API connection for direct loading.
+    "sqlite:///<path>" opens the SQLite stand-in, attaching [wf_base] and
+    [wf_user] as sibling databases and creating the tables if needed.
+    Anything else is treated as an ODBC connection string for SQL Server.
+    """
+    if target.startswith("sqlite:///"):
+        path = target[len("sqlite:///"):]
+        conn = sqlite3.connect(path)
+        for schema in ("wf_base", "wf_user"):
+            schema_path = ":memory:" if path == ":memory:" else f"{Path(path).with_suffix('')}.{schema}.db"
+            conn.execute("ATTACH DATABASE ? AS " + schema, (schema_path,))
+        conn.executescript(SQLITE_SCHEMA_FILE.read_text(encoding="utf-8"))
+        return conn
+
+    import pyodbc
+    return pyodbc.connect(target, autocommit=False)
+
+def is_sqlite(conn):
+    return isinstance(conn, sqlite3.Connection)
+
+def batched(records, size=BATCH_SIZE):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def load_columns(entity, upsert=False):
+    """
+    Columns written for entity; upserts also carry the ContentHash from
+    transform (needs DB/migrations/002_content_hash.sql).
+    """
+    table, cols = TABLES[entity]
+    return table, cols + ["ContentHash"] if upsert else cols
+
+# Rows an upsert rewrites: ContentHash differs or the row was soft-deleted
+CHANGED = "(t.ContentHash IS NULL OR t.ContentHash <> s.ContentHash OR t.IsDeleted = 1)"
+
+def merge_statements(entity, stage, sqlite, upsert=False, soft_delete=True, output=True):
+    """
+    Set-based statements applying the staging table to the target table, as
+    (action, sql) pairs.
+    Without upsert, rows whose UniqueName already exists are left alone, like
+    the script mode. With upsert, existing rows are updated only when their
+    ContentHash differs (or they were soft-deleted), and with soft_delete,
+    live rows missing from the staging table are flagged IsDeleted = 1.
+    SQL Server gets a single MERGE; SQLite has no MERGE, so it gets one
+    UPDATE ... FROM / INSERT ... SELECT / UPDATE per action instead.
+    """
+    table, cols = load_columns(entity, upsert)
+    col_list = ", ".join(cols)
+    source_cols = ", ".join("s." + col for col in cols)
+    changed = CHANGED
+
+    if sqlite:
+        statements = []
+        if upsert:
+            assignments = ", ".join(f"{col} = s.{col}" for col in cols if col != "UniqueName")
+            statements.append(("UPDATE", f"""
+                UPDATE {table} AS t
+                SET {assignments}, IsDeleted = 0, UpdatedAt = CURRENT_TIMESTAMP
+                FROM {stage} AS s
+                WHERE t.UniqueName = s.UniqueName AND {changed}
+            """))
+        # Anti-join rather than NOT EXISTS so SQLite can build an automatic
+        # index on the target when UniqueName isn't indexed.
+        statements.append(("INSERT", f"""
+            INSERT INTO {table} ({col_list})
+            SELECT {source_cols} FROM {stage} AS s
+            LEFT JOIN {table} AS t ON t.UniqueName = s.UniqueName
+            WHERE t.rowid IS NULL
+        """))
+        if upsert and soft_delete:
+            statements.append(("DELETE", f"""
+                UPDATE {table} AS t
+                SET IsDeleted = 1, UpdatedAt = CURRENT_TIMESTAMP
+                WHERE t.IsDeleted = 0
+                  AND NOT EXISTS (SELECT 1 FROM {stage} AS s WHERE s.UniqueName = t.UniqueName)
+            """))
+        return statements
+
+    clauses = []
+    if upsert:
+        assignments = ", ".join(f"t.{col} = s.{col}" for col in cols if col != "UniqueName")
+        clauses.append(f"""
+        WHEN MATCHED AND {changed} THEN
+            UPDATE SET {assignments}, t.IsDeleted = 0, t.UpdatedAt = SYSDATETIME()""")
+    clauses.append(f"""
+        WHEN NOT MATCHED BY TARGET THEN
+            INSERT ({col_list}) VALUES ({source_cols})""")
+    if upsert and soft_delete:
+        clauses.append("""
+        WHEN NOT MATCHED BY SOURCE AND t.IsDeleted = 0 THEN
+            UPDATE SET t.IsDeleted = 1, t.UpdatedAt = SYSDATETIME()""")
+    output_clause = """
+        OUTPUT $action, inserted.IsDeleted""" if output else ""
+    return [("MERGE", f"""
+        MERGE {table} WITH (HOLDLOCK) AS t
+        USING {stage} AS s
+            ON t.UniqueName = s.UniqueName{"".join(clauses)}{output_clause};
+    """)]
+
+def rank_stage_statement(entity, sqlite):
+    """
+    Creates the staging table for the entity's rank-stat rows; returns its name.
+    """
+    stage = f"stage_{entity}_ranks" if sqlite else f"#stage_{entity}_ranks"
+    create, text_type = ("CREATE TEMP TABLE", "TEXT") if sqlite else ("CREATE TABLE", "nvarchar(max)")
+    return stage, f"""
+        {create} {stage} (
+            UniqueName nvarchar(200), Rank int, Position int, Stat nvarchar(100), Value float,
+            Unit nvarchar(10), Text {text_type}
+        )
+    """
+
+def changed_statement(entity, stage, sqlite, upsert=False):
+    """
+    Saves the UniqueNames the merge is about to insert (and, with upsert,
+    rewrite) into a temp table, so only their rank stats are replaced.
+    Must run before the merge. Returns (temp table, sql).
+    """
+    table, _ = TABLES[entity]
+    changed = f"changed_{entity}" if sqlite else f"#changed_{entity}"
+    condition = f"t.UniqueName IS NULL OR {CHANGED}" if upsert else "t.UniqueName IS NULL"
+    select = f"""
+        SELECT s.UniqueName {{into}}FROM {stage} AS s
+        LEFT JOIN {table} AS t ON t.UniqueName = s.UniqueName
+        WHERE {condition}
+    """
+    if sqlite:
+        return changed, f"CREATE TEMP TABLE {changed} AS" + select.format(into="")
+    return changed, select.format(into=f"INTO {changed} ")
+
+def rank_statements(entity, rank_stage, changed):
+    """
+    Replaces the side-table rank stats of the changed rows with the staged
+    ones, after the merge has given new rows their keys. Plain SQL that
+    runs on both SQL Server and SQLite.
+    """
+    table, _ = TABLES[entity]
+    rank_table, key = RANK_TABLES[entity]
+    cols = ", ".join(RANK_COLUMNS)
+    return [
+        f"""
+        DELETE FROM {rank_table}
+        WHERE {key} IN (SELECT t.{key} FROM {table} AS t JOIN {changed} AS c ON c.UniqueName = t.UniqueName)
+        """,
+        f"""
+        INSERT INTO {rank_table} ({key}, {cols})
+        SELECT t.{key}, {", ".join("r." + col for col in RANK_COLUMNS)}
+        FROM {rank_stage} AS r
+        JOIN {changed} AS c ON c.UniqueName = r.UniqueName
+        JOIN {table} AS t ON t.UniqueName = r.UniqueName
+        """,
+    ]
+
+def apply_merge(cursor, statements, sqlite):
+    """
+    Runs the merge statements and returns counts of inserted/updated/deleted rows.
+    """
+    counts = {"inserted": 0, "updated": 0, "deleted": 0}
+    if sqlite:
+        labels = {"INSERT": "inserted", "UPDATE": "updated", "DELETE": "deleted"}
+        for action, sql in statements:
+            cursor.execute(sql)
+            counts[labels[action]] += max(cursor.rowcount, 0)
+        return counts
+
+    for _, sql in statements:
+        cursor.execute(sql)
+        for action, is_deleted in cursor.fetchall():
+            if action == "INSERT":
+                counts["inserted"] += 1
+            elif action == "UPDATE" and is_deleted:
+                # Soft deletes are UPDATEs as far as MERGE is concerned; changed rows are revived (IsDeleted = 0).
+                counts["deleted"] += 1
+            elif action == "UPDATE":
+                counts["updated"] += 1
+    return counts
+
+def drop_temp_table(cursor, name, sqlite):
+    if sqlite:
+        cursor.execute(f"DROP TABLE IF EXISTS temp.{name}")
+    else:
+        cursor.execute(f"IF OBJECT_ID('tempdb..{name}') IS NOT NULL DROP TABLE {name}")
+
+def bulk_load_entity(conn, entity, records, upsert=False):
+    """
+    Streams records into a staging table in BATCH_SIZE executemany() batches
+    (fast_executemany on pyodbc), then applies one set-based merge to the
+    target table. Entities with a RANK_TABLES side table stage their rank
+    stats alongside and replace those of every row the merge inserts or
+    rewrites. Returns counts of staged/inserted/updated/deleted rows, plus
+    rank_stats written where there is a side table.
+    """
+    table, cols = load_columns(entity, upsert)
+    sqlite = is_sqlite(conn)
+    stage = f"stage_{entity}" if sqlite else f"#stage_{entity}"
+    cursor = conn.cursor()
+
+    drop_temp_table(cursor, stage, sqlite)
+    if sqlite:
+        cursor.execute(f"CREATE TEMP TABLE {stage} AS SELECT {', '.join(cols)} FROM {table} WHERE 0")
+    else:
+        cursor.execute(f"SELECT TOP 0 {', '.join(cols)} INTO {stage} FROM {table}")
+        cursor.fast_executemany = True
+
+    rank_stage = None
+    if entity in RANK_TABLES:
+        rank_stage, create = rank_stage_statement(entity, sqlite)
+        drop_temp_table(cursor, rank_stage, sqlite)
+        cursor.execute(create)
+        rank_insert = (f"INSERT INTO {rank_stage} ({', '.join(RANK_STAGE_COLUMNS)}) "
+                       f"VALUES ({', '.join('?' for _ in RANK_STAGE_COLUMNS)})")
+
+    insert = f"INSERT INTO {stage} ({', '.join(cols)}) VALUES ({', '.join('?' for _ in cols)})"
+    seen = set()
+    staged = 0
+    for batch in batched(records):
+        rows, rank_rows = [], []
+        for item in batch:
+            unique_name = item.get("UniqueName")
+            if unique_name in seen:
+                continue
+            seen.add(unique_name)
+            rows.append(tuple(item.get(col) for col in cols))
+            if rank_stage:
+                rank_rows += [tuple(row.get(col) for col in RANK_STAGE_COLUMNS) for row in rank_records(item)]
+        if rows:
+            cursor.executemany(insert, rows)
+            staged += len(rows)
+        if rank_rows:
+            cursor.executemany(rank_insert, rank_rows)
+
+    cursor.execute(f"CREATE INDEX IX_{stage.lstrip('#')}_UniqueName ON {stage} (UniqueName)")
+    if rank_stage:
+        changed, sql = changed_statement(entity, stage, sqlite, upsert)
+        drop_temp_table(cursor, changed, sqlite)
+        cursor.execute(sql)
+    # An empty staging table means the upstream fetch came back empty, not
+    # that every row was removed, so never soft-delete in that case.
+    statements = merge_statements(entity, stage, sqlite, upsert, soft_delete=staged > 0)
+    counts = apply_merge(cursor, statements, sqlite)
+    if rank_stage:
+        delete, insert_ranks = rank_statements(entity, rank_stage, changed)
+        cursor.execute(delete)
+        cursor.execute(insert_ranks)
+        counts["rank_stats"] = max(cursor.rowcount, 0)
+        cursor.execute(f"DROP TABLE {rank_stage}")
+        cursor.execute(f"DROP TABLE {changed}")
+    cursor.execute(f"DROP TABLE {stage}")
+    return {"staged": staged, **counts}
+
+def bulk_load(sections, target=None, upsert=False):
+    """
+    Loads (entity, records) sections straight into the database in a single
+    transaction, bumping the data version if any row changed. Returns a dict
+    of entity -> row counts.
+    """
+    target = target or DB_TARGET
+    if not target:
+        raise ValueError("No database target: pass --target or set WF_DB_TARGET.")
+
+    conn = connect(target)
+    results = {}
     try:
-        with open(OUTPUT_SQL_FILE, 'w', encoding='utf-8') as f:
-            f.write("\n".join(all_statements))
-        logging.info(f"SQL script saved to {OUTPUT_SQL_FILE}")
-    except IOError as e:
-        logging.error(f"Failed to write SQL file: {e}")
+        for entity, records in sections:
+            start = time.perf_counter()
+            counts = bulk_load_entity(conn, entity, records, upsert)
+            elapsed = time.perf_counter() - start
+            results[entity] = counts
+            rate = counts["staged"] / elapsed if elapsed > 0 else float("inf")
+            logging.info(
+                f"Loaded {counts['staged']} {entity} rows in {elapsed:.2f}s ({rate:,.0f} rows/s): "
+                f"{counts['inserted']} inserted, {counts['updated']} updated, {counts['deleted']} soft-deleted"
+                + (f", {counts['rank_stats']} rank stats written." if "rank_stats" in counts else ".")
+            )
+        if any(counts["inserted"] or counts["updated"] or counts["deleted"] for counts in results.values()):
+            conn.cursor().execute(bump_data_version(is_sqlite(conn)))
+            logging.info("Bumped catalogue data version.")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    return results
+
+def values_batches(records, cols, size=1000):
+    """
+    Multi-row VALUES lists of at most `size` rows (SQL Server's limit per INSERT).
+    """
+    for batch in batched(records, size):
+        yield ",\n    ".join("(" + ", ".join(escape_sql(item.get(col)) for col in cols) + ")" for item in batch), len(batch)
+
+def write_upsert_script(sections, filepath=None):
+    """
+    Streams a set-based upsert script: each entity is bulk-inserted into a
+    temp staging table with multi-row VALUES batches, then applied with the
+    same MERGE the direct mode uses, rank stats included. Returns a dict of
+    entity -> rows staged.
+    """
+    filepath = filepath or OUTPUT_SQL_FILE
+    counts = {}
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write("-- Auto-generated by ETL/Scripts/load.py (upsert)\n")
+        f.write("-- Requires DB/migrations/002_content_hash.sql and 007_rank_stats.sql\n")
+        f.write("SET XACT_ABORT ON;\nBEGIN TRANSACTION;\n")
+        for entity, records in sections:
+            table, cols = load_columns(entity, upsert=True)
+            stage = f"#stage_{entity}"
+            f.write(f"\nIF OBJECT_ID('tempdb..{stage}') IS NOT NULL DROP TABLE {stage};\n")
+            f.write(f"SELECT TOP 0 {', '.join(cols)} INTO {stage} FROM {table};\n")
+            rank_stage = None
+            if entity in RANK_TABLES:
+                rank_stage, create = rank_stage_statement(entity, sqlite=False)
+                f.write(f"IF OBJECT_ID('tempdb..{rank_stage}') IS NOT NULL DROP TABLE {rank_stage};\n")
+                f.write(textwrap.dedent(create).strip() + ";\n")
+            count = 0
+            for batch in batched(records):
+                for values, rows in values_batches(batch, cols):
+                    f.write(f"INSERT INTO {stage} ({', '.join(cols)}) VALUES\n    {values};\n")
+                    count += rows
+                if rank_stage:
+                    rank_rows = [row for item in batch for row in rank_records(item)]
+                    for values, _ in values_batches(rank_rows, RANK_STAGE_COLUMNS):
+                        f.write(f"INSERT INTO {rank_stage} ({', '.join(RANK_STAGE_COLUMNS)}) VALUES\n    {values};\n")
+            f.write(f"CREATE INDEX IX_stage_{entity}_UniqueName ON {stage} (UniqueName);\n")
+            if rank_stage:
+                changed, sql = changed_statement(entity, stage, sqlite=False, upsert=True)
+                f.write(f"IF OBJECT_ID('tempdb..{changed}') IS NOT NULL DROP TABLE {changed};\n")
+                f.write(textwrap.dedent(sql).strip() + ";\n")
+            for _, sql in merge_statements(entity, stage, sqlite=False, upsert=True,
+                                           soft_delete=count > 0, output=False):
+                f.write(textwrap.dedent(sql).strip() + "\n")
+            if rank_stage:
+                for sql in rank_statements(entity, rank_stage, changed):
+                    f.write(textwrap.dedent(sql).strip() + ";\n")
+                f.write(f"DROP TABLE {rank_stage};\nDROP TABLE {changed};\n")
+            f.write(f"DROP TABLE {stage};\n")
+            counts[entity] = count
+            logging.info(f"Generated upsert for {count} {entity.capitalize()}.")
+        f.write("\n" + bump_data_version() + ";")
+        f.write("\nCOMMIT TRANSACTION;")
+        f.write("\nPRINT 'Data loaded successfully';")
+    return counts
+
+def run_load(mode="script", target=None, upsert=False):
+    """
+    mode="script" writes load_data.sql to run by hand; mode="direct" loads
+    straight into the database given by target / WF_DB_TARGET.
+    upsert=True also updates changed rows and soft-deletes removed ones.
+    Returns a dict of entity -> wall / CPU time, records read / loaded and
+    processed bytes read for the run report.
+    """
+    results = {}
+    sections = report.track_sections(((entity, load_json(f"{entity}.json")) for entity in TABLES), results)
+
+    if mode == "direct":
+        logging.info(f"Starting load process (direct bulk {'upsert' if upsert else 'load'})...")
+        counts = bulk_load(sections, target, upsert)
+    else:
+        logging.info(f"Starting load process (generating {'upsert ' if upsert else ''}SQL)...")
+        try:
+            if upsert:
+                counts = write_upsert_script(sections, OUTPUT_SQL_FILE)
+            else:
+                counts = write_load_script(sections, OUTPUT_SQL_FILE)
+            logging.info(f"SQL script saved to {OUTPUT_SQL_FILE}")
+        except IOError as e:
+            logging.error(f"Failed to write SQL file: {e}")
+            counts = {}
+
+    for entity, entry in results.items():
+        report.add_load_counts(entry, counts.get(entity))
+        entry["bytes_read"] = report.file_size(storage.find(PROCESSED_DIR, entity))
+    return results
 
 if __name__ == "__main__":
-    run_load()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Load processed Warframe data.")
+    parser.add_argument("--mode", choices=["script", "direct"], default="script",
+                        help="script: write load_data.sql; direct: bulk load into the database.")
+    parser.add_argument("--target", default=DB_TARGET,
+                        help="sqlite:///path.db or an ODBC connection string (default: WF_DB_TARGET).")
+    parser.add_argument("--upsert", action="store_true",
+                        help="Update changed rows and soft-delete removed ones (needs migration 002).")
+    args = parser.parse_args()
+    run_load(mode=args.mode, target=args.target, upsert=args.upsert)
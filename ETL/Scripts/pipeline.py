@@ -9,6 +9,7 @@ sys.path.append(str(Path(__file__).parent))
 import extract
 import transform
 import load
+import report
 
 # Configure logging
 logging.basicConfig(
@@ -20,23 +21,134 @@ logging.basicConfig(
     ]
 )
 
-def run_pipeline():
+def log_run_stats(mode, run):
+    peak = run["peak_rss_mb"]
+    peak_text = f"{peak:.1f} MB" if peak is not None else "n/a"
+    logging.info(f"Pipeline mode={mode}: end-to-end {run['wall_s']:.2f}s, peak memory {peak_text}")
+
+def finish_run(run, status, error=None):
+    """
+    Completes the run report, logs the end-to-end stats and saves the report
+    to report.REPORT_FILE and report.HISTORY_FILE.
+    """
+    data = run.finish(status, error)
+    log_run_stats(data["mode"], data)
+    for stage in data["stages"]:
+        logging.info(f"  {stage['stage']}: {stage['wall_s']:.2f}s wall, {stage['cpu_s']:.2f}s CPU, "
+                     f"{stage['records_out'] if stage['records_out'] is not None else 'n/a'} records out")
+    try:
+        path = run.save()
+        logging.info(f"Run report saved to {path} (history: {report.HISTORY_FILE})")
+    except OSError as e:
+        logging.warning(f"Could not save the run report: {e}")
+
+def extract_entities(results):
+    """
+    Maps extract.run_extraction's per-endpoint results onto entities for the run report.
+    """
+    entities = {}
+    for endpoint, entity, _ in extract.EXTRACTS:
+        result = results.get(endpoint)
+        if result is not None:
+            entities[entity] = {
+                "wall_s": round(result["elapsed"], 4),
+                "cpu_s": round(result["cpu"], 4),
+                "changed": result["changed"],
+                **{key: result[key] for key in ("records_in", "records_out", "bytes_read", "bytes_written")},
+            }
+    return entities
+
+def run_streaming_pipeline(load_mode="script", target=None, upsert=False):
+    """
+    Runs extract -> transform -> load as chained generators, one record at a
+    time: nothing is written to ETL/Raw or ETL/Processed and no record is
+    re-serialised between stages.
+    Returns a dict of entity -> wall / CPU time and records fetched / loaded
+    for the run report.
+    """
+    fetched = {}
+
+    def sections():
+        for endpoint, entity, record_filter in extract.EXTRACTS:
+            fetched[entity] = report.Counted(extract.iter_endpoint(endpoint, record_filter))
+            yield entity, transform.iter_transform(entity, fetched[entity])
+
+    results = {}
+    tracked = report.track_sections(sections(), results)
+    if load_mode == "direct":
+        logging.info(">>> Streaming: fetch -> transform -> bulk load")
+        counts = load.bulk_load(tracked, target, upsert)
+    else:
+        logging.info(">>> Streaming: fetch -> transform -> SQL generation")
+        if upsert:
+            counts = load.write_upsert_script(tracked)
+        else:
+            counts = load.write_load_script(tracked)
+        logging.info(f"SQL script saved to {load.OUTPUT_SQL_FILE}")
+    for entity, entry in results.items():
+        report.add_load_counts(entry, counts.get(entity))
+        entry["records_in"] = fetched[entity].count
+    return results
+
+def run_pipeline(force=False, mode="files", transform_workers=1, load_mode="script", target=None, upsert=False):
+    """
+    Runs the ETL. mode="files" stages data through ETL/Raw and ETL/Processed
+    (handy for debugging); mode="stream" pipes records straight through.
+    transform_workers > 1 runs the file-based transform in a process pool.
+    load_mode="direct" bulk loads into target instead of writing load_data.sql.
+    upsert=True updates changed rows and soft-deletes removed ones.
+    Each run's per-stage report is written to ETL/run_report.json and
+    appended to ETL/run_history.jsonl (see report.py).
+    """
     logging.info("========================================")
-    logging.info("   Starting Warframe ETL Pipeline")
+    logging.info(f"   Starting Warframe ETL Pipeline ({mode})")
     logging.info("========================================")
+    run = report.RunReport(mode, force=force, transform_workers=transform_workers,
+                           load_mode=load_mode, upsert=upsert)
+
+    if mode == "stream":
+        try:
+            with run.stage("stream") as stage:
+                stage["entities"] = run_streaming_pipeline(load_mode, target, upsert)
+                if load_mode != "direct":
+                    stage["bytes_written"] = report.file_size(load.OUTPUT_SQL_FILE)
+            finish_run(run, "succeeded")
+            logging.info("========================================")
+            logging.info("   ETL Pipeline Completed Successfully")
+            logging.info("========================================")
+        except Exception as e:
+            logging.error(f"ETL Pipeline Failed: {e}")
+            finish_run(run, "failed", e)
+            sys.exit(1)
+        return
 
     try:
         # Step 1: Extract
         logging.info(">>> Step 1: Extraction")
-        extract.run_extraction()
+        with run.stage("extract") as stage:
+            stage["entities"] = extract_entities(extract.run_extraction(force=force))
+
+        if not force and not extract.has_changes():
+            logging.info("No upstream changes since the last run; skipping transform and load.")
+            finish_run(run, "unchanged")
+            logging.info("========================================")
+            logging.info("   ETL Pipeline Completed (no changes)")
+            logging.info("========================================")
+            return
         
         # Step 2: Transform
         logging.info(">>> Step 2: Transformation")
-        transform.run_transformation()
+        with run.stage("transform") as stage:
+            stage["entities"] = transform.run_transformation(workers=transform_workers)
         
         # Step 3: Load
-        logging.info(">>> Step 3: Loading (SQL Generation)")
-        load.run_load()
+        logging.info(f">>> Step 3: Loading ({'Direct' if load_mode == 'direct' else 'SQL Generation'})")
+        with run.stage("load") as stage:
+            stage["entities"] = load.run_load(mode=load_mode, target=target, upsert=upsert)
+            if load_mode != "direct":
+                stage["bytes_written"] = report.file_size(load.OUTPUT_SQL_FILE)
+        extract.mark_consumed()
+        finish_run(run, "succeeded")
         
         logging.info("========================================")
         logging.info("   ETL Pipeline Completed Successfully")
@@ -44,7 +156,23 @@ def run_pipeline():
         
     except Exception as e:
         logging.error(f"ETL Pipeline Failed: {e}")
+        finish_run(run, "failed", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    run_pipeline()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the Warframe ETL pipeline.")
+    parser.add_argument("--force", action="store_true", help="Re-download and reprocess even if nothing changed upstream.")
+    parser.add_argument("--mode", choices=["files", "stream"], default="files",
+                        help="files: stage through ETL/Raw and ETL/Processed; stream: in-process generators.")
+    parser.add_argument("--transform-workers", type=int, default=1, help="Worker processes for the transform stage.")
+    parser.add_argument("--load", choices=["script", "direct"], default="script",
+                        help="script: write load_data.sql; direct: bulk load into --target.")
+    parser.add_argument("--target", default=load.DB_TARGET,
+                        help="sqlite:///path.db or an ODBC connection string (default: WF_DB_TARGET).")
+    parser.add_argument("--upsert", action="store_true",
+                        help="Update changed rows and soft-delete removed ones (needs migration 002).")
+    args = parser.parse_args()
+    run_pipeline(force=args.force, mode=args.mode, transform_workers=args.transform_workers,
+                 load_mode=args.load, target=args.target, upsert=args.upsert)
@@ -0,0 +1,314 @@
+import json
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+ETL_DIR = Path(__file__).parent.parent
+# Report of the latest pipeline run, rewritten every run.
+REPORT_FILE = ETL_DIR / "run_report.json"
+# Every run's report, one JSON object per line; `python ETL/Scripts/report.py` summarises it.
+HISTORY_FILE = Path(os.environ.get("WF_ETL_HISTORY", ETL_DIR / "run_history.jsonl"))
+
+# Stage order in summaries; "stream" is the whole streaming pipeline, which
+# runs its fetch, transform and load interleaved.
+STAGES = ["extract", "transform", "load", "stream"]
+COUNT_KEYS = ["records_in", "records_out", "records_skipped", "bytes_read", "bytes_written"]
+
+def peak_memory_mb():
+    """
+    Peak resident memory of this process in MB, or None if it can't be read.
+    """
+    # On Linux VmHWM is exact for this process image; ru_maxrss can include
+    # the high-water mark of the parent that forked us.
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:  # Windows
+        try:
+            import psutil
+        except ImportError:
+            return None
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def reset_peak_memory():
+    """
+    Resets the peak RSS high-water mark, so the next reading covers only what
+    runs after it. Linux only; elsewhere readings stay cumulative for the
+    process and False is returned.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+def process_cpu_seconds():
+    """
+    CPU time of every thread of this process, plus its finished children
+    (the transform process pool).
+    """
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+def file_size(path):
+    try:
+        return Path(path).stat().st_size if path is not None else None
+    except OSError:
+        return None
+
+def _round(value, digits=4):
+    return round(value, digits) if value is not None else None
+
+def utc_now():
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+@contextmanager
+def measure(entry=None):
+    """
+    Times the block into entry (a dict, yielded): wall_s, cpu_s of the
+    calling thread, and the process peak RSS so far as peak_rss_mb.
+    """
+    entry = {} if entry is None else entry
+    start, cpu_start = time.perf_counter(), time.thread_time()
+    try:
+        yield entry
+    finally:
+        entry["wall_s"] = _round(time.perf_counter() - start)
+        entry["cpu_s"] = _round(time.thread_time() - cpu_start)
+        entry["peak_rss_mb"] = _round(peak_memory_mb(), 1)
+
+class Counted:
+    """
+    Iterator wrapper that counts the items that pass through it.
+    """
+    def __init__(self, items):
+        self._items = iter(items)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self._items)
+        self.count += 1
+        return item
+
+def track_sections(sections, entities):
+    """
+    Passes (entity, records) sections through to a loader, filling
+    entities[entity] with records_in and the time from asking for the
+    section to asking for the next one, by which point the loader is done
+    with it. For streaming sections that window includes the fetch and
+    transform too.
+    """
+    sections = iter(sections)
+    while True:
+        entry = {}
+        with measure(entry):
+            section = next(sections, None)
+            if section is None:
+                return
+            entity, records = section
+            records = Counted(records)
+            yield entity, records
+        entry["records_in"] = records.count
+        entities.setdefault(entity, {}).update(entry)
+
+def add_load_counts(entry, counts):
+    """
+    Adds a loader's counts for one entity to its report entry: a direct load
+    gives a dict (staged / inserted / updated / ...), a script an int.
+    """
+    if isinstance(counts, dict):
+        entry.update(counts)
+        entry["records_out"] = counts.get("staged")
+    elif counts is not None:
+        entry["records_out"] = counts
+
+def _totals(stage):
+    """
+    Fills each entity's records_skipped where in and out are known, then the
+    stage totals of any count the stage didn't set itself.
+    """
+    entries = list(stage["entities"].values())
+    for entry in entries:
+        for key in COUNT_KEYS:
+            entry.setdefault(key, None)
+        if entry["records_skipped"] is None and None not in (entry["records_in"], entry["records_out"]):
+            entry["records_skipped"] = entry["records_in"] - entry["records_out"]
+    for key in COUNT_KEYS:
+        values = [entry[key] for entry in entries if entry[key] is not None]
+        if stage.get(key) is None:
+            stage[key] = sum(values) if values else None
+    return stage
+
+class RunReport:
+    """
+    Structured report of one pipeline run. The run, each stage and each
+    entity within a stage record wall and CPU time and peak RSS; stages and
+    entities also record records in / out / skipped and bytes read /
+    written. Peak RSS is reset at each stage start where the OS allows it,
+    so a stage's peak is its own.
+    """
+    def __init__(self, mode, **options):
+        self.data = {
+            "started_at": utc_now(),
+            "mode": mode,
+            "options": options,
+            "status": "running",
+            "stages": [],
+        }
+        self._start = time.perf_counter()
+        self._cpu_start = process_cpu_seconds()
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Times one stage. The block fills the yielded dict's "entities"
+        (entity -> counts) and may set stage-level counts directly.
+        """
+        reset_peak_memory()
+        stage = {"stage": name, "entities": {}}
+        start, cpu_start = time.perf_counter(), process_cpu_seconds()
+        try:
+            yield stage
+        except Exception as e:
+            stage["error"] = str(e)
+            raise
+        finally:
+            stage["wall_s"] = _round(time.perf_counter() - start)
+            stage["cpu_s"] = _round(process_cpu_seconds() - cpu_start)
+            stage["peak_rss_mb"] = _round(peak_memory_mb(), 1)
+            self.data["stages"].append(_totals(stage))
+
+    def finish(self, status, error=None):
+        peaks = [stage["peak_rss_mb"] for stage in self.data["stages"]] + [_round(peak_memory_mb(), 1)]
+        peaks = [peak for peak in peaks if peak is not None]
+        self.data.update(
+            status=status,
+            finished_at=utc_now(),
+            wall_s=_round(time.perf_counter() - self._start),
+            cpu_s=_round(process_cpu_seconds() - self._cpu_start),
+            peak_rss_mb=max(peaks) if peaks else None,
+        )
+        if error is not None:
+            self.data["error"] = str(error)
+        return self.data
+
+    def save(self, report_file=None, history_file=None):
+        """
+        Writes the report to report_file (via a temp file) and appends it to
+        history_file as one line. Returns the report path.
+        """
+        report_file = Path(report_file or REPORT_FILE)
+        tmp_path = report_file.with_name(report_file.name + ".part")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2)
+        os.replace(tmp_path, report_file)
+        with open(history_file or HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(self.data, separators=(",", ":")) + "\n")
+        return report_file
+
+def load_history(path=None):
+    """
+    Reads every report in the history file, oldest first, skipping lines
+    that don't parse (e.g. one cut short by a crash).
+    """
+    reports = []
+    try:
+        with open(path or HISTORY_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    reports.append(json.loads(line))
+                except ValueError:
+                    continue
+    except FileNotFoundError:
+        pass
+    return reports
+
+def _cell(value, width, scale=1, digits=2):
+    if value is None:
+        return f"{'-':>{width}}"
+    if isinstance(value, int) and scale == 1:
+        return f"{value:>{width},}"
+    return f"{value / scale:>{width}.{digits}f}"
+
+def summarize(reports, last=10, stage=None, entity=None):
+    """
+    Lines showing the last `last` runs of each stage (or of one stage, and
+    optionally one entity within it), followed by how the newest run's wall
+    time, CPU time and peak RSS compare with the median of the earlier
+    successful runs with the same mode and options.
+    """
+    names = [stage] if stage else [name for name in STAGES if any(
+        s["stage"] == name for report in reports for s in report.get("stages", []))]
+    lines = []
+    for name in names:
+        rows = []
+        for report in reports:
+            for s in report.get("stages", []):
+                if s["stage"] == name:
+                    row = s["entities"].get(entity) if entity else s
+                    if row is not None:
+                        rows.append((report, row))
+        title = f"{name}" + (f" / {entity}" if entity else "")
+        lines.append(f"{title} (runs: {len(rows)})")
+        if not rows:
+            lines.append("")
+            continue
+        lines.append(f"  {'started':<20}{'status':<11}{'wall s':>9}{'cpu s':>9}{'in':>10}{'out':>10}"
+                     f"{'skipped':>9}{'MB read':>9}{'MB out':>9}{'peak MB':>9}")
+        for report, row in rows[-last:]:
+            lines.append(
+                f"  {report.get('started_at', '')[:19].replace('T', ' '):<20}{report.get('status', ''):<11}"
+                f"{_cell(row.get('wall_s'), 9)}{_cell(row.get('cpu_s'), 9)}"
+                f"{_cell(row.get('records_in'), 10)}{_cell(row.get('records_out'), 10)}"
+                f"{_cell(row.get('records_skipped'), 9)}{_cell(row.get('bytes_read'), 9, 1024 * 1024)}"
+                f"{_cell(row.get('bytes_written'), 9, 1024 * 1024)}{_cell(row.get('peak_rss_mb'), 9, digits=1)}"
+            )
+        trend = []
+        newest_report, newest = rows[-1]
+        previous = [
+            row for report, row in rows[-last:-1]
+            if report.get("status") == "succeeded"
+            and (report.get("mode"), report.get("options")) == (newest_report.get("mode"), newest_report.get("options"))
+        ]
+        for key, label in (("wall_s", "wall"), ("cpu_s", "cpu"), ("peak_rss_mb", "peak")):
+            values = [row[key] for row in previous if row.get(key) is not None]
+            if values and newest.get(key) is not None and statistics.median(values) > 0:
+                median = statistics.median(values)
+                trend.append(f"{label} {newest[key] / median - 1:+.0%}")
+        if trend:
+            lines.append(f"  newest vs median of {len(previous)} earlier like runs: {', '.join(trend)}")
+        lines.append("")
+    return lines
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarise ETL run reports over time.")
+    parser.add_argument("--history", default=HISTORY_FILE, help="Run history file (default: WF_ETL_HISTORY).")
+    parser.add_argument("--last", type=int, default=10, help="Runs shown per stage.")
+    parser.add_argument("--stage", choices=STAGES, help="Only this stage.")
+    parser.add_argument("--entity", help="Only this entity within each stage (e.g. mods).")
+    args = parser.parse_args()
+    reports = load_history(args.history)
+    if not reports:
+        print(f"No run reports in {args.history}.")
+        sys.exit(0)
+    print("\n".join(summarize(reports, args.last, args.stage, args.entity)))
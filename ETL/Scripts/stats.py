@@ -0,0 +1,150 @@
+import math
+import re
+
+try:
+    import numpy as np
+except ImportError:  # optional: falls back to weapon_stats one record at a time
+    np = None
+
+# Derived columns added to every weapon record (DB/migrations/006_weapon_stats.sql)
+STAT_COLUMNS = ["TotalDamage", "AvgCritMultiplier", "BurstDPS", "SustainedDPS"]
+
+# Rank-stat rows exploded from levelStats into the side tables (DB/migrations/007_rank_stats.sql)
+RANK_STAT_COLUMNS = ["Rank", "Position", "Stat", "Value", "Unit", "Text"]
+# Longest Stat kept as a filterable key; longer "stats" are prose and keep only their Text
+MAX_STAT_LENGTH = 100
+
+MARKUP = re.compile(r"<[^>]*>")
+NOTE = re.compile(r"\([^)]*\)")
+# "+30% Ability Strength, -10% Ability Efficiency" is two stats
+STAT_SEPARATOR = re.compile(r"\n|,\s*(?=[+-]\d)")
+# "+165% Damage" / "+1.5x Critical Damage" / "2.5 Energy Regen/s" at the start of
+# a line, or failing that the first signed value after a condition ("On Kill: +10%
+# Damage for 12s") or after the stat name ("Combo Duration +5s")
+UNIT = r"(%|[xs]\b)?"
+LEADING_STAT = re.compile(r"^([+-]?\d+(?:\.\d+)?)" + UNIT + r"\s*(.+)$")
+SIGNED_STAT = re.compile(r"(?<!\S)([+-]\d+(?:\.\d+)?)" + UNIT + r"\s*(.*)$")
+# "x Critical Damage", "s": a unit the patterns didn't take as one
+STRAY_UNIT = re.compile(r"^[A-Za-z]\b")
+# Duration, trigger and scaling clauses after the stat name
+STAT_TRAILER = re.compile(r"\s+(?:for|when|while|if|per|on|after)\b.*$|\s*[,;:].*$|\.\s.*$|\.$")
+
+# Values are rounded to 4 decimal places, so the stored values (and ContentHash)
+# don't depend on float noise. Both paths round like numpy.round.
+SCALE = 10.0 ** 4
+
+def weapon_stats(record):
+    """
+    Derived stats for one weapon record, unmodded:
+    - TotalDamage: Impact + Puncture + Slash per hit
+    - AvgCritMultiplier: 1 + CritChance * (CritMultiplier - 1), the average
+      damage multiplier from crits (also right past 100% crit chance, where
+      every full 100% is another crit tier)
+    - BurstDPS: TotalDamage * Multishot * AvgCritMultiplier * FireRate
+    - SustainedDPS: BurstDPS averaged over emptying the magazine and
+      reloading. Melee weapons, and weapons without a magazine size or
+      reload time, never stop, so it equals BurstDPS.
+    Missing crit stats count as no crits and a missing Multishot as 1.
+    Without a positive FireRate both DPS values are None.
+    add_weapon_stats computes the same thing for many records at once.
+    """
+    def number(column, default=None):
+        value = record.get(column)
+        return default if value is None else float(value)
+
+    total = number("Impact", 0.0) + number("Puncture", 0.0) + number("Slash", 0.0)
+    avg_crit = 1.0 + number("CritChance", 0.0) * (number("CritMultiplier", 1.0) - 1.0)
+    fire_rate = number("FireRate")
+    burst = sustained = None
+    if fire_rate is not None and fire_rate > 0:
+        burst = total * number("Multishot", 1.0) * avg_crit * fire_rate
+        magazine, reload = number("MagazineSize"), number("ReloadTime")
+        sustained = burst
+        if record.get("Type") != "Melee" and magazine is not None and magazine > 0 and reload is not None:
+            firing = magazine / fire_rate
+            sustained = burst * firing / (firing + reload)
+    return {column: None if value is None else round(value * SCALE) / SCALE
+            for column, value in zip(STAT_COLUMNS, (total, avg_crit, burst, sustained))}
+
+def _column(records, column, default=math.nan):
+    # None converts to NaN in a float array
+    values = np.array([record.get(column) for record in records], dtype=float)
+    if not math.isnan(default):
+        values[np.isnan(values)] = default
+    return values
+
+def add_weapon_stats(records):
+    """
+    Adds the STAT_COLUMNS to every weapon record in place, computing each
+    stat for the whole list in one NumPy expression. Same results as
+    weapon_stats, which is used per record when NumPy isn't installed.
+    """
+    if np is None:
+        for record in records:
+            record.update(weapon_stats(record))
+        return records
+    if not records:
+        return records
+
+    total = _column(records, "Impact", 0.0) + _column(records, "Puncture", 0.0) + _column(records, "Slash", 0.0)
+    avg_crit = 1.0 + _column(records, "CritChance", 0.0) * (_column(records, "CritMultiplier", 1.0) - 1.0)
+    fire_rate = _column(records, "FireRate")
+    fire_rate[~(fire_rate > 0)] = math.nan
+    burst = total * _column(records, "Multishot", 1.0) * avg_crit * fire_rate
+
+    magazine, reload = _column(records, "MagazineSize"), _column(records, "ReloadTime")
+    melee = np.array([record.get("Type") == "Melee" for record in records], dtype=bool)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        firing = magazine / fire_rate
+        sustained = burst * firing / (firing + reload)
+    sustained = np.where(melee | ~(magazine > 0) | np.isnan(reload), burst, sustained)
+
+    columns = [np.rint(values * SCALE) / SCALE for values in (total, avg_crit, burst, sustained)]
+    for record, values in zip(records, zip(*(values.tolist() for values in columns))):
+        for column, value in zip(STAT_COLUMNS, values):
+            record[column] = None if math.isnan(value) else value
+    return records
+
+def rank_stat(line):
+    """
+    (Stat, Value, Unit) parsed from one levelStats line, e.g.
+    "<DT_FIRE_COLOR>+90% Heat" -> ("Heat", 90.0, "%"), "+1.5x Critical
+    Damage" -> ("Critical Damage", 1.5, "x") and "Combo Duration +5s" ->
+    ("Combo Duration", 5.0, "s"). Tags and "(...)" notes are dropped from
+    the stat name, as are trailing clauses such as "for 12s" or "for each
+    Combo Multiplier". (None, None, None) for lines without a value.
+    """
+    text = NOTE.sub("", MARKUP.sub("", line)).strip()
+    match = LEADING_STAT.match(text) or SIGNED_STAT.search(text)
+    if match is None:
+        return None, None, None
+    stat = " ".join(STAT_TRAILER.sub("", match.group(3)).split())
+    prefix = text[:match.start()].strip()
+    if not stat and ":" not in prefix:
+        # The value trails the stat name
+        stat = " ".join(prefix.split())
+    if (not stat or not stat[0].isalpha() or STRAY_UNIT.match(stat)
+            or len(stat) > MAX_STAT_LENGTH):
+        return None, None, None
+    return stat, float(match.group(1)), match.group(2) or None
+
+def rank_stats(level_stats):
+    """
+    One row per stat per rank of a raw mod or arcane's levelStats, with
+    the RANK_STAT_COLUMNS. Every line is kept as Text (tags stripped); Stat,
+    Value and Unit are None for lines rank_stat can't read. Malformed
+    entries are skipped, so a missing or odd levelStats gives no rows.
+    """
+    rows = []
+    if not isinstance(level_stats, list):
+        return rows
+    for rank, level in enumerate(level_stats):
+        if not isinstance(level, dict) or not isinstance(level.get("stats"), list):
+            continue
+        lines = (" ".join(MARKUP.sub("", line).split())
+                 for stat in level["stats"] for line in STAT_SEPARATOR.split(str(stat)))
+        for position, text in enumerate(line for line in lines if line):
+            stat, value, unit = rank_stat(text)
+            rows.append({"Rank": rank, "Position": position, "Stat": stat, "Value": value, "Unit": unit,
+                         "Text": text})
+    return rows
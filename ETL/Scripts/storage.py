@@ -0,0 +1,219 @@
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for the ndjson.zst format
+    zstandard = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # optional: only needed for the parquet / arrow formats
+    pyarrow = None
+
+# Storage format -> file extension. Readers detect the format from the extension.
+FORMATS = {
+    "json": ".json",
+    "ndjson": ".ndjson",
+    "ndjson.gz": ".ndjson.gz",
+    "ndjson.zst": ".ndjson.zst",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+# Format used for ETL/Raw and ETL/Processed unless a caller asks for another.
+DEFAULT_FORMAT = os.environ.get("WF_ETL_FORMAT", "ndjson")
+
+# Schema metadata key listing columns that hold JSON-encoded nested values.
+JSON_COLUMNS_KEY = b"wf_json_columns"
+
+def format_of(path):
+    """
+    Returns the storage format of path, judged by its extension.
+    """
+    name = Path(path).name
+    for fmt, ext in sorted(FORMATS.items(), key=lambda kv: -len(kv[1])):
+        if name.endswith(ext):
+            return fmt
+    raise ValueError(f"Unknown storage format for {path}")
+
+def stem_of(name):
+    """
+    Strips any known storage extension, so "mods.json" and "mods" both give "mods".
+    """
+    name = str(name)
+    for ext in sorted(FORMATS.values(), key=len, reverse=True):
+        if name.endswith(ext):
+            return name[:-len(ext)]
+    return name
+
+def path_for(directory, name, fmt=None):
+    fmt = fmt or DEFAULT_FORMAT
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown storage format '{fmt}'. Choose from: {', '.join(FORMATS)}")
+    return Path(directory) / (stem_of(name) + FORMATS[fmt])
+
+def find(directory, name):
+    """
+    Returns the newest existing file for name in any storage format, or None.
+    """
+    stem = stem_of(name)
+    candidates = [Path(directory) / (stem + ext) for ext in FORMATS.values()]
+    existing = [path for path in candidates if path.exists()]
+    if not existing:
+        return None
+    return max(existing, key=lambda path: path.stat().st_mtime)
+
+def _require(module, fmt, package):
+    if module is None:
+        raise RuntimeError(f"The '{fmt}' storage format needs the '{package}' package (pip install {package}).")
+
+def _open_text(path, mode, fmt):
+    """
+    Opens path as text, transparently (de)compressing ndjson.gz / ndjson.zst.
+    """
+    if fmt == "ndjson.gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if fmt == "ndjson.zst":
+        _require(zstandard, fmt, "zstandard")
+        if mode == "w":
+            raw = zstandard.ZstdCompressor().stream_writer(open(path, "wb"))
+        else:
+            raw = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"))
+        return io.TextIOWrapper(raw, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+def _needs_json(values):
+    """
+    True for a column Arrow can't type: nested values (lists / dicts), or
+    non-null values of more than one Python type (ints and floats count as one).
+    """
+    kinds = set()
+    for value in values:
+        if isinstance(value, (list, dict)):
+            return True
+        if value is not None:
+            kinds.add(float if type(value) is int else type(value))
+    return len(kinds) > 1
+
+def _to_table(records):
+    """
+    Builds an Arrow table from records. Nested values (lists / dicts) and
+    columns mixing types are stored as JSON strings and flagged in the
+    schema metadata, since raw payloads are too irregular for a fixed schema.
+    """
+    columns = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key, None)
+    json_columns = [key for key in columns if _needs_json(record.get(key) for record in records)]
+    data = {
+        key: [
+            json.dumps(record.get(key), separators=(",", ":")) if key in json_columns and record.get(key) is not None
+            else record.get(key)
+            for record in records
+        ]
+        for key in columns
+    }
+    table = pyarrow.table(data)
+    return table.replace_schema_metadata({JSON_COLUMNS_KEY: json.dumps(json_columns).encode("utf-8")})
+
+def _from_table(table):
+    """
+    Records back from an Arrow table. Every row has every column, so null
+    values are dropped: a key a record never had reads back as missing
+    rather than None ("'levelStats' in item" checks still work).
+    """
+    metadata = table.schema.metadata or {}
+    json_columns = set(json.loads(metadata.get(JSON_COLUMNS_KEY, b"[]")))
+    for record in table.to_pylist():
+        record = {key: value for key, value in record.items() if value is not None}
+        for key in json_columns & record.keys():
+            record[key] = json.loads(record[key])
+        yield record
+
+def write_records(records, path, fmt=None):
+    """
+    Writes an iterable of records to path. Row formats are written one record
+    at a time; columnar formats collect the records first.
+    Returns the number of records written.
+    """
+    fmt = fmt or format_of(path)
+    count = 0
+
+    if fmt in ("parquet", "arrow"):
+        _require(pyarrow, fmt, "pyarrow")
+        records = list(records)
+        table = _to_table(records)
+        if fmt == "parquet":
+            pyarrow.parquet.write_table(table, str(path), compression="zstd")
+        else:
+            with pyarrow.ipc.new_file(str(path), table.schema) as writer:
+                writer.write_table(table)
+        return len(records)
+
+    with _open_text(path, "w", fmt) as f:
+        if fmt == "json":
+            f.write("[")
+            for record in records:
+                f.write(",\n" if count else "\n")
+                f.write(json.dumps(record, separators=(",", ":")))
+                count += 1
+            f.write("\n]\n")
+        else:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+                count += 1
+    return count
+
+def save_records(records, directory, name, fmt=None):
+    """
+    Writes records to directory/<name stem>.<format extension> via a temp file,
+    so readers never see a half-written file. Returns (path, count).
+    """
+    path = path_for(directory, name, fmt)
+    tmp_path = path.with_name(path.name + ".part")
+    count = write_records(records, tmp_path, fmt or DEFAULT_FORMAT)
+    os.replace(tmp_path, path)
+    return path, count
+
+def iter_records(path):
+    """
+    Yields the records stored at path, whatever its format.
+    """
+    fmt = format_of(path)
+
+    if fmt == "parquet":
+        _require(pyarrow, fmt, "pyarrow")
+        yield from _from_table(pyarrow.parquet.read_table(str(path)))
+        return
+    if fmt == "arrow":
+        _require(pyarrow, fmt, "pyarrow")
+        with pyarrow.memory_map(str(path)) as source:
+            yield from _from_table(pyarrow.ipc.open_file(source).read_all())
+        return
+    if fmt == "json":
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+        return
+
+    with _open_text(path, "r", fmt) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def load_records(directory, name):
+    """
+    Loads every record stored under name in directory, picking the format
+    automatically. Raises FileNotFoundError if no file exists in any format.
+    """
+    path = find(directory, name)
+    if path is None:
+        raise FileNotFoundError(f"No stored data for '{stem_of(name)}' in {directory}")
+    return list(iter_records(path))
@@ -1,8 +1,14 @@
 import json
 import os
+import hashlib
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import report
+import stats
+import storage
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,167 +22,293 @@ logging.basicConfig(
 RAW_DIR = Path(__file__).parent.parent / "Raw"
 PROCESSED_DIR = Path(__file__).parent.parent / "Processed"
 
+# Raw records per task when transforming in a process pool.
+CHUNK_SIZE = 500
+
 # Ensure Processed directory exists
 PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
 def load_json(filename):
-    filepath = RAW_DIR / filename
+    """
+    Loads a raw snapshot in whatever storage format it was saved in.
+    """
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except IOError as e:
-        logging.error(f"Failed to load {filepath}: {e}")
+        return storage.load_records(RAW_DIR, filename)
+    except (IOError, ValueError) as e:
+        logging.error(f"Failed to load {filename} from {RAW_DIR}: {e}")
         return []
 
-def save_json(data, filename):
-    filepath = PROCESSED_DIR / filename
+def save_json(data, filename, fmt=None):
+    """
+    Saves processed records and returns the path written (None on failure).
+    """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        filepath, _ = storage.save_records(data, PROCESSED_DIR, filename, fmt)
         logging.info(f"Saved processed data to {filepath}")
+        return filepath
     except IOError as e:
-        logging.error(f"Failed to save {filepath}: {e}")
+        logging.error(f"Failed to save {filename} to {PROCESSED_DIR}: {e}")
+
+def raw_json(item):
+    """
+    Compact JSON copy of the raw payload for the RawJson column.
+    """
+    return json.dumps(item, separators=(',', ':'))
+
+def content_hash(record):
+    """
+    sha256 of the record's canonical JSON; load compares it with the stored
+    ContentHash column to decide whether a row actually changed.
+    """
+    canonical = json.dumps(record, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+def transform_warframe(item):
+    """
+    Shapes one raw warframe, or returns None if the item should be skipped.
+    """
+    if item.get('category') != 'Warframes' and item.get('type') != 'Warframe':
+        return None
+    
+    # Skip if it's a skin or helmet (usually indicated by type or lack of stats)
+    if 'health' not in item:
+        return None
+
+    return {
+        "UniqueName": item.get('uniqueName'),
+        "Name": item.get('name'),
+        "Armor": item.get('armor'),
+        "Health": item.get('health'),
+        "Shields": item.get('shield'),
+        "Energy": item.get('power'),
+        "SprintSpeed": item.get('sprint'),
+        "RawJson": raw_json(item)
+    }
+
+def transform_weapon(item):
+    """
+    Shapes one raw weapon, or returns None if the item should be skipped.
+    """
+    # Basic filter for weapons
+    if item.get('category') not in ['Primary', 'Secondary', 'Melee']:
+        return None
+
+    # Extract damage stats
+    # API structure varies. Sometimes 'damagePerShot' is a list of numbers (old) or dict (new).
+    # Often 'totalDamage' is available.
+    # We'll try to get specific damage types if available in 'damageTypes' or keys in 'damagePerShot'
+    
+    impact = 0.0
+    puncture = 0.0
+    slash = 0.0
+    
+    # Attempt to parse damage
+    # This is a simplification; real parsing might need to handle 'damagePerShot' array vs dict
+    # For now, we'll look for common keys if they exist at top level or inside damage object
+    # Many items have 'damage' dict directly
+    
+    damage_dict = item.get('damage', {})
+    if not isinstance(damage_dict, dict):
+         # Sometimes it's 'damagePerShot'
+         damage_dict = item.get('damagePerShot', {})
+         # If it's a list, it's usually [impact, puncture, slash, ...] but order varies. 
+         # Safest is to look for named keys if possible.
+    
+    if isinstance(damage_dict, dict):
+        impact = float(damage_dict.get('impact', 0.0))
+        puncture = float(damage_dict.get('puncture', 0.0))
+        slash = float(damage_dict.get('slash', 0.0))
+
+    return {
+        "UniqueName": item.get('uniqueName'),
+        "Name": item.get('name'),
+        "Type": item.get('category'), # Primary, Secondary, Melee
+        "MasteryRank": item.get('masteryReq'),
+        "Impact": impact,
+        "Puncture": puncture,
+        "Slash": slash,
+        "CritChance": item.get('critChance'),
+        "CritMultiplier": item.get('critMult'),
+        "StatusChance": item.get('procChance'),
+        "FireRate": item.get('fireRate'),
+        "MagazineSize": item.get('magazineSize'),
+        "ReloadTime": item.get('reloadTime'),
+        "Multishot": item.get('multishot'),
+        "RawJson": raw_json(item)
+    }
+
+def transform_mod(item):
+    """
+    Shapes one raw mod, or returns None if the item should be skipped.
+    """
+    if item.get('category') != 'Mods':
+        return None
+        
+    return {
+        "UniqueName": item.get('uniqueName'),
+        "Name": item.get('name'),
+        "ModType": item.get('type'), # e.g. 'Warframe Mod', 'Rifle Mod'
+        "Polarity": item.get('polarity'),
+        "MaxRank": item.get('fusionLimit'),
+        "RankStats": stats.rank_stats(item.get('levelStats')),
+        "RawJson": raw_json(item)
+    }
+
+def transform_arcane(item):
+    """
+    Shapes one raw arcane, or returns None if the item should be skipped.
+    """
+    # Arcanes usually have category 'Arcanes'
+    if item.get('category') != 'Arcanes':
+        return None
+
+    # Max rank is usually length of levelStats - 1, or explicitly 'rank' (but rank is usually current rank)
+    # 'levelStats' is array of stats per rank.
+    max_rank = 0
+    if 'levelStats' in item:
+        max_rank = len(item['levelStats']) - 1
+    
+    return {
+        "UniqueName": item.get('uniqueName'),
+        "Name": item.get('name'),
+        "ItemType": item.get('type'), # e.g. 'Arcane'
+        "MaxRank": max_rank,
+        "RankStats": stats.rank_stats(item.get('levelStats')),
+        "RawJson": raw_json(item)
+    }
+
+# Entity name -> per-record transform
+TRANSFORMS = {
+    "warframes": transform_warframe,
+    "weapons": transform_weapon,
+    "mods": transform_mod,
+    "arcanes": transform_arcane,
+}
+
+# Entity name -> derived columns, computed over a batch of shaped records at once
+DERIVED = {
+    "weapons": stats.add_weapon_stats,
+}
+
+def batched(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def iter_transform(entity, raw_items, chunk_size=CHUNK_SIZE):
+    """
+    Lazily transforms a stream of raw items for one entity, dropping skipped ones.
+    Records are shaped one at a time but derived and hashed chunk_size at a
+    time, so vectorised DERIVED steps still see whole batches when streaming.
+    """
+    transform_item = TRANSFORMS[entity]
+    derive = DERIVED.get(entity)
+    records = (record for record in map(transform_item, raw_items) if record is not None)
+    for batch in batched(records, chunk_size):
+        if derive is not None:
+            derive(batch)
+        for record in batch:
+            record["ContentHash"] = content_hash(record)
+            yield record
 
 def transform_warframes(raw_data):
     logging.info("Transforming Warframes...")
-    processed = []
-    for item in raw_data:
-        if item.get('category') != 'Warframes' and item.get('type') != 'Warframe':
-            continue
-        
-        # Skip if it's a skin or helmet (usually indicated by type or lack of stats)
-        if 'health' not in item:
-            continue
-
-        processed.append({
-            "UniqueName": item.get('uniqueName'),
-            "Name": item.get('name'),
-            "Armor": item.get('armor'),
-            "Health": item.get('health'),
-            "Shields": item.get('shield'),
-            "Energy": item.get('power'),
-            "SprintSpeed": item.get('sprint'),
-            "RawJson": json.dumps(item)
-        })
-    return processed
+    return list(iter_transform("warframes", raw_data))
 
 def transform_weapons(raw_data):
     logging.info("Transforming Weapons...")
-    processed = []
-    for item in raw_data:
-        # Basic filter for weapons
-        if item.get('category') not in ['Primary', 'Secondary', 'Melee']:
-            continue
-
-        # Extract damage stats
-        # API structure varies. Sometimes 'damagePerShot' is a list of numbers (old) or dict (new).
-        # Often 'totalDamage' is available.
-        # We'll try to get specific damage types if available in 'damageTypes' or keys in 'damagePerShot'
-        
-        impact = 0.0
-        puncture = 0.0
-        slash = 0.0
-        
-        # Attempt to parse damage
-        # This is a simplification; real parsing might need to handle 'damagePerShot' array vs dict
-        # For now, we'll look for common keys if they exist at top level or inside damage object
-        # Many items have 'damage' dict directly
-        
-        damage_dict = item.get('damage', {})
-        if not isinstance(damage_dict, dict):
-             # Sometimes it's 'damagePerShot'
-             damage_dict = item.get('damagePerShot', {})
-             # If it's a list, it's usually [impact, puncture, slash, ...] but order varies. 
-             # Safest is to look for named keys if possible.
-        
-        if isinstance(damage_dict, dict):
-            impact = float(damage_dict.get('impact', 0.0))
-            puncture = float(damage_dict.get('puncture', 0.0))
-            slash = float(damage_dict.get('slash', 0.0))
-
-        processed.append({
-            "UniqueName": item.get('uniqueName'),
-            "Name": item.get('name'),
-            "Type": item.get('category'), # Primary, Secondary, Melee
-            "MasteryRank": item.get('masteryReq'),
-            "Impact": impact,
-            "Puncture": puncture,
-            "Slash": slash,
-            "CritChance": item.get('critChance'),
-            "CritMultiplier": item.get('critMult'),
-            "StatusChance": item.get('procChance'),
-            "FireRate": item.get('fireRate'),
-            "MagazineSize": item.get('magazineSize'),
-            "ReloadTime": item.get('reloadTime'),
-            "Multishot": item.get('multishot'),
-            "RawJson": json.dumps(item)
-        })
-    return processed
+    return list(iter_transform("weapons", raw_data))
 
 def transform_mods(raw_data):
     logging.info("Transforming Mods...")
-    processed = []
-    for item in raw_data:
-        if item.get('category') != 'Mods':
-            continue
-            
-        processed.append({
-            "UniqueName": item.get('uniqueName'),
-            "Name": item.get('name'),
-            "ModType": item.get('type'), # e.g. 'Warframe Mod', 'Rifle Mod'
-            "Polarity": item.get('polarity'),
-            "MaxRank": item.get('fusionLimit'),
-            "RawJson": json.dumps(item)
-        })
-    return processed
+    return list(iter_transform("mods", raw_data))
 
 def transform_arcanes(raw_data):
     logging.info("Transforming Arcanes...")
-    processed = []
-    for item in raw_data:
-        # Arcanes usually have category 'Arcanes'
-        if item.get('category') != 'Arcanes':
-            continue
-
-        # Max rank is usually length of levelStats - 1, or explicitly 'rank' (but rank is usually current rank)
-        # 'levelStats' is array of stats per rank.
-        max_rank = 0
-        if 'levelStats' in item:
-            max_rank = len(item['levelStats']) - 1
-        
-        processed.append({
-            "UniqueName": item.get('uniqueName'),
-            "Name": item.get('name'),
-            "ItemType": item.get('type'), # e.g. 'Arcane'
-            "MaxRank": max_rank,
-            "RawJson": json.dumps(item)
-        })
-    return processed
-
-def run_transformation():
+    return list(iter_transform("arcanes", raw_data))
+
+def transform_chunk(entity, raw_items):
+    """
+    Worker entry point for the process pool: transforms one shard of raw items.
+    """
+    return list(iter_transform(entity, raw_items))
+
+def parallel_transform(raw_by_entity, executor, chunk_size=CHUNK_SIZE):
+    """
+    Shards every entity's raw list into chunks and transforms them in the pool.
+    All chunks are submitted up front so entities overlap; results are
+    reassembled in submission order, so output matches the serial path.
+    """
+    futures = {
+        entity: [
+            executor.submit(transform_chunk, entity, raw_items[i:i + chunk_size])
+            for i in range(0, len(raw_items), chunk_size)
+        ]
+        for entity, raw_items in raw_by_entity.items()
+    }
+    return {
+        entity: [record for future in chunk_futures for record in future.result()]
+        for entity, chunk_futures in futures.items()
+    }
+
+# Entity name -> whole-list transform used by the serial path
+TRANSFORM_LISTS = {
+    "warframes": transform_warframes,
+    "weapons": transform_weapons,
+    "mods": transform_mods,
+    "arcanes": transform_arcanes,
+}
+
+def run_transformation(workers=1, chunk_size=CHUNK_SIZE):
+    """
+    Transforms every raw snapshot into ETL/Processed.
+    workers > 1 spreads the work over a process pool of that size.
+    Returns a dict of entity -> records in / out and bytes read / written
+    for the run report, plus wall and CPU time on the serial path (in
+    parallel the entities overlap, so only the stage as a whole is timed).
+    """
     logging.info("Starting transformation process...")
-    
-    # 1. Warframes
-    raw_warframes = load_json("warframes.json")
-    proc_warframes = transform_warframes(raw_warframes)
-    save_json(proc_warframes, "warframes.json")
-    
-    # 2. Weapons
-    raw_weapons = load_json("weapons.json")
-    proc_weapons = transform_weapons(raw_weapons)
-    save_json(proc_weapons, "weapons.json")
-    
-    # 3. Mods
-    raw_mods = load_json("mods.json")
-    proc_mods = transform_mods(raw_mods)
-    save_json(proc_mods, "mods.json")
-    
-    # 4. Arcanes
-    raw_arcanes = load_json("arcanes.json")
-    proc_arcanes = transform_arcanes(raw_arcanes)
-    save_json(proc_arcanes, "arcanes.json")
-    
+    results = {}
+
+    if workers and workers > 1:
+        logging.info(f"Transforming in parallel ({workers} workers, {chunk_size} records per chunk)...")
+        raw_by_entity = {entity: load_json(f"{entity}.json") for entity in TRANSFORMS}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            processed = parallel_transform(raw_by_entity, executor, chunk_size)
+        for entity, records in processed.items():
+            results[entity] = {
+                "records_in": len(raw_by_entity[entity]),
+                "records_out": len(records),
+                "bytes_read": report.file_size(storage.find(RAW_DIR, entity)),
+                "bytes_written": report.file_size(save_json(records, f"{entity}.json")),
+            }
+        logging.info("Transformation process completed.")
+        return results
+
+    for entity, transform_list in TRANSFORM_LISTS.items():
+        with report.measure(results.setdefault(entity, {})) as entry:
+            raw = load_json(f"{entity}.json")
+            processed = transform_list(raw)
+            entry.update(
+                records_in=len(raw),
+                records_out=len(processed),
+                bytes_read=report.file_size(storage.find(RAW_DIR, entity)),
+                bytes_written=report.file_size(save_json(processed, f"{entity}.json")),
+            )
+
     logging.info("Transformation process completed.")
+    return results
 
 if __name__ == "__main__":
-    run_transformation()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Transform raw Warframe data.")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (1 = serial).")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Raw records per worker task.")
+    args = parser.parse_args()
+    run_transformation(workers=args.workers, chunk_size=args.chunk_size)